@@ -0,0 +1,186 @@
+"""로컬 대체 서버를 대상으로 한 전체 크롤링 벤치마크
+
+fake_ruliweb.py 서버를 별도 프로세스에서 띄우고 CrawlerController를 끝까지 실행하여
+처리량(posts/sec), 게시글 한 건의 처리 시간 분포(p50/p99), 최대 메모리 사용량, DB 쓰기 속도를 측정합니다.
+네트워크 상태와 무관하게 같은 조건으로 반복 실행할 수 있으므로 변경 전후 비교에 사용합니다.
+
+    python benchmarks/bench_crawl.py --backend http --limit 500 --latency-ms 30 --output results/http.json
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+try:
+    import resource
+except ImportError: # Windows에는 resource 모듈이 없습니다.
+    resource = None
+
+# 프로젝트 루트를 Python 경로에 추가
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(PROJECT_ROOT)
+
+from benchmarks.fake_ruliweb import BOARD_PATH, add_server_arguments, config_from_args, start_server_process
+from src.controller import BACKENDS, CONCURRENT_TASKS, MAX_CONCURRENT_TASKS, CrawlerController
+from src.metrics import Metrics
+from src.view import ConsoleView
+
+
+class QuietView(ConsoleView):
+    """벤치마크 중에는 아무것도 출력하지 않는 View"""
+    def show_message(self, message: str):
+        pass
+
+    def display_post(self, post):
+        pass
+
+    def display_comments(self, comments):
+        pass
+
+
+class BenchController(CrawlerController):
+    """게시글 한 건의 처리 시간과 DB 쓰기 시간을 기록하는 CrawlerController"""
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.latencies = [] # 게시글 한 건의 처리 시간(초, 재시도 포함)
+        self.write_rows = 0 # 저장한 게시글 + 댓글 행 수
+        self.write_seconds = 0.0
+
+    async def _fetch_with_retry(self, scraper, url: str):
+        started = time.perf_counter()
+        try:
+            return await super()._fetch_with_retry(scraper, url)
+        finally:
+            self.latencies.append(time.perf_counter() - started)
+
+    async def _persist_batch(self, batch):
+        started = time.perf_counter()
+        await super()._persist_batch(batch)
+        self.write_seconds += time.perf_counter() - started
+        self.write_rows += sum(1 + len(comments) for _, comments in batch)
+
+
+def percentile(values, fraction: float) -> float:
+    """정렬된 값에서 최근접 순위 방식으로 백분위수를 구합니다."""
+    if not values:
+        return 0.0
+    index = min(len(values) - 1, max(0, round(fraction * len(values)) - 1))
+    return values[index]
+
+
+def peak_rss_mb() -> dict:
+    """이 프로세스와 종료된 자식 프로세스(브라우저 등)의 최대 메모리 사용량(MB)을 반환합니다."""
+    if resource is None:
+        return {"self": None, "children": None}
+    # Linux는 KB, macOS는 바이트 단위입니다.
+    unit = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return {
+        "self": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / unit, 1),
+        "children": round(resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss / unit, 1),
+    }
+
+
+def git_commit() -> str:
+    """측정한 코드의 커밋 해시를 반환합니다. 커밋되지 않은 변경이 있으면 -dirty를 붙입니다."""
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=PROJECT_ROOT,
+                                capture_output=True, text=True, check=True).stdout.strip()
+        dirty = subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"], cwd=PROJECT_ROOT,
+                               capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+    return f"{commit}-dirty" if dirty else commit
+
+
+def db_size(db_path: str) -> int:
+    return sum(os.path.getsize(path) for path in (db_path, db_path + "-wal") if os.path.exists(path))
+
+
+def run_benchmark(args, port: int, db_path: str) -> dict:
+    controller = BenchController(
+        limit=args.limit, headless=True, db_path=db_path, view=QuietView(), backend=args.backend,
+        concurrency=args.concurrency, max_concurrency=args.max_concurrency,
+        requests_per_second=args.requests_per_second, download_images=False,
+        board_url=f"http://127.0.0.1:{port}{BOARD_PATH}", metrics=Metrics(),
+    )
+    started = time.perf_counter()
+    asyncio.run(controller.run())
+    elapsed = time.perf_counter() - started
+
+    latencies = sorted(controller.latencies)
+    progress = controller.progress
+    return {
+        "posts": progress.saved,
+        "failed": progress.failed,
+        "elapsed_seconds": round(elapsed, 3),
+        "posts_per_second": round(progress.saved / elapsed, 2) if elapsed else 0.0,
+        "latency_seconds": {
+            "p50": round(percentile(latencies, 0.50), 4),
+            "p99": round(percentile(latencies, 0.99), 4),
+            "mean": round(sum(latencies) / len(latencies), 4) if latencies else 0.0,
+            "max": round(latencies[-1], 4) if latencies else 0.0,
+        },
+        "peak_rss_mb": peak_rss_mb(),
+        "db_write": {
+            "rows": controller.write_rows,
+            "seconds": round(controller.write_seconds, 3),
+            "rows_per_second": round(controller.write_rows / controller.write_seconds) if controller.write_seconds else 0,
+        },
+        "db_size_bytes": db_size(db_path),
+        "stages": controller.metrics.snapshot(), # 단계별 처리 시간과 카운터
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="로컬 대체 서버를 대상으로 한 전체 크롤링 벤치마크")
+    parser.add_argument("--backend", choices=BACKENDS, default="http")
+    parser.add_argument("--limit", type=int, default=200, help="수집할 게시글 수")
+    parser.add_argument("--concurrency", type=int, default=CONCURRENT_TASKS)
+    parser.add_argument("--max-concurrency", type=int, default=MAX_CONCURRENT_TASKS)
+    parser.add_argument("--requests-per-second", type=float, default=1000.0,
+                        help="호스트당 초당 최대 요청 수 (로컬 서버이므로 기본값은 사실상 제한 없음)")
+    parser.add_argument("--output", help="결과를 저장할 JSON 파일 경로")
+    add_server_arguments(parser)
+    args = parser.parse_args()
+    args.pages = max(args.pages, -(-args.limit // args.posts_per_page)) # limit만큼 게시글이 있도록 페이지 수를 맞춥니다.
+
+    server_config = config_from_args(args)
+    server, port = start_server_process(server_config)
+    try:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            metrics = run_benchmark(args, port, os.path.join(tmp_dir, "bench.db"))
+    finally:
+        server.terminate()
+        server.join()
+
+    result = {
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "git_commit": git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "config": {
+            "backend": args.backend,
+            "limit": args.limit,
+            "concurrency": args.concurrency,
+            "max_concurrency": args.max_concurrency,
+            "requests_per_second": args.requests_per_second,
+            "server": vars(server_config),
+        },
+        "metrics": metrics,
+    }
+    text = json.dumps(result, ensure_ascii=False, indent=2)
+    print(text)
+    if args.output:
+        os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+import argparse
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+
+# 프로젝트 루트를 Python 경로에 추가
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(PROJECT_ROOT)
+
+from src.database import DatabaseManager
+from src.models import Post, Comment
+
+
+def make_batch(num_posts: int, num_comments: int):
+    """벤치마크용 게시글/댓글 데이터를 생성합니다."""
+    batch = []
+    for i in range(num_posts):
+        post = Post(title=f"제목 {i}", url=f"https://m.ruliweb.com/best/board/300143/read/{i}",
+                    content="본문 " * 50, content_html="<p>본문</p>" * 50,
+                    image_urls=[f"https://i1.ruliweb.com/img/{i}.png"], post_created="2025-07-23 14:30:21")
+        comments = [Comment(html=f"<p class=\"text\">댓글 {j}</p>", text=f"댓글 {j}", comment_created="25.07.23 14:31")
+                    for j in range(num_comments)]
+        batch.append((post, comments))
+    return batch
+
+
+def legacy_insert(db_path: str, batch):
+    """기존 방식: 문장마다 연결을 열고 커밋한 뒤 닫습니다."""
+    def execute(query, params):
+        with sqlite3.connect(db_path) as conn:
+            cursor = conn.cursor()
+            cursor.execute(query, params)
+            conn.commit()
+            return cursor.lastrowid
+
+    for post, comments in batch:
+        post_id = execute("INSERT INTO posts (title, url, content, content_html, image_urls, post_created) VALUES (?, ?, ?, ?, ?, ?)",
+                          (post.title, post.url, post.content, post.content_html, "[]", post.post_created))
+        for comment in comments:
+            execute("INSERT INTO comments (post_id, html, text, comment_created) VALUES (?, ?, ?, ?)",
+                    (post_id, comment.html, comment.text, comment.comment_created))
+
+
+def batched_insert(db_manager: DatabaseManager, batch, batch_size: int):
+    """새 방식: 영속 연결에서 batch_size개 게시글씩 한 트랜잭션으로 삽입합니다."""
+    for start in range(0, len(batch), batch_size):
+        db_manager.insert_posts_with_comments(batch[start:start + batch_size])
+
+
+def measure(label: str, func, rows: int) -> float:
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    print(f"{label}: {elapsed:.2f}s, {rows / elapsed:,.0f} rows/sec")
+    return rows / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="DatabaseManager 쓰기 성능 벤치마크")
+    parser.add_argument("--posts", type=int, default=1000)
+    parser.add_argument("--comments", type=int, default=100)
+    parser.add_argument("--batch-size", type=int, default=20)
+    parser.add_argument("--legacy-posts", type=int, default=100,
+                        help="기존 방식은 매우 느리므로 더 적은 게시글로 측정합니다 (rows/sec로 비교)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        legacy_db = DatabaseManager(os.path.join(tmp_dir, "legacy.db"))
+        legacy_db.create_tables()
+        legacy_db.close()
+        legacy_batch = make_batch(args.legacy_posts, args.comments)
+        legacy_rows = args.legacy_posts * (args.comments + 1)
+        legacy_rate = measure("legacy (connect per row)", lambda: legacy_insert(legacy_db.db_path, legacy_batch), legacy_rows)
+
+        batched_db = DatabaseManager(os.path.join(tmp_dir, "batched.db"))
+        batched_db.create_tables()
+        batch = make_batch(args.posts, args.comments)
+        rows = args.posts * (args.comments + 1)
+        batched_rate = measure("batched (WAL + executemany)", lambda: batched_insert(batched_db, batch, args.batch_size), rows)
+        batched_db.close()
+
+    print(f"speedup: {batched_rate / legacy_rate:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
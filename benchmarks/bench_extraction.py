@@ -0,0 +1,82 @@
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+
+from playwright.async_api import async_playwright
+
+# 프로젝트 루트를 Python 경로에 추가
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(PROJECT_ROOT)
+
+from src.scraper import EXTRACT_POST_SCRIPT, RuliwebScraper
+
+
+async def extract_per_element(page):
+    """기존 방식: 요소마다 Playwright 호출(IPC 왕복)을 반복하여 추출합니다."""
+    title = await page.locator(".subject_inner_text").inner_text()
+    content_element = page.locator(".view_content")
+    await content_element.inner_text()
+    await content_element.inner_html()
+    post_created_element = await page.query_selector(".regdate")
+    if post_created_element:
+        await post_created_element.inner_text()
+
+    comments = []
+    for comment in await page.query_selector_all(".comment_view.normal .comment_element.normal"):
+        html = await comment.inner_html()
+        text_element = await comment.query_selector("p.text")
+        text = await text_element.inner_text() if text_element else ""
+        date_element = await comment.query_selector(".comment_info .date")
+        created = await date_element.inner_text() if date_element else None
+        comments.append((html, text, created))
+
+    image_urls = [await img.get_attribute("src") for img in await page.query_selector_all(".view_content img")]
+    return title, comments, image_urls
+
+
+async def extract_single_evaluate(page):
+    """새 방식: page.evaluate 한 번으로 모든 값을 JSON으로 받아옵니다."""
+    data = await page.evaluate(EXTRACT_POST_SCRIPT)
+    return RuliwebScraper.build_post("https://m.ruliweb.com/sample", data)
+
+
+async def measure(label, page, func, iterations):
+    timings = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        await func(page)
+        timings.append((time.perf_counter() - start) * 1000)
+    print(f"{label}: mean {statistics.mean(timings):.1f}ms, median {statistics.median(timings):.1f}ms")
+    return statistics.mean(timings)
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="게시글 상세 추출 방식 비교 벤치마크")
+    parser.add_argument("html_path", help="fetch_sample_html.py로 저장한 게시글 HTML 파일")
+    parser.add_argument("--iterations", type=int, default=20)
+    args = parser.parse_args()
+
+    with open(args.html_path, encoding="utf-8") as f:
+        html = f.read()
+
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=True)
+        page = await browser.new_page()
+        # 저장된 HTML만 사용하고 외부 요청은 모두 차단합니다.
+        await page.route("**/*", lambda route: route.abort())
+        await page.set_content(html, wait_until="domcontentloaded")
+
+        post, comments = await extract_single_evaluate(page)
+        print(f"댓글 {len(comments)}개, 이미지 {len(post.image_urls)}개")
+
+        legacy = await measure("per-element", page, extract_per_element, args.iterations)
+        single = await measure("single evaluate", page, extract_single_evaluate, args.iterations)
+        print(f"speedup: {legacy / single:.1f}x")
+        await browser.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
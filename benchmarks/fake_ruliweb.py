@@ -0,0 +1,254 @@
+"""벤치마크용 로컬 루리웹 대체 서버
+
+실제 사이트 대신 게시판 목록과 게시글 페이지를 제공합니다. 크롤러가 사용하는 선택자
+(tr.table_body.blocktarget, .subject_inner_text, .view_content, .comment_element.normal 등)를 그대로 따르며,
+댓글이 많은 게시글과 스크롤할 때 댓글이 추가로 로드되는 게시글, 응답 지연과 오류 응답을 흉내 낼 수 있습니다.
+
+    python benchmarks/fake_ruliweb.py --port 8080 --latency-ms 50 --error-rate 0.02
+    # 크롤러: CrawlerController(..., board_url="http://127.0.0.1:8080/best/humor_only")
+
+--recorded 디렉토리를 지정하면 게시글 페이지는 fetch_sample_html.py로 저장한 실제 HTML 파일을 돌아가며 제공합니다.
+"""
+import argparse
+import glob
+import html
+import json
+import multiprocessing
+import random
+import time
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+BOARD_PATH = "/best/humor_only"
+POST_PATH = "/best/board/300143/read/"
+FIRST_POST_ID = 70000000
+
+
+@dataclass
+class ServerConfig:
+    """대체 서버의 게시판 구성과 지연/오류 설정"""
+    pages: int = 10 # 게시글이 있는 게시판 페이지 수 (그 다음 페이지는 비어 있음)
+    posts_per_page: int = 28 # 게시판 페이지당 게시글 수
+    comments: int = 20 # 일반 게시글의 댓글 수
+    large_every: int = 10 # N번째 게시글마다 댓글이 많은 게시글 (0이면 없음)
+    large_comments: int = 500 # 댓글이 많은 게시글의 댓글 수
+    lazy_every: int = 5 # N번째 게시글마다 스크롤하면 댓글이 추가로 로드되는 게시글 (0이면 없음)
+    lazy_comments: int = 100 # 스크롤하면 댓글이 추가로 로드되는 게시글의 최소 댓글 수 (lazy_chunk보다 커야 추가 로드가 일어납니다)
+    lazy_chunk: int = 20 # 스크롤 한 번에 추가로 로드되는 댓글 수
+    lazy_delay_ms: int = 50 # 추가 댓글이 로드되기까지의 지연(밀리초)
+    latency_ms: float = 0.0 # 응답 지연의 평균(밀리초)
+    latency_jitter: float = 0.5 # 응답 지연에 더하거나 뺄 비율
+    error_rate: float = 0.0 # 게시글 요청이 오류로 응답할 확률
+    error_status: int = 503 # 오류 응답의 상태 코드
+    recorded_dir: Optional[str] = None # 녹화된 게시글 HTML 파일 디렉토리
+
+
+def _post_id(page: int, index: int, config: ServerConfig) -> int:
+    # 실제 게시판처럼 최신 글(큰 번호)이 앞 페이지에 옵니다.
+    return FIRST_POST_ID + config.pages * config.posts_per_page - ((page - 1) * config.posts_per_page + index)
+
+
+def render_board(page: int, config: ServerConfig) -> str:
+    """게시판 목록 페이지를 만듭니다. config.pages를 넘는 페이지에는 게시글이 없습니다."""
+    rows = []
+    if 1 <= page <= config.pages:
+        for index in range(config.posts_per_page):
+            post_id = _post_id(page, index, config)
+            rows.append(
+                f'<tr class="table_body blocktarget"><td class="subject">'
+                f'<a class="subject_link" href="{POST_PATH}{post_id}">게시글 {post_id}</a></td></tr>'
+            )
+    return f"<html><body><table class=\"board_list_table\">{''.join(rows)}</table></body></html>"
+
+
+def _comment_html(post_id: int, number: int) -> str:
+    minute = number % 60
+    return (
+        f'<div class="comment_info"><span class="nick">닉네임{number % 97}</span>'
+        f'<span class="date">25.07.23 {10 + number // 60 % 12:02d}:{minute:02d}</span></div>'
+        f'<p class="text">{post_id}번 글의 {number}번째 댓글입니다. ㅋㅋㅋ 진짜 웃기네요</p>'
+        f'<div class="btn_like">추천 {number % 13}</div>'
+    )
+
+
+def _comment_element(post_id: int, number: int) -> str:
+    return f'<div class="comment_element normal">{_comment_html(post_id, number)}</div>'
+
+
+def comment_plan(post_id: int, config: ServerConfig) -> Tuple[int, int]:
+    """게시글의 (처음부터 HTML에 포함된 댓글 수, 스크롤하면 추가로 로드되는 댓글 수)를 반환합니다."""
+    sequence = post_id - FIRST_POST_ID
+    total = config.comments
+    if config.large_every and sequence % config.large_every == 0:
+        total = config.large_comments
+    if config.lazy_every and sequence % config.lazy_every == 1:
+        total = max(total, config.lazy_comments)
+        inline = min(total, config.lazy_chunk)
+        return inline, total - inline
+    return total, 0
+
+
+# 스크롤이 끝에 닿을 때마다 lazy_delay_ms 뒤에 댓글을 lazy_chunk개씩 추가합니다.
+_LAZY_SCRIPT = """
+<script>
+(function () {
+    const pending = JSON.parse(document.getElementById('more_comments').textContent);
+    const list = document.querySelector('.comment_view.normal');
+    let loading = false;
+    window.addEventListener('scroll', function () {
+        if (loading || !pending.length) return;
+        if (window.innerHeight + window.scrollY < document.body.scrollHeight - 10) return;
+        loading = true;
+        setTimeout(function () {
+            for (const html of pending.splice(0, %(chunk)d)) {
+                const element = document.createElement('div');
+                element.className = 'comment_element normal';
+                element.innerHTML = html;
+                list.appendChild(element);
+            }
+            loading = false;
+        }, %(delay)d);
+    });
+})();
+</script>
+"""
+
+
+def render_post(post_id: int, config: ServerConfig) -> str:
+    """게시글 페이지를 만듭니다."""
+    inline, lazy = comment_plan(post_id, config)
+    paragraphs = "".join(
+        f"<p>{post_id}번 게시글 본문 {i}번째 문단입니다. 루리웹 유머 게시판 벤치마크용 텍스트.</p>" for i in range(8)
+    )
+    images = "".join(f'<img src="//i1.ruliweb.com/img/{post_id}_{i}.jpg">' for i in range(2))
+    comments = "".join(_comment_element(post_id, n) for n in range(inline))
+    lazy_part = ""
+    if lazy:
+        more = [_comment_html(post_id, n) for n in range(inline, inline + lazy)]
+        # </script>가 데이터에 나타나지 않도록 '<'를 이스케이프합니다.
+        data = json.dumps(more).replace("<", "\\u003c")
+        lazy_part = (f'<script id="more_comments" type="application/json">{data}</script>'
+                     + _LAZY_SCRIPT % {"chunk": config.lazy_chunk, "delay": config.lazy_delay_ms})
+    return (
+        "<html><head><title>루리웹</title></head><body>"
+        f'<div class="subject"><span class="subject_inner_text">벤치마크 게시글 {post_id}</span></div>'
+        '<div class="user_info"><span class="regdate">25.07.23 (14:30:21)</span></div>'
+        f'<div class="view_content">{paragraphs}{images}</div>'
+        f'<div class="comment_header">댓글 <span class="comment_count">{inline + lazy}</span></div>'
+        f'<div class="comment_view normal">{comments}</div>'
+        f"{lazy_part}</body></html>"
+    )
+
+
+class _Handler(BaseHTTPRequestHandler):
+    config: ServerConfig = ServerConfig()
+    recorded: List[str] = []
+
+    def log_message(self, format, *args):
+        pass # 요청마다 로그를 출력하지 않습니다.
+
+    def _send(self, status: int, body: str):
+        data = body.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        config = self.config
+        if config.latency_ms:
+            jitter = random.uniform(-config.latency_jitter, config.latency_jitter)
+            time.sleep(max(0.0, config.latency_ms * (1 + jitter)) / 1000)
+
+        url = urlparse(self.path)
+        if url.path == BOARD_PATH:
+            page = int(parse_qs(url.query).get("page", ["1"])[0])
+            self._send(200, render_board(page, config))
+            return
+        if url.path.startswith(POST_PATH):
+            if config.error_rate and random.random() < config.error_rate:
+                self._send(config.error_status, f"<html><body>HTTP {config.error_status}</body></html>")
+                return
+            post_id = int(url.path[len(POST_PATH):])
+            if self.recorded:
+                with open(self.recorded[post_id % len(self.recorded)], encoding="utf-8") as f:
+                    self._send(200, f.read())
+                return
+            self._send(200, render_post(post_id, config))
+            return
+        self._send(404, f"<html><body>{html.escape(url.path)} 없음</body></html>")
+
+
+def create_server(config: ServerConfig, host: str = "127.0.0.1", port: int = 0) -> ThreadingHTTPServer:
+    """대체 서버를 만듭니다. port가 0이면 빈 포트를 사용합니다 (server.server_address로 확인)."""
+    handler = type("Handler", (_Handler,), {
+        "config": config,
+        "recorded": sorted(glob.glob(f"{config.recorded_dir}/*.html")) if config.recorded_dir else [],
+    })
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    return server
+
+
+def _serve(config: ServerConfig, ready):
+    server = create_server(config)
+    ready.put(server.server_address[1])
+    server.serve_forever()
+
+
+def start_server_process(config: ServerConfig) -> Tuple[multiprocessing.Process, int]:
+    """대체 서버를 별도 프로세스에서 시작하고 (프로세스, 포트)를 반환합니다.
+
+    서버가 측정 대상 프로세스의 CPU와 메모리를 쓰지 않도록 별도 프로세스에서 실행합니다.
+    """
+    ready = multiprocessing.Queue()
+    process = multiprocessing.Process(target=_serve, args=(config, ready), name="fake-ruliweb", daemon=True)
+    process.start()
+    return process, ready.get(timeout=10)
+
+
+def add_server_arguments(parser: argparse.ArgumentParser):
+    """ServerConfig의 필드를 명령줄 인자로 추가합니다."""
+    defaults = ServerConfig()
+    parser.add_argument("--pages", type=int, default=defaults.pages, help="게시글이 있는 게시판 페이지 수")
+    parser.add_argument("--posts-per-page", type=int, default=defaults.posts_per_page)
+    parser.add_argument("--comments", type=int, default=defaults.comments, help="일반 게시글의 댓글 수")
+    parser.add_argument("--large-every", type=int, default=defaults.large_every, help="N번째 게시글마다 댓글이 많은 게시글")
+    parser.add_argument("--large-comments", type=int, default=defaults.large_comments)
+    parser.add_argument("--lazy-every", type=int, default=defaults.lazy_every,
+                        help="N번째 게시글마다 스크롤하면 댓글이 추가로 로드되는 게시글")
+    parser.add_argument("--lazy-comments", type=int, default=defaults.lazy_comments,
+                        help="스크롤하면 댓글이 추가로 로드되는 게시글의 최소 댓글 수")
+    parser.add_argument("--lazy-chunk", type=int, default=defaults.lazy_chunk)
+    parser.add_argument("--lazy-delay-ms", type=int, default=defaults.lazy_delay_ms)
+    parser.add_argument("--latency-ms", type=float, default=defaults.latency_ms, help="응답 지연의 평균(밀리초)")
+    parser.add_argument("--latency-jitter", type=float, default=defaults.latency_jitter)
+    parser.add_argument("--error-rate", type=float, default=defaults.error_rate, help="게시글 요청이 오류로 응답할 확률")
+    parser.add_argument("--error-status", type=int, default=defaults.error_status)
+    parser.add_argument("--recorded", dest="recorded_dir", default=None, help="녹화된 게시글 HTML 파일 디렉토리")
+
+
+def config_from_args(args) -> ServerConfig:
+    return ServerConfig(**{name: getattr(args, name) for name in ServerConfig.__dataclass_fields__})
+
+
+def main():
+    parser = argparse.ArgumentParser(description="벤치마크용 로컬 루리웹 대체 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    add_server_arguments(parser)
+    args = parser.parse_args()
+    server = create_server(config_from_args(args), args.host, args.port)
+    host, port = server.server_address[:2]
+    print(f"http://{host}:{port}{BOARD_PATH} 에서 대기 중입니다. (Ctrl+C로 종료)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
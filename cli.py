@@ -0,0 +1,211 @@
+"""UI 없이 크롤러를 실행하는 명령줄 진입점 (서버용)
+
+Tkinter, tkcalendar, tkhtmlview를 임포트하지 않으므로 디스플레이가 없는 환경에서도 실행됩니다.
+
+    python cli.py --limit 100 --db /data/ruliweb_posts.db
+    python cli.py --daemon --interval 1800 --jitter 0.2   # 30분(±20%)마다 증분 크롤링
+    python cli.py --daemon --metrics-port 9108            # http://localhost:9108/metrics 에서 Prometheus 지표 제공
+    python cli.py --compact                               # 저장된 HTML을 최신 사전으로 다시 압축하고 파일 크기를 줄임
+"""
+import argparse
+import asyncio
+import os
+import random
+import signal
+import sys
+import threading
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from src.controller import (BACKENDS, BOARD_PREFETCH_PAGES, CONCURRENT_TASKS, MAX_CONCURRENT_TASKS, REQUESTS_PER_SECOND,
+                            CrawlerController)
+from src.database import DatabaseManager
+from src.metrics import Metrics
+from src.view import ConsoleView
+
+PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_DB_PATH = os.path.join(PROJECT_ROOT, 'ruliweb_posts.db')
+DEFAULT_INTERVAL = 1800.0 # 데몬 모드의 기본 실행 간격(초)
+DEFAULT_JITTER = 0.1 # 실행 간격에 더하거나 뺄 무작위 비율
+COMPACT_REPORT_ROWS = 10000 # 다시 압축할 때 이 행 수마다 진행 상황을 출력합니다.
+
+
+class LogView(ConsoleView):
+    """메시지 앞에 시각을 붙여 출력하는 View. verbose가 아니면 게시글/댓글 내용은 출력하지 않습니다."""
+    def __init__(self, verbose: bool = False):
+        self.verbose = verbose
+
+    def show_message(self, message: str):
+        print(f"[{datetime.now():%Y-%m-%d %H:%M:%S}] {message}", flush=True)
+
+    def display_post(self, post):
+        if self.verbose:
+            super().display_post(post)
+
+    def display_comments(self, comments):
+        if self.verbose:
+            super().display_comments(comments)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="루리웹 유머 게시판 크롤러 (UI 없이 실행)")
+    parser.add_argument("--limit", type=int, default=30, help="한 번의 실행에서 수집할 최대 게시글 수")
+    parser.add_argument("--db", default=DEFAULT_DB_PATH, help="SQLite 데이터베이스 파일 경로")
+    parser.add_argument("--headless", action=argparse.BooleanOptionalAction, default=True,
+                        help="브라우저를 헤드리스 모드로 실행 (기본값: 사용)")
+    parser.add_argument("--backend", choices=BACKENDS, default="playwright", help="스크래퍼 백엔드")
+    parser.add_argument("--concurrency", type=int, default=CONCURRENT_TASKS, help="처음에 동시에 처리할 게시글 수")
+    parser.add_argument("--max-concurrency", type=int, default=MAX_CONCURRENT_TASKS, help="최대 동시 처리 수")
+    parser.add_argument("--requests-per-second", type=float, default=REQUESTS_PER_SECOND, help="호스트당 초당 최대 요청 수")
+    parser.add_argument("--board-prefetch", type=int, default=BOARD_PREFETCH_PAGES,
+                        help="URL 수집 단계에서 미리 동시에 읽어 둘 최대 게시판 페이지 수")
+    parser.add_argument("--workers", type=int, default=0, help="지정하면 N개의 작업자 프로세스로 나누어 크롤링")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--incremental", action="store_true", help="기존 데이터를 유지하고 새 게시글만 수집")
+    mode.add_argument("--resume", action="store_true", help="중단된 크롤링 이어서 진행")
+    mode.add_argument("--refresh", action="store_true", help="최근 게시글의 바뀐 본문과 새 댓글만 반영")
+    mode.add_argument("--replay", action="store_true",
+                      help="네트워크 없이 페이지 캐시에 저장된 게시글을 다시 추출하여 저장")
+    parser.add_argument("--page-cache", action="store_true",
+                        help="게시글 페이지의 원본 HTML을 디스크 캐시에 저장하고, HTTP 백엔드는 캐시를 우선 사용")
+    parser.add_argument("--page-cache-path", help="페이지 캐시 파일 경로 (기본값: 데이터베이스 옆의 page_cache.db)")
+    parser.add_argument("--download-images", action="store_true", help="게시글 이미지를 이미지 저장소에 다운로드")
+    parser.add_argument("--daemon", action="store_true",
+                        help="종료 신호를 받을 때까지 --interval마다 증분 크롤링을 반복")
+    parser.add_argument("--interval", type=float, default=DEFAULT_INTERVAL, help="데몬 모드의 실행 간격(초)")
+    parser.add_argument("--jitter", type=float, default=DEFAULT_JITTER,
+                        help="실행 간격에 무작위로 더하거나 뺄 비율 (0.1이면 ±10%%)")
+    parser.add_argument("--verbose", action="store_true", help="게시글과 댓글 내용도 출력")
+    parser.add_argument("--metrics-file", help="실행이 끝날 때마다 단계별 지표를 JSON으로 저장할 파일 경로")
+    parser.add_argument("--metrics-port", type=int, help="지정하면 이 포트의 /metrics에서 Prometheus 형식 지표를 제공")
+    parser.add_argument("--compact", action="store_true",
+                        help="크롤링하지 않고 저장된 HTML을 새로 학습한 사전으로 다시 압축한 뒤 파일 크기를 줄이고 종료")
+    args = parser.parse_args(argv)
+    if args.workers > 0:
+        # 작업자 프로세스들은 게시판 페이지를 나누어 새로 수집하는 방식만 지원합니다.
+        unsupported = [option for option, enabled in (("--resume", args.resume), ("--refresh", args.refresh),
+                                                       ("--replay", args.replay), ("--metrics-file", args.metrics_file),
+                                                       ("--metrics-port", args.metrics_port)) if enabled]
+        if unsupported:
+            parser.error(f"--workers와 함께 사용할 수 없는 옵션입니다: {', '.join(unsupported)}")
+    if args.daemon and not (args.refresh or args.resume):
+        # 매 실행마다 테이블을 지우지 않도록 데몬 모드는 증분 크롤링으로 실행합니다.
+        args.incremental = True
+    return args
+
+
+def next_delay(interval: float, jitter: float) -> float:
+    """다음 실행까지 기다릴 시간(초)을 반환합니다. 여러 서버의 실행 시각이 겹치지 않도록 무작위로 흔듭니다."""
+    return max(0.0, interval * (1 + random.uniform(-jitter, jitter)))
+
+
+def start_metrics_server(metrics: Metrics, port: int) -> ThreadingHTTPServer:
+    """/metrics 요청에 Prometheus 텍스트 형식으로 응답하는 서버를 백그라운드 스레드에서 시작합니다."""
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split("?")[0] != "/metrics":
+                self.send_error(404)
+                return
+            body = metrics.to_prometheus().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(("", port), MetricsHandler)
+    threading.Thread(target=server.serve_forever, name="metrics-server", daemon=True).start()
+    return server
+
+
+def write_metrics(metrics: Metrics, path: str):
+    """지표를 JSON 파일로 저장합니다. 읽는 쪽이 반쯤 쓰인 파일을 보지 않도록 임시 파일을 거쳐 교체합니다."""
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(metrics.to_json())
+    os.replace(tmp_path, path)
+
+
+def run_crawl(args, controller: CrawlerController):
+    """설정에 따라 한 번 크롤링합니다."""
+    if args.workers > 0:
+        from src.sharded import run_sharded
+        run_sharded(args.workers, args.limit, args.db, headless=args.headless, backend=args.backend,
+                    incremental=controller.incremental, concurrency=args.concurrency,
+                    max_concurrency=args.max_concurrency, requests_per_second=args.requests_per_second,
+                    download_images=args.download_images, board_prefetch=args.board_prefetch,
+                    page_cache=args.page_cache, page_cache_path=args.page_cache_path)
+        return
+    asyncio.run(controller.run())
+
+
+def run_compact(db_path: str, view: LogView):
+    """저장된 HTML 컬럼을 다시 압축하고 진행 상황을 출력합니다."""
+    db_manager = DatabaseManager(db_path)
+    db_manager.create_tables(drop_existing=False)
+    view.show_message("압축 사전을 학습하고 저장된 HTML을 다시 압축합니다...")
+
+    def report(table, rows):
+        if rows % COMPACT_REPORT_ROWS == 0:
+            view.show_message(f"{table}: {rows}행 다시 압축")
+
+    db_manager.compact(progress=report)
+    db_manager.close()
+    view.show_message(f"압축을 마쳤습니다. 파일 크기: {os.path.getsize(db_path) / 1024 / 1024:.1f}MB")
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    view = LogView(args.verbose)
+    if args.compact:
+        run_compact(args.db, view)
+        return 0
+    metrics = Metrics() if args.metrics_file or args.metrics_port else None
+    controller = CrawlerController(
+        limit=args.limit, headless=args.headless, db_path=args.db, view=view, incremental=args.incremental,
+        backend=args.backend, concurrency=args.concurrency, max_concurrency=args.max_concurrency,
+        requests_per_second=args.requests_per_second, resume=args.resume, refresh=args.refresh,
+        download_images=args.download_images, metrics=metrics, board_prefetch=args.board_prefetch,
+        page_cache=args.page_cache, page_cache_path=args.page_cache_path, replay=args.replay,
+    )
+    if args.metrics_port:
+        start_metrics_server(metrics, args.metrics_port)
+        view.show_message(f"http://localhost:{args.metrics_port}/metrics 에서 지표를 제공합니다.")
+
+    stop_event = threading.Event()
+
+    def handle_signal(signum, frame):
+        view.show_message(f"종료 신호({signal.Signals(signum).name})를 받았습니다. 진행 중인 작업을 정리합니다...")
+        stop_event.set()
+        controller.request_stop()
+
+    signal.signal(signal.SIGINT, handle_signal)
+    signal.signal(signal.SIGTERM, handle_signal)
+
+    while True:
+        try:
+            run_crawl(args, controller)
+        except Exception as e:
+            if not args.daemon:
+                raise
+            # 데몬 모드에서는 한 번의 실패로 종료하지 않고 다음 실행을 기다립니다.
+            view.show_message(f"크롤링 중 오류 발생: {type(e).__name__}: {e}")
+        if args.metrics_file:
+            write_metrics(metrics, args.metrics_file)
+        if not args.daemon or stop_event.is_set():
+            break
+        delay = next_delay(args.interval, args.jitter)
+        view.show_message(f"{delay:.0f}초 후에 다시 크롤링합니다.")
+        if stop_event.wait(delay):
+            break
+        # 다음 실행부터는 데이터를 유지한 채 새 게시글만 수집합니다.
+        controller.resume = False
+        controller.incremental = not controller.refresh
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
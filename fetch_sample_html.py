@@ -16,4 +16,12 @@ if __name__ == "__main__":
     if sys.platform == "win32":
         sys.stdout.reconfigure(encoding='utf-8')
     sample_url = "https://m.ruliweb.com/best/board/300143/read/66700000" # 샘플 게시글 URL
-    print(asyncio.run(fetch_html(sample_url)))
+    # 사용법: python fetch_sample_html.py [게시글 URL] [저장할 파일 경로]
+    if len(sys.argv) > 1:
+        sample_url = sys.argv[1]
+    html = asyncio.run(fetch_html(sample_url))
+    if len(sys.argv) > 2:
+        with open(sys.argv[2], 'w', encoding='utf-8') as f:
+            f.write(html)
+    else:
+        print(html)
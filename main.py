@@ -1,23 +1,42 @@
+import argparse
 import os
 import sys
-import tkinter as tk
 
 # src 디렉토리를 Python 경로에 추가
 PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
 sys.path.append(os.path.join(PROJECT_ROOT, 'src'))
 
-from src.UI.ui_test import RuliCrawlerUI
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="루리웹 유머 게시판 크롤러")
+    parser.add_argument("--workers", type=int, default=0,
+                        help="지정하면 UI 없이 N개의 작업자 프로세스로 게시판 페이지를 나누어 크롤링합니다.")
+    parser.add_argument("--limit", type=int, default=30, help="수집할 최대 게시글 수 (--workers 사용 시)")
+    parser.add_argument("--backend", choices=("playwright", "http"), default="playwright", help="스크래퍼 백엔드 (--workers 사용 시)")
+    parser.add_argument("--incremental", action="store_true", help="기존 데이터를 유지하고 새 게시글만 수집 (--workers 사용 시)")
+    return parser.parse_args()
+
 
 if __name__ == "__main__":
-    # Tkinter UI 실행
-    root = tk.Tk()
+    args = parse_args()
 
-    # Controller 인스턴스 생성 (UI에 전달)
     # db_path는 프로젝트 루트 기준으로 설정
     db_relative_path = 'ruliweb_posts.db'
     DB_PATH = os.path.join(PROJECT_ROOT, db_relative_path)
-    
+
+    if args.workers > 0:
+        # 여러 프로세스로 나누어 크롤링 (브라우저는 헤드리스 모드로 실행)
+        from src.sharded import run_sharded
+        run_sharded(args.workers, args.limit, DB_PATH, headless=True, backend=args.backend, incremental=args.incremental)
+        sys.exit(0)
+
+    # Tkinter UI 실행
+    import tkinter as tk
+    from src.UI.ui_test import RuliCrawlerUI
+
+    root = tk.Tk()
+
     # UI에서 직접 Controller를 생성하도록 변경되었으므로, 여기서는 Controller를 직접 전달하지 않습니다.
     # RuliCrawlerUI 내부에서 Controller를 초기화합니다.
     app = RuliCrawlerUI(root, db_path=DB_PATH)
-    root.mainloop()
\ No newline at end of file
+    root.mainloop()
@@ -2,32 +2,39 @@ import tkinter as tk
 from tkinter import ttk
 import threading
 import asyncio
+import time
 import queue
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from tkcalendar import DateEntry # tkcalendar 임포트 추가
 from tkhtmlview import HTMLLabel # HTMLLabel 임포트 추가
 
 from src.controller import CrawlerController
-from src.models import Post, Comment # Post, Comment 임포트 추가
+from src.models import CrawlProgress, Post, Comment # Post, Comment 임포트 추가
+
+MAX_LOG_LINES = 2000 # 크롤링 로그 창에 남겨둘 최대 줄 수 (넘으면 오래된 줄부터 삭제)
+MAX_MESSAGES_PER_TICK = 5000 # process_queue가 한 번에 꺼낼 최대 메시지 수
+QUEUE_POLL_MS = 100 # 메시지 큐를 확인하는 간격(밀리초)
 
 # Tkinter UI에 메시지를 표시하기 위한 View 클래스
 class TkinterView:
     def __init__(self, message_queue):
         self.message_queue = message_queue
+        self.latest_progress = None # process_queue가 주기적으로 읽어 진행 막대에 반영합니다.
 
     def show_message(self, message):
         self.message_queue.put(message + "\n")
 
+    def update_progress(self, progress: CrawlProgress):
+        # 가장 최근 값만 있으면 되므로 큐에 쌓지 않고 덮어씁니다.
+        self.latest_progress = progress
+
     def display_post(self, post: Post):
-        message = f"\n--- 새 게시글 ---\n제목: {post.title}\nURL: {post.url}\n생성일: {post.post_created}\n내용: {post.content[:100]}...\n"
-        self.message_queue.put(message)
+        # 저장된 게시글은 진행 막대의 카운터로 보여주므로 게시글마다 로그를 남기지 않습니다.
+        pass
 
     def display_comments(self, comments: list[Comment]):
-        if comments:
-            message = "댓글:\n"
-            for comment in comments:
-                message += f"- {comment.text[:50]}... (생성일: {comment.comment_created})\n"
-            self.message_queue.put(message)
+        pass
 
 class RuliCrawlerUI:
     def __init__(self, master, db_path):
@@ -47,6 +54,21 @@ class RuliCrawlerUI:
         # 메시지 큐 생성
         self.message_queue = queue.Queue()
 
+        # 데이터 확인 탭의 조회 상태 (쿼리는 하나의 백그라운드 스레드에서 차례로 실행)
+        self.query_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ui-query")
+        # 끝난 조회의 (callback, future). Tk는 다른 스레드에서 호출할 수 없으므로 process_queue에서 callback을 호출합니다.
+        self.result_queue = queue.Queue()
+        self.query_generation = 0
+        self.query_args = None
+        self.current_posts = []
+        self.next_cursor = None
+        self.loading_page = False
+        self.selected_post_id = None
+
+        # 크롤링 진행 막대 상태
+        self.crawl_started_at = None
+        self.shown_progress = None
+
         # UI 요소 배치
         self.create_widgets()
 
@@ -57,20 +79,46 @@ class RuliCrawlerUI:
         self.controller = CrawlerController(limit=30, headless=False, db_path=db_path, view=self.tkinter_view)
 
         # 큐 폴링 시작
-        self.master.after(100, self.process_queue)
+        self.master.after(QUEUE_POLL_MS, self.process_queue)
 
     def create_widgets(self):
         # 크롤링 탭 UI 요소
         self.crawl_button = ttk.Button(self.crawl_tab, text="크롤링 시작", command=self.toggle_crawling)
         self.crawl_button.grid(row=0, column=0, padx=5, pady=5)
 
+        # 증분 크롤링 여부 (기존 데이터를 유지하고 새 게시글만 수집)
+        self.incremental_var = tk.BooleanVar(value=False)
+        self.incremental_check = ttk.Checkbutton(self.crawl_tab, text="새 게시글만 수집 (증분)", variable=self.incremental_var)
+        self.incremental_check.grid(row=0, column=1, padx=5, pady=5, sticky="w")
+
+        # 중단된 크롤링 이어서 진행 여부
+        self.resume_var = tk.BooleanVar(value=False)
+        self.resume_check = ttk.Checkbutton(self.crawl_tab, text="중단된 크롤링 이어서", variable=self.resume_var)
+        self.resume_check.grid(row=0, column=2, padx=5, pady=5, sticky="w")
+
+        # 최근 게시글 새로 고침 여부 (바뀐 본문과 새 댓글만 반영)
+        self.refresh_var = tk.BooleanVar(value=False)
+        self.refresh_check = ttk.Checkbutton(self.crawl_tab, text="최근 게시글 새로 고침", variable=self.refresh_var)
+        self.refresh_check.grid(row=0, column=3, padx=5, pady=5, sticky="w")
+
+        # 이미지 다운로드 여부 (게시글 조회 시 저장된 이미지 사용)
+        self.download_images_var = tk.BooleanVar(value=False)
+        self.download_images_check = ttk.Checkbutton(self.crawl_tab, text="이미지 저장", variable=self.download_images_var)
+        self.download_images_check.grid(row=0, column=4, padx=5, pady=5, sticky="w")
+
         self.results_text = tk.Text(self.crawl_tab, wrap=tk.WORD, width=80, height=20)
-        self.results_text.grid(row=1, column=0, columnspan=2, padx=5, pady=5, sticky="nsew")
+        self.results_text.grid(row=1, column=0, columnspan=5, padx=5, pady=5, sticky="nsew")
 
         self.scrollbar = ttk.Scrollbar(self.crawl_tab, command=self.results_text.yview)
-        self.scrollbar.grid(row=1, column=2, sticky="ns")
+        self.scrollbar.grid(row=1, column=5, sticky="ns")
         self.results_text.config(yscrollcommand=self.scrollbar.set)
 
+        # 진행 상황 (수집한 URL 대비 저장/실패한 게시글 수)
+        self.progress_bar = ttk.Progressbar(self.crawl_tab, orient=tk.HORIZONTAL, mode="determinate")
+        self.progress_bar.grid(row=2, column=0, columnspan=6, padx=5, pady=(0, 5), sticky="ew")
+        self.progress_label = ttk.Label(self.crawl_tab, text="대기 중")
+        self.progress_label.grid(row=3, column=0, columnspan=6, padx=5, pady=(0, 5), sticky="w")
+
         self.crawl_tab.grid_rowconfigure(1, weight=1)
         self.crawl_tab.grid_columnconfigure(0, weight=1)
 
@@ -105,7 +153,11 @@ class RuliCrawlerUI:
         # 제목 + 내용 검색 입력 필드
         ttk.Label(self.top_frame, text="제목 + 내용:").pack(side=tk.LEFT, padx=(0, 5))
         self.title_content_search_entry = ttk.Entry(self.top_frame, width=50)
-        self.title_content_search_entry.pack(side=tk.LEFT, padx=(0, 15))
+        self.title_content_search_entry.pack(side=tk.LEFT, padx=(0, 5))
+
+        # 댓글 내용까지 검색할지 여부
+        self.search_comments_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(self.top_frame, text="댓글 포함", variable=self.search_comments_var).pack(side=tk.LEFT, padx=(0, 15))
 
         # 조회 버튼
         self.query_button_data = ttk.Button(self.top_frame, text="조회", command=self.perform_query)
@@ -130,10 +182,10 @@ class RuliCrawlerUI:
         self.post_listbox.pack(fill=tk.BOTH, expand=True)
         self.post_listbox.bind('<<ListboxSelect>>', self.on_post_select)
 
-        # 게시글 목록 스크롤바
-        post_list_scrollbar = ttk.Scrollbar(self.post_list_frame, orient="vertical", command=self.post_listbox.yview)
-        post_list_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-        self.post_listbox.config(yscrollcommand=post_list_scrollbar.set)
+        # 게시글 목록 스크롤바 (끝까지 스크롤하면 다음 페이지를 불러옵니다)
+        self.post_list_scrollbar = ttk.Scrollbar(self.post_list_frame, orient="vertical", command=self.post_listbox.yview)
+        self.post_list_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.post_listbox.config(yscrollcommand=self._on_post_list_scroll)
 
         # 내용 영역과 댓글 영역을 포함하는 PanedWindow (중앙-오른쪽 영역)
         self.right_paned_window = ttk.PanedWindow(self.left_paned_window, orient=tk.HORIZONTAL)
@@ -168,18 +220,58 @@ class RuliCrawlerUI:
         self.comment_text_widget.config(yscrollcommand=comment_list_scrollbar.set)
 
     def process_queue(self):
+        """쌓인 메시지를 한 번에 꺼내 로그 창에 추가하고, 진행 막대를 최신 카운터로 갱신합니다.
+        끝난 백그라운드 조회의 callback도 여기서(Tk 스레드) 호출합니다.
+        """
         try:
-            message = self.message_queue.get_nowait()
-            self.results_text.insert(tk.END, message)
-            self.results_text.see(tk.END)
-        except queue.Empty:
-            pass
+            self._process_results()
+            messages = []
+            try:
+                while len(messages) < MAX_MESSAGES_PER_TICK:
+                    messages.append(self.message_queue.get_nowait())
+            except queue.Empty:
+                pass
+            if messages:
+                self._append_log("".join(messages))
+            self._update_progress()
         finally:
-            self.master.after(100, self.process_queue)
+            self.master.after(QUEUE_POLL_MS, self.process_queue)
+
+    def _process_results(self):
+        """끝난 백그라운드 조회의 callback을 차례로 호출합니다."""
+        while True:
+            try:
+                callback, future = self.result_queue.get_nowait()
+            except queue.Empty:
+                return
+            callback(future)
+
+    def _append_log(self, text):
+        """로그 창에 텍스트를 추가하고, MAX_LOG_LINES를 넘는 오래된 줄을 삭제합니다."""
+        self.results_text.insert(tk.END, text)
+        line_count = int(self.results_text.index("end-1c").split(".")[0])
+        if line_count > MAX_LOG_LINES:
+            self.results_text.delete("1.0", f"{line_count - MAX_LOG_LINES + 1}.0")
+        self.results_text.see(tk.END)
+
+    def _update_progress(self):
+        progress = self.tkinter_view.latest_progress
+        if progress is None or progress is self.shown_progress:
+            return
+        self.shown_progress = progress
+        done = progress.saved + progress.failed
+        self.progress_bar.config(maximum=max(progress.discovered, 1), value=done)
+        elapsed = time.monotonic() - self.crawl_started_at if self.crawl_started_at else 0
+        rate = progress.saved / elapsed * 60 if elapsed > 0 else 0
+        self.progress_label.config(
+            text=f"수집 {progress.discovered}/{progress.target} · 저장 {progress.saved} · 실패 {progress.failed} · {rate:.0f}개/분")
 
     def perform_query(self):
         """
         '조회' 버튼 클릭 시 호출되는 메서드입니다.
+
+        목록에는 ID/제목/작성일만 한 페이지씩 불러오며, 쿼리는 백그라운드 스레드에서 실행합니다.
+        목록을 끝까지 스크롤하면 다음 페이지를 불러옵니다.
         """
         start_date = self.start_date_entry_data.get_date()
         end_date = self.end_date_entry_data.get_date() + timedelta(days=1)
@@ -187,32 +279,93 @@ class RuliCrawlerUI:
         start_date_str = start_date.strftime("%Y-%m-%d")
         end_date_str = end_date.strftime("%Y-%m-%d")
 
-        self.current_posts = self.controller.search_posts(start_date_str, end_date_str, search_text)
-
+        # 이전 조회의 결과가 늦게 도착하더라도 무시되도록 조회 번호를 올립니다.
+        self.query_generation += 1
+        self.query_args = (start_date_str, end_date_str, search_text, self.search_comments_var.get())
+        self.current_posts = []
+        self.next_cursor = None
         self.post_listbox.delete(0, tk.END)
-        for i, post in enumerate(self.current_posts):
-            self.post_listbox.insert(tk.END, f"{i+1}. {post.title}")
-
-        self.post_list_frame.config(text=f"게시글 ({len(self.current_posts)})")
+        self.post_list_frame.config(text="게시글 (조회 중...)")
+        self._load_page(None)
+
+    def _run_in_background(self, func, callback, *args):
+        """func(*args)를 조회 스레드에서 실행하고, 끝나면 process_queue가 Tk 스레드에서 callback을 호출합니다."""
+        future = self.query_executor.submit(func, *args)
+        future.add_done_callback(lambda f: self.result_queue.put((callback, f)))
+
+    def _load_page(self, cursor):
+        self.loading_page = True
+        generation = self.query_generation
+        self._run_in_background(self.controller.search_post_summaries,
+                                lambda future: self._on_page_loaded(generation, future),
+                                *self.query_args, cursor)
+
+    def _on_page_loaded(self, generation, future):
+        if generation != self.query_generation:
+            return # 새 조회가 시작된 뒤에 도착한 이전 조회의 결과
+        self.loading_page = False
+        try:
+            summaries, self.next_cursor = future.result()
+        except Exception as e:
+            self.post_list_frame.config(text=f"게시글 (조회 오류: {e})")
+            return
+
+        start = len(self.current_posts)
+        self.current_posts.extend(summaries)
+        self.post_listbox.insert(tk.END, *(f"{start + i + 1}. {post.title}" for i, post in enumerate(summaries)))
+        more = "+" if self.next_cursor is not None else ""
+        self.post_list_frame.config(text=f"게시글 ({len(self.current_posts)}{more})")
+        # 첫 페이지가 목록을 다 채우지 못했으면 바로 다음 페이지를 불러옵니다.
+        self._load_more_if_needed()
+
+    def _on_post_list_scroll(self, first, last):
+        self.post_list_scrollbar.set(first, last)
+        self._load_more_if_needed()
+
+    def _load_more_if_needed(self):
+        """목록의 끝부분이 보이고 다음 페이지가 있으면 불러옵니다."""
+        if self.next_cursor is None or self.loading_page:
+            return
+        if self.post_listbox.yview()[1] >= 0.9:
+            self._load_page(self.next_cursor)
 
     def on_post_select(self, event):
         selected_indices = self.post_listbox.curselection()
-        if selected_indices:
-            index = selected_indices[0]
-            selected_post = self.current_posts[index]
-            self.content_text.set_html(selected_post.content_html)
-
-            self.comment_text_widget.delete(1.0, tk.END) # 기존 댓글 삭제
-            if selected_post.comments:
-                for i, comment in enumerate(selected_post.comments):
-                    self.comment_text_widget.insert(tk.END, f"--- 댓글 {i+1} ---\n", "comment_header")
-                    self.comment_text_widget.insert(tk.END, f"작성일: {comment.comment_created}\n", "comment_header")
-                    self.comment_text_widget.insert(tk.END, f"{comment.text}\n\n", "comment_body")
-                    if i < len(selected_post.comments) - 1:
-                        self.comment_text_widget.insert(tk.END, "----------------------------------------\n", "separator")
-            else:
-                self.comment_text_widget.insert(tk.END, "댓글이 없습니다.\n")
-            self.comment_frame.config(text=f"댓글 ({len(selected_post.comments)})")
+        if not selected_indices:
+            return
+        summary = self.current_posts[selected_indices[0]]
+        self.selected_post_id = summary.id
+
+        def load_post(post_id):
+            post = self.controller.get_post(post_id)
+            return post, self.controller.get_post_html(post) if post else ""
+
+        # 본문과 댓글은 선택한 게시글만 백그라운드에서 불러옵니다.
+        self._run_in_background(load_post, lambda future: self._on_post_loaded(summary.id, future), summary.id)
+
+    def _on_post_loaded(self, post_id, future):
+        if post_id != self.selected_post_id:
+            return # 다른 게시글을 선택한 뒤에 도착한 결과
+        try:
+            selected_post, html = future.result()
+        except Exception as e:
+            self.comment_frame.config(text=f"댓글 (불러오기 오류: {e})")
+            return
+        if selected_post is None:
+            return
+        self.content_text.set_html(html)
+
+        self.comment_text_widget.delete(1.0, tk.END) # 기존 댓글 삭제
+        if selected_post.comments:
+            for i, comment in enumerate(selected_post.comments):
+                self.comment_text_widget.insert(tk.END, f"--- 댓글 {i+1} ---\n", "comment_header")
+                self.comment_text_widget.insert(tk.END, f"작성일: {comment.comment_created}\n", "comment_header")
+                self.comment_text_widget.insert(tk.END, f"{comment.text}\n\n", "comment_body")
+                if i < len(selected_post.comments) - 1:
+                    self.comment_text_widget.insert(tk.END, "----------------------------------------\n", "separator")
+        else:
+            self.comment_text_widget.insert(tk.END, "댓글이 없습니다.\n")
+        self.comment_frame.config(text=f"댓글 ({len(selected_post.comments)})")
 
     def toggle_crawling(self):
         if not self.is_crawling:
@@ -225,6 +378,12 @@ class RuliCrawlerUI:
         self.results_text.delete(1.0, tk.END)
         self.message_queue.put("크롤링을 시작합니다...\n")
         self.crawl_button.config(text="크롤링 중지")
+        self.controller.incremental = self.incremental_var.get()
+        self.controller.resume = self.resume_var.get()
+        self.controller.refresh = self.refresh_var.get()
+        self.controller.download_images = self.download_images_var.get()
+        self.crawl_started_at = time.monotonic()
+        self.shown_progress = None
 
         self.crawl_thread = threading.Thread(target=self._perform_crawl, daemon=True)
         self.crawl_thread.start()
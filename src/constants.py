@@ -0,0 +1,7 @@
+# 추가 패키지 없이 여러 모듈에서 함께 쓰는 상수
+
+# 모바일 페이지를 받기 위한 User-Agent
+MOBILE_USER_AGENT = (
+    "Mozilla/5.0 (iPhone; CPU iPhone OS 17_0 like Mac OS X) "
+    "AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.0 Mobile/15E148 Safari/604.1"
+)
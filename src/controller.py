@@ -1,21 +1,144 @@
 from typing import Optional, Any
 import threading
 import asyncio
+import math
+import os
+import random
+import time
+from collections import deque
+from dataclasses import replace
+from datetime import datetime, timedelta
+from urllib.parse import urlparse
 
-from .database import DatabaseManager
-from .scraper import RuliwebScraper
+from .database import DatabaseManager, FRONTIER_FAILED, FRONTIER_IN_FLIGHT
+from .date_utils import DATETIME_FORMAT
+from .image_store import DEFAULT_MAX_BYTES, ImageDownloader, ImageStore
+from .metrics import NULL_METRICS, Metrics
+from .page_cache import DEFAULT_MAX_BYTES as DEFAULT_PAGE_CACHE_BYTES, DEFAULT_TTL, PageCache, PageCacheMissError
+from .models import CrawlProgress
+from .scraper import RuliwebScraper, ScraperHTTPError
+from .throttle import AdaptiveLimiter, HostRateLimiter
 from .view import ConsoleView
 
-CONCURRENT_TASKS = 5 # 동시에 처리할 게시글 수
+CONCURRENT_TASKS = 5 # 처음에 동시에 처리할 게시글 수
+MAX_CONCURRENT_TASKS = 10 # 응답이 빠를 때 늘릴 수 있는 최대 동시 처리 수
+REQUESTS_PER_SECOND = 5.0 # 호스트당 초당 최대 요청 수
+LATENCY_TARGET = 10.0 # 정상으로 간주하는 게시글 한 건의 처리 시간(초)
+MAX_RETRIES = 2 # 게시글 한 건당 재시도 횟수
+RETRY_BACKOFF = 1.0 # 재시도 대기 시간의 기준값(초). 시도마다 두 배로 늘어나며 무작위 지터가 적용됩니다.
+POST_TIMEOUT = 45.0 # 게시글 한 건을 한 번 시도할 때의 제한 시간(초)
+FAILED_RETRY_LIMIT = 5 # 이 횟수 이상 실패한 게시글은 다음 실행에서 다시 시도하지 않습니다.
+URL_QUEUE_SIZE = MAX_CONCURRENT_TASKS * 4 # 수집된 URL을 담아둘 큐의 최대 크기
+RESULT_QUEUE_SIZE = MAX_CONCURRENT_TASKS * 2 # 저장 대기 중인 스크랩 결과의 최대 개수
+WRITE_BATCH_SIZE = 20 # 한 트랜잭션으로 저장할 최대 게시글 수
+BACKENDS = ("playwright", "http") # 지원하는 스크래퍼 백엔드
+BOARD_URL = "https://m.ruliweb.com/best/humor_only" # 게시글 URL을 수집할 게시판 (페이지 번호는 ?page=N으로 붙습니다)
+BOARD_PREFETCH_PAGES = 3 # URL 수집 단계에서 미리 동시에 읽어 둘 최대 게시판 페이지 수
+REFRESH_DAYS = 2 # 새로 고침 모드에서 다시 방문할 게시글의 작성 기간(일)
+IMAGE_FETCH_TASKS = 4 # 동시에 다운로드할 이미지 수
+IMAGE_QUEUE_SIZE = 200 # 다운로드 대기 중인 이미지 URL의 최대 개수
 
 class CrawlerController:
     """크롤러의 동작을 제어하는 클래스 (Controller 역할)"""
-    def __init__(self, limit: int, headless: bool, db_path: str, view: Any = None):
-        """초기화 메서드"""
+    def __init__(self, limit: int, headless: bool, db_path: str, view: Any = None, incremental: bool = False,
+                 backend: str = "playwright", concurrency: int = CONCURRENT_TASKS,
+                 min_concurrency: int = 1, max_concurrency: int = MAX_CONCURRENT_TASKS,
+                 requests_per_second: float = REQUESTS_PER_SECOND, latency_target: float = LATENCY_TARGET,
+                 max_retries: int = MAX_RETRIES, post_timeout: float = POST_TIMEOUT, resume: bool = False,
+                 page_start: int = 1, page_step: int = 1, refresh: bool = False, refresh_days: float = REFRESH_DAYS,
+                 download_images: bool = False, image_dir: Optional[str] = None, image_cache_bytes: int = DEFAULT_MAX_BYTES,
+                 board_url: str = BOARD_URL, metrics: Optional[Metrics] = None,
+                 board_prefetch: int = BOARD_PREFETCH_PAGES, page_cache: bool = False, page_cache_path: Optional[str] = None,
+                 page_cache_ttl: float = DEFAULT_TTL, page_cache_bytes: int = DEFAULT_PAGE_CACHE_BYTES, replay: bool = False,
+                 retry_failed: bool = True):
+        """초기화 메서드
+
+        Args:
+            limit (int): 한 번의 실행에서 수집할 최대 게시글 수.
+            headless (bool): 브라우저를 헤드리스 모드로 실행할지 여부.
+            db_path (str): SQLite 데이터베이스 파일 경로.
+            view (Any): 진행 상황을 표시할 View 객체. 없으면 ConsoleView를 사용합니다.
+            incremental (bool): 증분 크롤링 여부. True이면 기존 데이터베이스를 유지하고,
+                이미 저장된 게시글은 건너뛰며, 새 게시글이 없는 페이지에서 수집을 멈춥니다.
+            backend (str): 스크래퍼 백엔드. "playwright"는 모든 페이지를 브라우저로 열고,
+                "http"는 HTTP 요청과 HTML 파서로 처리하되 JavaScript가 필요한 페이지만 브라우저로 처리합니다.
+            concurrency (int): 처음에 동시에 처리할 게시글 수.
+            min_concurrency (int): 오류가 잦을 때 줄일 수 있는 최소 동시 처리 수.
+            max_concurrency (int): 응답이 빠를 때 늘릴 수 있는 최대 동시 처리 수.
+            requests_per_second (float): 호스트당 초당 최대 요청 수. 429/5xx 응답을 받으면 일시적으로 줄어듭니다.
+            latency_target (float): 정상으로 간주하는 게시글 한 건의 처리 시간(초).
+                이보다 빠르면 동시 처리 수를 늘리고, 두 배를 넘거나 오류가 나면 절반으로 줄입니다.
+            max_retries (int): 게시글 한 건당 재시도 횟수. 모두 실패하면 failed_posts 테이블에 기록되고,
+                증분 크롤링의 다음 실행에서 다시 시도됩니다.
+            post_timeout (float): 게시글 한 건을 한 번 시도할 때의 제한 시간(초).
+            resume (bool): 이전 실행이 중단된 지점부터 이어서 크롤링할지 여부. True이면 데이터베이스를 유지하고,
+                crawl_queue 테이블에 남은 미완료 URL을 먼저 처리한 뒤 마지막으로 읽은 다음 게시판 페이지부터 수집합니다.
+            page_start (int): URL 수집을 시작할 게시판 페이지 번호.
+            page_step (int): 다음에 읽을 게시판 페이지까지의 간격. 여러 프로세스가 게시판 페이지를
+                나누어 수집할 때 사용합니다 (예: 작업자 2개면 각각 1, 3, 5... 와 2, 4, 6...).
+            refresh (bool): 새로 고침 모드 여부. True이면 게시판을 읽지 않고, 최근 refresh_days일 안에 작성되어
+                이미 저장된 게시글을 최신순으로 최대 limit개 다시 방문합니다. 본문은 해시가 바뀐 경우에만 갱신하고,
+                댓글은 아직 저장되지 않은 것만 추가합니다.
+            refresh_days (float): 새로 고침 모드에서 다시 방문할 게시글의 작성 기간(일).
+            download_images (bool): 저장한 게시글의 이미지를 다운로드하여 이미지 저장소에 보관할지 여부.
+                같은 내용의 이미지는 한 번만 저장되며, 게시글을 조회할 때 네트워크 대신 저장된 파일을 사용합니다.
+            image_dir (Optional[str]): 이미지 저장소 디렉토리. 없으면 데이터베이스 파일 옆의 images 디렉토리를 사용합니다.
+            image_cache_bytes (int): 이미지 저장소의 최대 크기(바이트). 넘으면 가장 오래 조회되지 않은 이미지부터 삭제합니다.
+            board_url (str): 게시글 URL을 수집할 게시판 URL. 게시글의 상대 경로 링크도 이 주소의 호스트를 기준으로 합니다
+                (벤치마크용 로컬 서버 등).
+            metrics (Optional[Metrics]): 단계별 처리 시간, 처리량, 동시 실행 수, 큐 길이를 기록할 Metrics.
+                없으면 지표를 기록하지 않습니다 (NullMetrics).
+            board_prefetch (int): URL 수집 단계에서 미리 동시에 읽어 둘 최대 게시판 페이지 수. 결과는 페이지 순서대로
+                처리되며, limit에 도달하거나 빈 페이지가 나오면 아직 끝나지 않은 페이지 요청은 취소됩니다.
+            page_cache (bool): 게시글 페이지의 원본 HTML을 디스크 캐시에 저장할지 여부. HTTP 백엔드는 page_cache_ttl 안에
+                가져온 페이지를 네트워크 대신 캐시에서 읽습니다.
+            page_cache_path (Optional[str]): 페이지 캐시 파일 경로. 없으면 데이터베이스 파일 옆의 page_cache.db를 사용합니다.
+            page_cache_ttl (float): 캐시된 페이지를 네트워크 대신 사용할 기간(초). 지난 페이지는 다시 가져오고 주기적으로 삭제합니다.
+            page_cache_bytes (int): 페이지 캐시의 최대 크기(압축 후 바이트). 넘으면 가장 오래전에 가져온 페이지부터 삭제합니다.
+            replay (bool): 재생 모드 여부. True이면 네트워크를 사용하지 않고, 페이지 캐시에 있는 게시글을 최근에 가져온 순서로
+                최대 limit개 다시 추출합니다. 기존 데이터베이스는 유지하며, 새로 고침과 같은 방식으로 저장된 게시글은 갱신하고
+                없는 게시글은 삽입합니다. 추출 로직을 바꾼 뒤 사이트를 다시 크롤링하지 않고 확인할 때 사용합니다.
+            retry_failed (bool): 증분 크롤링에서 이전에 실패한 게시글(failed_posts)을 다시 시도할지 여부.
+        """
+        if backend not in BACKENDS:
+            raise ValueError(f"지원하지 않는 스크래퍼 백엔드입니다: {backend}")
         self.limit = limit
         self.headless = headless
+        self.incremental = incremental
+        self.backend = backend
+        self.concurrency = concurrency
+        self.min_concurrency = min_concurrency
+        self.max_concurrency = max(max_concurrency, concurrency)
+        self.requests_per_second = requests_per_second
+        self.latency_target = latency_target
+        self.max_retries = max_retries
+        self.post_timeout = post_timeout
+        self.resume = resume
+        self.page_start = page_start
+        self.page_step = page_step
+        self.refresh = refresh
+        self.refresh_days = refresh_days
+        self.board_prefetch = max(1, board_prefetch)
+        self.replay = replay
+        self.retry_failed = retry_failed
+        self.limiter: Optional[AdaptiveLimiter] = None
+        self.rate_limiter: Optional[HostRateLimiter] = None
         self.db_manager = DatabaseManager(db_path)
+        self.download_images = download_images
+        self.board_url = board_url
+        parsed = urlparse(board_url)
+        self.base_url = f"{parsed.scheme}://{parsed.netloc}"
+        if image_dir is None:
+            image_dir = os.path.join(os.path.dirname(os.path.abspath(db_path)), "images")
+        self.image_store = ImageStore(image_dir, self.db_manager, image_cache_bytes)
+        self.page_cache: Optional[PageCache] = None
+        if page_cache or replay:
+            if page_cache_path is None:
+                page_cache_path = os.path.join(os.path.dirname(os.path.abspath(db_path)), "page_cache.db")
+            self.page_cache = PageCache(page_cache_path, page_cache_ttl, page_cache_bytes)
+        self.metrics = metrics if metrics is not None else NULL_METRICS
         self.view = view if view else ConsoleView()
+        self.progress = CrawlProgress(target=limit)
         self.stop_event = threading.Event()
 
     def request_stop(self):
@@ -26,97 +149,452 @@ class CrawlerController:
         """중지 요청 플래그를 초기화합니다."""
         self.stop_event.clear()
 
+    def _report_progress(self, **changes):
+        """진행 상황 카운터를 변경하고 View에 알립니다."""
+        for name, delta in changes.items():
+            setattr(self.progress, name, getattr(self.progress, name) + delta)
+        self.view.update_progress(replace(self.progress))
+
+    def _create_scraper(self):
+        """설정된 백엔드에 맞는 스크래퍼를 생성합니다."""
+        if self.replay:
+            # 재생 모드는 캐시된 HTML을 파서로만 처리하므로 브라우저를 실행하지 않습니다.
+            from .http_scraper import RuliwebHttpScraper
+            return RuliwebHttpScraper(base_url=self.base_url, metrics=self.metrics, cache=self.page_cache, replay=True)
+        if self.backend == "http":
+            # httpx, selectolax는 HTTP 백엔드를 사용할 때만 필요하므로 여기서 임포트합니다.
+            from .http_scraper import RuliwebHttpScraper, FallbackScraper
+            return FallbackScraper(
+                RuliwebHttpScraper(max_connections=self.max_concurrency + self.board_prefetch, base_url=self.base_url,
+                                   metrics=self.metrics, cache=self.page_cache),
+                lambda: RuliwebScraper(headless=self.headless, pool_size=self.max_concurrency, base_url=self.base_url,
+                                       metrics=self.metrics, cache=self.page_cache),
+            )
+        # 최대 상세 스크랩 작업자 수 + URL 수집 단계에서 미리 읽는 게시판 페이지 수
+        return RuliwebScraper(headless=self.headless, pool_size=self.max_concurrency + self.board_prefetch, base_url=self.base_url,
+                              metrics=self.metrics, cache=self.page_cache)
+
     async def run(self):
-        """크롤링 작업을 실행하는 메인 비동기 메서드"""
+        """크롤링 작업을 실행하는 메인 비동기 메서드
+
+        URL 수집, 상세 정보 스크랩, DB 저장의 세 단계를 크기가 제한된 asyncio.Queue로 연결한
+        파이프라인으로 실행합니다. 첫 URL이 수집되는 즉시 상세 스크랩이 시작되고,
+        각 게시글은 스크랩이 끝나는 대로 저장되므로 메모리 사용량이 limit과 무관하게 일정합니다.
+        """
         self.reset_stop()
+        self.progress = CrawlProgress(target=self.limit)
+        self.view.update_progress(replace(self.progress))
         self.view.show_message("Ruliweb 크롤러를 시작합니다.")
-        self.db_manager.create_tables()
-
-        async with RuliwebScraper(headless=self.headless) as scraper:
-            self.view.show_message("최신 게시글 URL을 수집합니다...")
-            all_post_urls = []
-            page = 1
-            while len(all_post_urls) < self.limit and not self.stop_event.is_set():
-                board_url = f"https://m.ruliweb.com/best/humor_only?page={page}"
+        self._prepare_database()
+
+        async with self._create_scraper() as scraper:
+            self.limiter = AdaptiveLimiter(self.concurrency, self.min_concurrency, self.max_concurrency, self.latency_target)
+            self.rate_limiter = HostRateLimiter(self.requests_per_second)
+            url_queue = asyncio.Queue(maxsize=URL_QUEUE_SIZE)
+            result_queue = asyncio.Queue(maxsize=RESULT_QUEUE_SIZE)
+            image_queue = asyncio.Queue(maxsize=IMAGE_QUEUE_SIZE) if self.download_images else None
+            self._register_gauges(url_queue, result_queue, image_queue)
+
+            async def fetch_stage():
+                await asyncio.gather(*(self._fetch_worker(scraper, url_queue, result_queue) for _ in range(self.max_concurrency)))
+                await result_queue.put(None) # 저장 단계에 종료를 알림
+
+            tasks = [
+                asyncio.create_task(self._discover_urls(scraper, url_queue)),
+                asyncio.create_task(fetch_stage()),
+                asyncio.create_task(self._save_results(result_queue, image_queue)),
+            ]
+            if image_queue is not None:
+                tasks.append(asyncio.create_task(self._download_images(image_queue)))
+            try:
+                await asyncio.gather(*tasks)
+                self._train_dictionary()
+            finally:
+                # 한 단계에서 예외가 발생하면 나머지 단계도 정리합니다.
+                for task in tasks:
+                    if not task.done():
+                        task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+                self.db_manager.close()
+                if self.page_cache is not None:
+                    self.page_cache.close()
+
+        if self.stop_event.is_set():
+            self.view.show_message("사용자 요청에 의해 크롤링이 중단되었습니다.")
+        else:
+            self.view.show_message("크롤링이 완료되었습니다.")
+
+    def _register_gauges(self, url_queue: asyncio.Queue, result_queue: asyncio.Queue, image_queue: Optional[asyncio.Queue]):
+        """큐 길이와 동시 처리 제한을 내보낼 때마다 읽는 게이지로 등록합니다."""
+        metrics = self.metrics
+        metrics.gauge_callback("queue_depth", url_queue.qsize, queue="url")
+        metrics.gauge_callback("queue_depth", result_queue.qsize, queue="result")
+        if image_queue is not None:
+            metrics.gauge_callback("queue_depth", image_queue.qsize, queue="image")
+        limiter = self.limiter
+        metrics.gauge_callback("concurrency_limit", lambda: limiter.limit)
+        metrics.gauge_callback("concurrency_in_flight", lambda: limiter.in_flight)
+
+    def _prepare_database(self):
+        """크롤링 전에 테이블을 준비하고, 이어서 하는 실행이 아니면 이전 프런티어를 지웁니다.
+
+        새로 고침과 재생 모드는 기존 게시글을 갱신하므로 테이블과 프런티어를 유지합니다.
+        """
+        keep_existing = self.resume or self.refresh or self.replay
+        self.db_manager.create_tables(drop_existing=not (self.incremental or keep_existing))
+        if not keep_existing:
+            self.db_manager.reset_frontier()
+
+    async def _discover_urls(self, scraper, url_queue: asyncio.Queue):
+        """게시판 페이지를 차례로 읽어 새 게시글 URL을 url_queue에 넣는 단계입니다."""
+        if self.refresh:
+            await self._discover_refresh_urls(url_queue)
+            return
+        if self.replay:
+            await self._discover_replay_urls(url_queue)
+            return
+        self.view.show_message("최신 게시글 URL을 수집합니다...")
+        seen_urls = set()
+        page = self.page_start
+        if self.resume:
+            # 이전 실행의 프런티어를 불러와 완료되지 않은 URL부터 처리합니다.
+            frontier_urls, pending_urls, last_page = self.db_manager.load_frontier()
+            seen_urls.update(frontier_urls)
+            page = last_page + self.page_step if last_page else self.page_start
+            self.view.show_message(f"이전 크롤링을 이어서 진행합니다. (완료 {len(frontier_urls) - len(pending_urls)}개, 남은 게시글 {len(pending_urls)}개, {page} 페이지부터 수집)")
+            positions = {url: i + 1 for i, url in enumerate(frontier_urls)}
+            self._report_progress(discovered=len(pending_urls))
+            for url in pending_urls:
+                await url_queue.put((url, positions[url]))
+
+        if self.incremental and self.retry_failed:
+            # 이전 실행에서 실패한 게시글을 먼저 다시 시도합니다.
+            failed_urls = [url for url in self.db_manager.get_failed_urls(FAILED_RETRY_LIMIT) if url not in seen_urls]
+            failed_urls = failed_urls[:max(0, self.limit - len(seen_urls))]
+            if failed_urls:
+                self.view.show_message(f"이전에 실패한 게시글 {len(failed_urls)}개를 다시 시도합니다.")
+                self.db_manager.add_to_frontier(failed_urls, None)
+                self._report_progress(discovered=len(failed_urls))
+            for url in failed_urls:
+                seen_urls.add(url)
+                await url_queue.put((url, len(seen_urls)))
+
+        # 게시판 페이지를 최대 board_prefetch개까지 미리 요청해 두고, 결과는 페이지 순서대로 처리합니다.
+        window = deque() # (페이지 번호, 페이지 요청 작업)
+        next_page = page
+        page_size = None # 마지막으로 읽은 페이지의 게시글 수. 남은 게시글에 필요한 만큼만 미리 요청하는 데 사용합니다.
+        try:
+            while len(seen_urls) < self.limit and not self.stop_event.is_set():
+                # 첫 페이지를 읽기 전에는 한 페이지만 요청하여 limit이 작을 때 불필요한 요청을 보내지 않습니다.
+                wanted = 1 if not page_size else math.ceil((self.limit - len(seen_urls)) / page_size)
+                while len(window) < min(self.board_prefetch, max(1, wanted)):
+                    window.append((next_page, asyncio.create_task(self._fetch_board_page(scraper, next_page))))
+                    next_page += self.page_step
+                page, task = window.popleft()
                 self.view.show_message(f"{page} 페이지에서 URL 수집 중...")
-                post_urls_on_page = await scraper.get_post_urls(board_url)
+                post_urls_on_page = await task
 
                 if not post_urls_on_page:
                     self.view.show_message("더 이상 게시글이 없어 URL 수집을 중단합니다.")
                     break
+                page_size = len(post_urls_on_page)
 
-                all_post_urls.extend(post_urls_on_page)
-                all_post_urls = list(dict.fromkeys(all_post_urls))
+                if self.incremental:
+                    # 이미 저장된 게시글은 상세 스크랩 대상에서 제외합니다.
+                    known_urls = self.db_manager.get_existing_urls(post_urls_on_page)
+                    post_urls_on_page = [url for url in post_urls_on_page if url not in known_urls]
+                    if not post_urls_on_page:
+                        self.view.show_message(f"{page} 페이지의 게시글이 모두 저장되어 있어 URL 수집을 중단합니다.")
+                        break
 
-                if len(all_post_urls) >= self.limit:
-                    all_post_urls = all_post_urls[:self.limit]
-                    break
-                
-                page += 1
+                # 페이지 내 순서를 유지하면서 중복을 제거합니다.
+                new_urls = [url for url in dict.fromkeys(post_urls_on_page) if url not in seen_urls]
+                new_urls = new_urls[:self.limit - len(seen_urls)]
+                # 큐에 넣기 전에 프런티어에 기록하여 중단되더라도 다음 실행에서 이어서 처리할 수 있게 합니다.
+                self.db_manager.add_to_frontier(new_urls, page)
+                self._report_progress(discovered=len(new_urls))
+                for url in new_urls:
+                    seen_urls.add(url)
+                    await url_queue.put((url, len(seen_urls)))
+        finally:
+            # limit에 도달했거나 빈 페이지가 나왔으므로 아직 끝나지 않은 페이지 요청은 취소합니다.
+            for _, task in window:
+                task.cancel()
+            if window:
+                self.metrics.inc("board_pages_cancelled_total", len(window))
+            await asyncio.gather(*(task for _, task in window), return_exceptions=True)
+
+        self.view.show_message(f"총 {len(seen_urls)}개의 게시글 URL을 수집했습니다.")
+        if not seen_urls:
+            self.view.show_message("새로 수집할 게시글이 없습니다.")
+        for _ in range(self.max_concurrency):
+            await url_queue.put(None) # 상세 스크랩 작업자에게 종료를 알림
+
+    async def _fetch_board_page(self, scraper, page: int):
+        """게시판 페이지 하나를 요청 속도 제한을 지키며 읽어 게시글 URL 목록을 반환합니다."""
+        board_url = f"{self.board_url}?page={page}"
+        await self.rate_limiter.acquire(board_url)
+        with self.metrics.time("board_page_seconds"):
+            post_urls = await scraper.get_post_urls(board_url)
+        self.metrics.inc("board_pages_total")
+        return post_urls
+
+    async def _discover_refresh_urls(self, url_queue: asyncio.Queue):
+        """새로 고침 모드에서 최근에 작성된 저장된 게시글의 URL을 url_queue에 넣는 단계입니다."""
+        since = (datetime.now() - timedelta(days=self.refresh_days)).strftime(DATETIME_FORMAT)
+        urls = self.db_manager.get_posts_for_refresh(since, self.limit)
+        self.view.show_message(f"최근 {self.refresh_days:g}일 동안 작성된 게시글 {len(urls)}개를 새로 고칩니다.")
+        self._report_progress(discovered=len(urls))
+        for index, url in enumerate(urls, start=1):
+            if self.stop_event.is_set():
+                break
+            await url_queue.put((url, index))
+        for _ in range(self.max_concurrency):
+            await url_queue.put(None) # 상세 스크랩 작업자에게 종료를 알림
+
+    async def _discover_replay_urls(self, url_queue: asyncio.Queue):
+        """재생 모드에서 페이지 캐시에 있는 게시글 URL을 최근에 가져온 순서로 url_queue에 넣는 단계입니다.
 
+        이미 저장된 게시글도 다시 추출하여 갱신해야 하므로 incremental 여부와 관계없이 걸러 내지 않습니다.
+        """
+        urls = self.page_cache.urls(self.limit)
+        self.view.show_message(f"페이지 캐시에 저장된 게시글 {len(urls)}개를 다시 추출합니다.")
+        self._report_progress(discovered=len(urls))
+        for index, url in enumerate(urls, start=1):
+            if self.stop_event.is_set():
+                break
+            await url_queue.put((url, index))
+        for _ in range(self.max_concurrency):
+            await url_queue.put(None) # 상세 스크랩 작업자에게 종료를 알림
+
+    async def _fetch_worker(self, scraper, url_queue: asyncio.Queue, result_queue: asyncio.Queue):
+        """url_queue에서 URL을 꺼내 상세 정보를 스크랩하고 result_queue에 넣는 작업자입니다."""
+        while True:
+            item = await url_queue.get()
+            if item is None:
+                break
             if self.stop_event.is_set():
-                self.view.show_message("사용자 요청에 의해 크롤링이 중단되었습니다. (URL 수집 단계)")
-                return
-
-            self.view.show_message(f"총 {len(all_post_urls)}개의 게시글 URL을 수집했습니다.")
-
-            semaphore = asyncio.Semaphore(CONCURRENT_TASKS)
-            async def fetch_and_process(url, index):
-                async with semaphore:
-                    if self.stop_event.is_set():
-                        return None # 중지 요청 시 작업 중단
-                    self.view.show_message(f"게시글 {index+1}/{len(all_post_urls)} 처리 중: {url}")
-                    post, comments = await scraper.get_post_details(url)
-                    return post, comments
-
-            tasks = [fetch_and_process(url, i) for i, url in enumerate(all_post_urls)]
-            results = await asyncio.gather(*tasks)
-
-            # 결과 처리 및 DB 저장 (순차적으로 진행)
-            for i, result in enumerate(results):
-                if self.stop_event.is_set():
-                    self.view.show_message("사용자 요청에 의해 크롤링이 중단되었습니다. (상세 정보 저장 단계)")
+                continue # 중지 요청 시 남은 URL은 건너뛰고 종료 신호까지 비웁니다.
+            url, index = item
+            self.view.show_message(f"게시글 {index}/{self.limit} 처리 중: {url}")
+            self.db_manager.set_frontier_status(url, FRONTIER_IN_FLIGHT)
+            result = await self._fetch_with_retry(scraper, url)
+            if result is not None:
+                await result_queue.put(result)
+
+    async def _fetch_with_retry(self, scraper, url: str):
+        """게시글을 제한 시간 안에 스크랩하고, 실패하면 지터가 적용된 지수 백오프로 재시도합니다.
+
+        모든 시도가 실패하면 failed_posts 테이블에 기록하고 None을 반환하므로,
+        한 게시글의 실패가 다른 게시글의 처리에 영향을 주지 않습니다.
+        """
+        for attempt in range(self.max_retries + 1):
+            try:
+                async with self.limiter.slot():
+                    return await asyncio.wait_for(self._fetch_with_throttle(scraper, url), self.post_timeout)
+            except asyncio.TimeoutError:
+                self.limiter.record_failure()
+                error = f"제한 시간({self.post_timeout:g}초) 초과"
+                retryable = True
+            except ScraperHTTPError as e:
+                error = str(e)
+                retryable = e.status == 429 or e.status >= 500 # 그 밖의 4xx는 재시도해도 같은 결과입니다.
+            except PageCacheMissError as e:
+                error = str(e)
+                retryable = False
+            except Exception as e:
+                error = f"{type(e).__name__}: {e}"
+                # 재생 모드는 같은 캐시된 HTML을 다시 파싱하므로 재시도해도 결과가 같습니다.
+                retryable = not self.replay
+
+            if not retryable or attempt == self.max_retries or self.stop_event.is_set():
+                break
+            self.metrics.inc("post_retries_total")
+            # 슬롯을 반납한 상태에서 대기하여 다른 게시글 처리를 막지 않습니다.
+            await asyncio.sleep(random.uniform(0, RETRY_BACKOFF * 2 ** attempt))
+
+        self.view.show_message(f"게시글 스크랩 실패: {url} ({error})")
+        self.metrics.inc("posts_failed_total")
+        self.db_manager.record_failure(url, error)
+        self.db_manager.set_frontier_status(url, FRONTIER_FAILED)
+        self._report_progress(failed=1)
+        return None
+
+    async def _fetch_with_throttle(self, scraper, url: str):
+        """호스트별 요청 속도 제한을 지키며 게시글을 스크랩하고, 결과를 동시성 제한기에 반영합니다."""
+        metrics = self.metrics
+        bucket = self.rate_limiter.bucket_for(url)
+        if not self.replay: # 재생 모드는 네트워크 요청이 없으므로 속도 제한을 적용하지 않습니다.
+            with metrics.time("rate_limit_wait_seconds"):
+                await bucket.acquire()
+        started = time.monotonic()
+        metrics.add_gauge("fetch_in_flight", 1)
+        try:
+            result = await scraper.get_post_details(url)
+        except ScraperHTTPError as e:
+            self.limiter.record_failure()
+            metrics.inc("post_fetch_errors_total", status=e.status)
+            if e.status == 429 or e.status >= 500:
+                bucket.slow_down() # 사이트가 과부하를 알리면 요청 속도를 줄입니다.
+            raise
+        except Exception as e:
+            self.limiter.record_failure()
+            metrics.inc("post_fetch_errors_total", status=type(e).__name__)
+            raise
+        finally:
+            metrics.add_gauge("fetch_in_flight", -1)
+        elapsed = time.monotonic() - started
+        metrics.observe("post_fetch_seconds", elapsed)
+        await self.limiter.record_success(elapsed)
+        bucket.speed_up()
+        return result
+
+    async def _save_results(self, result_queue: asyncio.Queue, image_queue: Optional[asyncio.Queue] = None):
+        """result_queue에서 스크랩 결과를 꺼내 데이터베이스에 저장하는 단계입니다.
+
+        대기 중인 결과를 최대 WRITE_BATCH_SIZE개까지 모아 한 트랜잭션으로 저장합니다.
+        image_queue가 있으면 저장한 게시글 중 아직 저장소에 없는 이미지 URL을 넣습니다.
+        """
+        scheduled_images = set()
+        finished = False
+        while not finished:
+            batch = []
+            result = await result_queue.get()
+            while result is not None:
+                batch.append(result)
+                if len(batch) >= WRITE_BATCH_SIZE or result_queue.empty():
                     break
-                if result:
-                    post, comments = result
-                    post_id = self.db_manager.insert_post(post)
-                    if post_id:
-                        for comment in comments:
-                            comment.post_id = post_id
-                            self.db_manager.insert_comment(comment)
+                result = result_queue.get_nowait()
+            finished = result is None
 
+            if batch and (self.refresh or self.replay):
+                with self.metrics.time("db_write_seconds", operation="refresh"):
+                    self._refresh_batch(batch)
+            elif batch:
+                with self.metrics.time("db_write_seconds", operation="insert"):
+                    await self._persist_batch(batch)
+                for post, comments in batch:
                     self.view.display_post(post)
                     self.view.display_comments(comments)
+            if batch:
+                self.metrics.inc("posts_saved_total", len(batch))
+                self.metrics.inc("comments_saved_total", sum(len(comments) for _, comments in batch))
+                self._report_progress(saved=len(batch))
 
-        if not self.stop_event.is_set():
-            self.view.show_message("크롤링이 완료되었습니다.")
+            if image_queue is not None and batch:
+                image_urls = [url for post, _ in batch for url in post.image_urls if url not in scheduled_images]
+                for url in self.image_store.missing(image_urls):
+                    scheduled_images.add(url)
+                    await image_queue.put(url)
+
+        if image_queue is not None:
+            for _ in range(IMAGE_FETCH_TASKS):
+                await image_queue.put(None) # 이미지 다운로드 작업자에게 종료를 알림
+
+    async def _download_images(self, image_queue: asyncio.Queue):
+        """image_queue에서 이미지 URL을 꺼내 다운로드하고 이미지 저장소에 저장하는 단계입니다."""
+        async with ImageDownloader(max_connections=IMAGE_FETCH_TASKS) as downloader:
+            await asyncio.gather(*(self._image_worker(downloader, image_queue) for _ in range(IMAGE_FETCH_TASKS)))
+
+    async def _image_worker(self, downloader: ImageDownloader, image_queue: asyncio.Queue):
+        """이미지 다운로드 작업자입니다. 실패한 이미지는 건너뛰고 다음 실행에서 다시 시도됩니다."""
+        while True:
+            url = await image_queue.get()
+            if url is None:
+                break
+            if self.stop_event.is_set():
+                continue
+            await self.rate_limiter.acquire(url)
+            try:
+                with self.metrics.time("image_download_seconds"):
+                    data = await asyncio.wait_for(downloader.fetch(url), self.post_timeout)
+            except Exception as e:
+                self.metrics.inc("image_download_errors_total")
+                self.view.show_message(f"이미지 다운로드 실패: {url} ({type(e).__name__}: {e})")
+                continue
+            with self.metrics.time("db_write_seconds", operation="image"):
+                self.image_store.put(url, data)
+            self.metrics.inc("image_bytes_downloaded_total", len(data))
 
-    def search_posts(self, start_date: str, end_date: str, keyword: Optional[str] = None):
+    def _train_dictionary(self):
+        """충분한 게시글이 쌓이면 HTML 압축 사전을 학습하여 다음 저장부터 사용합니다."""
+        self.db_manager.train_dictionary_if_needed()
+
+    async def _persist_batch(self, batch):
+        """스크랩 결과 묶음을 하나의 트랜잭션으로 데이터베이스에 저장합니다."""
+        self.db_manager.insert_posts_with_comments(batch)
+
+    def _refresh_batch(self, batch):
+        """다시 스크랩한 결과 묶음을 기존 게시글에 반영하고, 새 댓글이 있는 게시글만 표시합니다."""
+        added = self.db_manager.refresh_posts(batch)
+        for (post, _), new_comments in zip(batch, added):
+            if new_comments:
+                self.view.show_message(f"새 댓글 {len(new_comments)}개: {post.title}")
+                self.view.display_comments(new_comments)
+
+    def search_posts(self, start_date: str, end_date: str, keyword: Optional[str] = None, with_comments: bool = True,
+                     search_comments: bool = False):
         """
         지정된 기간과 키워드로 게시글을 검색하고 결과를 반환합니다.
 
         Args:
             start_date (str): 검색 시작 날짜 (YYYY-MM-DD 형식).
-            end_date (str): 검색 종료 날짜 (YYYY-MM-DD 형식).
+            end_date (str): 검색 종료 날짜 (YYYY-MM-DD 형식, 해당 날짜는 포함하지 않음).
             keyword (Optional[str]): 제목 또는 내용에서 검색할 키워드.
+            with_comments (bool): 댓글까지 함께 조회할지 여부. False이면 get_comments로 필요할 때 조회합니다.
+            search_comments (bool): 댓글 내용에서도 키워드를 검색할지 여부.
         Returns:
             List[Post]: 검색된 게시글 리스트.
         """
-        posts = self.db_manager.search_posts(start_date, end_date, keyword)
+        posts = self.db_manager.search_posts(start_date, end_date, keyword, with_comments=with_comments,
+                                               search_comments=search_comments)
         return posts
 
-
-    def search_posts(self, start_date: str, end_date: str, keyword: Optional[str] = None):
+    def search_post_summaries(self, start_date: str, end_date: str, keyword: Optional[str] = None,
+                              search_comments: bool = False, after: Optional[tuple] = None):
         """
-        지정된 기간과 키워드로 게시글을 검색하고 결과를 반환합니다.
+        search_posts와 같은 조건으로 게시글 목록(ID, 제목, 작성일)을 한 페이지씩 조회합니다.
 
         Args:
             start_date (str): 검색 시작 날짜 (YYYY-MM-DD 형식).
-            end_date (str): 검색 종료 날짜 (YYYY-MM-DD 형식).
+            end_date (str): 검색 종료 날짜 (YYYY-MM-DD 형식, 해당 날짜는 포함하지 않음).
             keyword (Optional[str]): 제목 또는 내용에서 검색할 키워드.
+            search_comments (bool): 댓글 내용에서도 키워드를 검색할지 여부.
+            after (Optional[tuple]): 이전 페이지 조회가 반환한 커서. None이면 첫 페이지를 조회합니다.
         Returns:
-            List[Post]: 검색된 게시글 리스트.
+            Tuple[List[PostSummary], Optional[tuple]]: (게시글 목록, 다음 페이지 커서). 마지막 페이지면 커서는 None.
         """
-        posts = self.db_manager.search_posts(start_date, end_date, keyword)
-        return posts
+        return self.db_manager.search_post_summaries(start_date, end_date, keyword, search_comments, after)
 
+    def get_post(self, post_id: int):
+        """
+        게시글의 본문과 댓글을 조회합니다.
+
+        Args:
+            post_id (int): 게시글 ID.
+        Returns:
+            Optional[Post]: 게시글. 없으면 None.
+        """
+        return self.db_manager.get_post(post_id)
+
+    def get_post_html(self, post):
+        """
+        게시글 본문 HTML을 반환합니다. 이미지 저장소에 있는 이미지는 로컬 파일 경로로 바꿉니다.
+
+        Args:
+            post (Post): 게시글.
+        Returns:
+            str: 본문 HTML.
+        """
+        return self.image_store.localize_html(post.content_html)
+
+    def get_comments(self, post_id: int):
+        """
+        게시글의 댓글을 조회합니다.
+
+        Args:
+            post_id (int): 게시글 ID.
+        Returns:
+            List[Comment]: 댓글 리스트.
+        """
+        return self.db_manager.get_comments_for_post(post_id)
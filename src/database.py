@@ -1,8 +1,66 @@
 
+import hashlib
 import sqlite3
 import json
-from typing import List, Optional
-from .models import Post, Comment
+import threading
+from collections import Counter
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Set, Tuple
+from .date_utils import DATETIME_FORMAT, normalize_datetime
+from .html_codec import DICTIONARY_SIZE, HtmlCodec, strip_boilerplate, train_dictionary
+from .models import Post, Comment, PostSummary
+
+SCHEMA_VERSION = 3 # PRAGMA user_version에 기록하는 현재 스키마 버전 (1: 날짜 정규화, 2: 새로 고침 컬럼, 3: HTML 압축)
+# crawl_queue 테이블의 URL 상태
+FRONTIER_PENDING = 'pending'
+FRONTIER_IN_FLIGHT = 'in_flight'
+FRONTIER_DONE = 'done'
+FRONTIER_FAILED = 'failed'
+MAX_QUERY_PARAMS = 900 # 한 쿼리에 바인딩할 최대 변수 개수 (SQLite 기본 제한 999 이하)
+FTS_MIN_KEYWORD_LENGTH = 3 # trigram 색인으로 검색할 수 있는 최소 키워드 길이
+DICTIONARY_MIN_POSTS = 100 # 압축 사전을 처음 학습하기 위해 필요한 최소 게시글 수
+DICTIONARY_SAMPLE_POSTS = 2000 # 사전 학습에 사용할 최근 게시글 수
+DICTIONARY_SAMPLE_COMMENTS = 10000 # 사전 학습에 사용할 최근 댓글 수
+PAGE_SIZE = 100 # search_post_summaries가 한 번에 반환하는 기본 게시글 수
+COMPACT_CHUNK_SIZE = 500 # compact()에서 한 번에 다시 압축할 행 수
+
+# posts/comments 변경 시 FTS5 색인을 동기화하는 트리거
+FTS_TRIGGERS = (
+    """CREATE TRIGGER IF NOT EXISTS posts_fts_ai AFTER INSERT ON posts BEGIN
+        INSERT INTO posts_fts(rowid, title, content) VALUES (new.id, new.title, new.content);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS posts_fts_ad AFTER DELETE ON posts BEGIN
+        INSERT INTO posts_fts(posts_fts, rowid, title, content) VALUES ('delete', old.id, old.title, old.content);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS posts_fts_au AFTER UPDATE OF title, content ON posts BEGIN
+        INSERT INTO posts_fts(posts_fts, rowid, title, content) VALUES ('delete', old.id, old.title, old.content);
+        INSERT INTO posts_fts(rowid, title, content) VALUES (new.id, new.title, new.content);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS comments_fts_ai AFTER INSERT ON comments BEGIN
+        INSERT INTO comments_fts(rowid, text) VALUES (new.id, new.text);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS comments_fts_ad AFTER DELETE ON comments BEGIN
+        INSERT INTO comments_fts(comments_fts, rowid, text) VALUES ('delete', old.id, old.text);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS comments_fts_au AFTER UPDATE OF text ON comments BEGIN
+        INSERT INTO comments_fts(comments_fts, rowid, text) VALUES ('delete', old.id, old.text);
+        INSERT INTO comments_fts(rowid, text) VALUES (new.id, new.text);
+    END""",
+)
+
+def content_hash(title: Optional[str], content: Optional[str]) -> str:
+    """게시글의 제목과 본문 텍스트로 변경 여부를 판단하기 위한 해시를 만듭니다."""
+    return hashlib.sha256(f"{title or ''}\x00{content or ''}".encode('utf-8')).hexdigest()
+
+
+def comment_fingerprint(text: Optional[str], comment_created: Optional[str]) -> str:
+    """댓글 내용과 작성일로 같은 댓글인지 판별하기 위한 지문을 만듭니다.
+
+    추천 수처럼 바뀔 수 있는 값이 포함된 HTML 대신 텍스트와 작성일만 사용합니다.
+    같은 시각에 작성된 같은 내용의 댓글은 지문이 같으므로, 비교할 때는 지문별 개수를 셉니다.
+    """
+    return hashlib.sha1(f"{comment_created or ''}\x00{text or ''}".encode('utf-8')).hexdigest()
+
 
 class DatabaseManager:
     """SQLite 데이터베이스를 관리하는 클래스"""
@@ -13,10 +71,32 @@ class DatabaseManager:
             db_path (str): SQLite 데이터베이스 파일의 경로.
         """
         self.db_path = db_path
+        # sqlite3 연결은 스레드 간에 공유할 수 없으므로 스레드마다 하나의 연결을 유지합니다.
+        self._local = threading.local()
+        self._codec: Optional[HtmlCodec] = None
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """현재 스레드의 영속 연결을 반환합니다. 없으면 WAL 모드로 새로 엽니다."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            # 여러 프로세스가 같은 파일에 쓰는 경우를 위해 잠금 대기 시간을 넉넉히 둡니다.
+            conn = sqlite3.connect(self.db_path, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def close(self):
+        """현재 스레드의 데이터베이스 연결을 닫습니다."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
 
     def _execute(self, query, params=(), fetch=None):
-        """데이터베이스 연결, 실행, 커밋 및 연결 닫기를 한 번에 처리합니다."""
-        with sqlite3.connect(self.db_path) as conn:
+        """현재 스레드의 영속 연결에서 쿼리를 실행하고 커밋합니다."""
+        conn = self._get_connection()
+        with conn:
             cursor = conn.cursor()
             cursor.execute(query, params)
             conn.commit()
@@ -28,14 +108,22 @@ class DatabaseManager:
                 return cursor.lastrowid
             return None
 
-    def create_tables(self):
-        """posts 및 comments 테이블을 생성합니다."""
-        # DROP 문은 별도로 실행
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute("DROP TABLE IF EXISTS comments;")
-            cursor.execute("DROP TABLE IF EXISTS posts;")
-            conn.commit()
+    def create_tables(self, drop_existing: bool = True):
+        """posts 및 comments 테이블을 생성합니다.
+
+        Args:
+            drop_existing (bool): 기존 테이블을 삭제하고 새로 만들지 여부.
+                증분 크롤링에서는 False로 호출하여 기존 데이터를 유지합니다.
+        """
+        if drop_existing:
+            # DROP 문은 별도로 실행
+            self._execute("DROP TABLE IF EXISTS crawl_queue;")
+            self._execute("DROP TABLE IF EXISTS crawl_state;")
+            self._execute("DROP TABLE IF EXISTS failed_posts;")
+            self._execute("DROP TABLE IF EXISTS comments_fts;")
+            self._execute("DROP TABLE IF EXISTS posts_fts;")
+            self._execute("DROP TABLE IF EXISTS comments;")
+            self._execute("DROP TABLE IF EXISTS posts;")
 
         create_posts_query = """
             CREATE TABLE IF NOT EXISTS posts (
@@ -45,7 +133,10 @@ class DatabaseManager:
                 content TEXT,
                 content_html TEXT,
                 image_urls TEXT,
-                post_created TEXT
+                post_created TEXT,
+                content_hash TEXT,
+                comment_count INTEGER NOT NULL DEFAULT 0,
+                refreshed_at TEXT
             )
         """
         create_comments_query = """
@@ -55,20 +146,425 @@ class DatabaseManager:
                 html TEXT,
                 text TEXT,
                 comment_created TEXT,
+                fingerprint TEXT,
                 FOREIGN KEY (post_id) REFERENCES posts (id)
             )
         """
         self._execute(create_posts_query)
         self._execute(create_comments_query)
+        # 게시글별 댓글 조회를 위한 인덱스
+        self._execute("CREATE INDEX IF NOT EXISTS idx_comments_post_id ON comments (post_id)")
+        # 날짜 범위 검색을 위한 인덱스
+        self._execute("CREATE INDEX IF NOT EXISTS idx_posts_post_created ON posts (post_created)")
+        self._execute("CREATE INDEX IF NOT EXISTS idx_comments_comment_created ON comments (comment_created)")
+        # 스크랩에 실패한 게시글 (다음 실행에서 다시 시도)
+        self._execute("""
+            CREATE TABLE IF NOT EXISTS failed_posts (
+                url TEXT PRIMARY KEY,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                last_error TEXT,
+                last_failed_at TEXT
+            )
+        """)
+        # 재개 가능한 크롤링을 위한 URL 프런티어와 진행 상태
+        self._execute("""
+            CREATE TABLE IF NOT EXISTS crawl_queue (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                url TEXT UNIQUE NOT NULL,
+                status TEXT NOT NULL DEFAULT 'pending',
+                board_page INTEGER,
+                updated_at TEXT
+            )
+        """)
+        self._execute("CREATE INDEX IF NOT EXISTS idx_crawl_queue_status ON crawl_queue (status)")
+        self._execute("""
+            CREATE TABLE IF NOT EXISTS crawl_state (
+                key TEXT PRIMARY KEY,
+                value TEXT
+            )
+        """)
+        # 내용 주소(해시) 기반 이미지 저장소의 색인. 이미지 파일은 크롤링 데이터를 지워도 재사용할 수 있으므로
+        # drop_existing이어도 삭제하지 않습니다.
+        self._execute("""
+            CREATE TABLE IF NOT EXISTS image_files (
+                hash TEXT PRIMARY KEY,
+                size INTEGER NOT NULL,
+                last_accessed TEXT NOT NULL
+            )
+        """)
+        self._execute("CREATE INDEX IF NOT EXISTS idx_image_files_last_accessed ON image_files (last_accessed)")
+        self._execute("""
+            CREATE TABLE IF NOT EXISTS image_sources (
+                url TEXT PRIMARY KEY,
+                hash TEXT NOT NULL
+            )
+        """)
+        self._execute("CREATE INDEX IF NOT EXISTS idx_image_sources_hash ON image_sources (hash)")
+        # HTML 컬럼 압축에 사용하는 zstd 사전 (이전 사전으로 압축된 행을 읽을 수 있도록 모두 보관합니다)
+        self._execute("""
+            CREATE TABLE IF NOT EXISTS html_dictionaries (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                data BLOB NOT NULL,
+                created_at TEXT
+            )
+        """)
+        self._codec = None
+        self._create_fts_tables()
+        self._migrate()
+        # 새로 고침 시 이미 저장된 댓글인지 확인하기 위한 인덱스 (마이그레이션으로 컬럼이 추가된 뒤에 생성)
+        self._execute("CREATE INDEX IF NOT EXISTS idx_comments_fingerprint ON comments (post_id, fingerprint)")
+
+    def _migrate(self):
+        """PRAGMA user_version을 기준으로 기존 데이터베이스를 현재 스키마 버전으로 변환합니다."""
+        version = self._execute("PRAGMA user_version", fetch='one')[0]
+        if version < 1:
+            self._migrate_timestamps()
+        if version < 2:
+            self._migrate_refresh_columns()
+        # 버전 3(HTML 압축)은 이전 형식의 행도 그대로 읽을 수 있으므로 데이터를 변환하지 않습니다.
+        # 전체 행을 다시 압축하는 compact()는 오래 걸리므로 필요할 때 명시적으로 실행합니다 (cli.py --compact).
+        if version < SCHEMA_VERSION:
+            self._execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    def _migrate_timestamps(self):
+        """자유 형식으로 저장된 post_created/comment_created를 "YYYY-MM-DD HH:MM:SS" 형식으로 변환합니다.
+
+        시간만 저장된 댓글 날짜는 게시글의 작성일을 기준 날짜로 사용합니다.
+        """
+        conn = self._get_connection()
+        with conn:
+            posts = conn.execute("SELECT id, post_created FROM posts").fetchall()
+            post_dates = {}
+            updates = []
+            for post_id, post_created in posts:
+                normalized = normalize_datetime(post_created)
+                post_dates[post_id] = normalized
+                if normalized != post_created:
+                    updates.append((normalized, post_id))
+            conn.executemany("UPDATE posts SET post_created = ? WHERE id = ?", updates)
+
+            comments = conn.execute("SELECT id, post_id, comment_created FROM comments WHERE comment_created IS NOT NULL").fetchall()
+            updates = []
+            for comment_id, post_id, comment_created in comments:
+                reference = post_dates.get(post_id)
+                reference = datetime.strptime(reference, DATETIME_FORMAT) if reference else None
+                normalized = normalize_datetime(comment_created, reference)
+                if normalized != comment_created:
+                    updates.append((normalized, comment_id))
+            conn.executemany("UPDATE comments SET comment_created = ? WHERE id = ?", updates)
+
+    def _migrate_refresh_columns(self):
+        """새로 고침에 필요한 컬럼(content_hash, comment_count, refreshed_at, fingerprint)을 추가하고 기존 행을 채웁니다."""
+        conn = self._get_connection()
+        with conn:
+            post_columns = {row[1] for row in conn.execute("PRAGMA table_info(posts)")}
+            if 'content_hash' not in post_columns:
+                conn.execute("ALTER TABLE posts ADD COLUMN content_hash TEXT")
+                conn.execute("ALTER TABLE posts ADD COLUMN comment_count INTEGER NOT NULL DEFAULT 0")
+                conn.execute("ALTER TABLE posts ADD COLUMN refreshed_at TEXT")
+            comment_columns = {row[1] for row in conn.execute("PRAGMA table_info(comments)")}
+            if 'fingerprint' not in comment_columns:
+                conn.execute("ALTER TABLE comments ADD COLUMN fingerprint TEXT")
+
+            posts = conn.execute("SELECT id, title, content FROM posts WHERE content_hash IS NULL").fetchall()
+            conn.executemany("UPDATE posts SET content_hash = ? WHERE id = ?",
+                             [(content_hash(title, content), post_id) for post_id, title, content in posts])
+            comments = conn.execute("SELECT id, text, comment_created FROM comments WHERE fingerprint IS NULL").fetchall()
+            conn.executemany("UPDATE comments SET fingerprint = ? WHERE id = ?",
+                             [(comment_fingerprint(text, created), comment_id) for comment_id, text, created in comments])
+            conn.execute("UPDATE posts SET comment_count = (SELECT COUNT(*) FROM comments WHERE comments.post_id = posts.id)")
+
+    @property
+    def codec(self) -> HtmlCodec:
+        """저장된 압축 사전을 불러온 HtmlCodec을 반환합니다. 다른 프로세스가 학습한 사전은 필요할 때 다시 읽습니다."""
+        if self._codec is None:
+            self._codec = HtmlCodec(self.get_html_dictionaries(), loader=self.get_html_dictionaries)
+        return self._codec
+
+    def get_html_dictionaries(self) -> Dict[int, bytes]:
+        """저장된 압축 사전(ID → 사전 데이터)을 반환합니다. 다른 프로세스에서 HtmlCodec을 만들 때 사용합니다."""
+        try:
+            return dict(self._execute("SELECT id, data FROM html_dictionaries", fetch='all'))
+        except sqlite3.OperationalError:
+            return {} # 테이블을 만들기 전의 데이터베이스
+
+    def _pack_html(self, html: Optional[str]) -> Optional[bytes]:
+        """HTML에서 화면 표시에 쓰이지 않는 마크업을 제거하고 압축하여 저장 형식으로 만듭니다."""
+        return self.codec.compress(strip_boilerplate(html))
+
+    def train_dictionary(self, dictionary_size: int = DICTIONARY_SIZE) -> bool:
+        """최근에 저장된 게시글과 댓글의 HTML로 압축 사전을 학습하여 이후 저장에 사용합니다.
+
+        Args:
+            dictionary_size (int): 사전 크기(바이트).
+
+        Returns:
+            bool: 사전을 학습했으면 True. zstandard가 없거나 샘플이 부족하면 False.
+        """
+        codec = self.codec
+        if not codec.supports_dictionaries:
+            return False # 샘플을 읽어 복원하기 전에 확인합니다.
+        samples = [codec.decompress(row[0]) for row in self._execute(
+            "SELECT content_html FROM posts ORDER BY id DESC LIMIT ?", (DICTIONARY_SAMPLE_POSTS,), fetch='all')]
+        samples += [codec.decompress(row[0]) for row in self._execute(
+            "SELECT html FROM comments ORDER BY id DESC LIMIT ?", (DICTIONARY_SAMPLE_COMMENTS,), fetch='all')]
+        dictionary = train_dictionary([strip_boilerplate(sample) for sample in samples if sample], dictionary_size)
+        if dictionary is None:
+            return False
+        dictionary_id = self._execute("INSERT INTO html_dictionaries (data, created_at) VALUES (?, ?)",
+                                      (dictionary, datetime.now().strftime(DATETIME_FORMAT)))
+        codec.add_dictionary(dictionary_id, dictionary)
+        return True
+
+    def train_dictionary_if_needed(self) -> bool:
+        """아직 압축 사전이 없고 게시글이 DICTIONARY_MIN_POSTS개 이상 쌓였으면 사전을 학습합니다.
+
+        zstandard가 없으면 샘플을 읽지 않고 바로 False를 반환합니다.
+        """
+        if not self.codec.supports_dictionaries or self.codec.dictionary_id:
+            return False
+        if self._execute("SELECT COUNT(*) FROM posts", fetch='one')[0] < DICTIONARY_MIN_POSTS:
+            return False
+        return self.train_dictionary()
+
+    def compact(self, retrain: bool = True, progress: Optional[Callable[[str, int], None]] = None):
+        """모든 HTML 컬럼을 현재 형식(마크업 정리 + 최신 사전으로 압축)으로 다시 저장하고 파일 크기를 줄입니다.
+
+        압축되지 않은 이전 형식의 행도 이 과정에서 변환됩니다. 큰 데이터베이스에서는 오래 걸리므로
+        데이터베이스를 열 때 자동으로 실행하지 않습니다.
+
+        Args:
+            retrain (bool): 다시 압축하기 전에 현재 데이터로 압축 사전을 새로 학습할지 여부.
+            progress (Optional[Callable[[str, int], None]]): 묶음을 다시 압축할 때마다 (테이블 이름, 지금까지 처리한 행 수)로
+                호출할 함수.
+        """
+        if retrain:
+            self.train_dictionary()
+        codec = self.codec
+        conn = self._get_connection()
+        for table, column in (("posts", "content_html"), ("comments", "html")):
+            last_id = 0
+            done = 0
+            while True:
+                rows = conn.execute(f"SELECT id, {column} FROM {table} WHERE id > ? ORDER BY id LIMIT ?",
+                                    (last_id, COMPACT_CHUNK_SIZE)).fetchall()
+                if not rows:
+                    break
+                with conn:
+                    conn.executemany(f"UPDATE {table} SET {column} = ? WHERE id = ?",
+                                     [(self._pack_html(codec.decompress(value)), row_id) for row_id, value in rows])
+                last_id = rows[-1][0]
+                done += len(rows)
+                if progress is not None:
+                    progress(table, done)
+        conn.execute("VACUUM")
+        # WAL 모드에서는 체크포인트를 해야 줄어든 크기가 데이터베이스 파일에 반영됩니다.
+        conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
+    def _create_fts_tables(self):
+        """제목/본문과 댓글 검색을 위한 FTS5 전문 검색 테이블과 동기화 트리거를 생성합니다.
+
+        한국어는 띄어쓰기 단위 토큰화가 잘 맞지 않으므로 trigram 토크나이저를 사용합니다.
+        기존 데이터베이스에 처음 생성하는 경우 기존 행으로 색인을 채웁니다.
+        SQLite가 FTS5나 trigram을 지원하지 않으면 LIKE 검색을 계속 사용합니다.
+        """
+        existing = {row[0] for row in self._execute(
+            "SELECT name FROM sqlite_master WHERE name IN ('posts_fts', 'comments_fts')", fetch='all')}
+        try:
+            self._execute("""
+                CREATE VIRTUAL TABLE IF NOT EXISTS posts_fts
+                USING fts5(title, content, content='posts', content_rowid='id', tokenize='trigram')
+            """)
+            self._execute("""
+                CREATE VIRTUAL TABLE IF NOT EXISTS comments_fts
+                USING fts5(text, content='comments', content_rowid='id', tokenize='trigram')
+            """)
+        except sqlite3.OperationalError:
+            return
+
+        # 원본 테이블이 바뀔 때 색인을 함께 갱신하는 트리거
+        for statement in FTS_TRIGGERS:
+            self._execute(statement)
+        if 'posts_fts' not in existing:
+            self._execute("INSERT INTO posts_fts(posts_fts) VALUES ('rebuild')")
+        if 'comments_fts' not in existing:
+            self._execute("INSERT INTO comments_fts(comments_fts) VALUES ('rebuild')")
+
+    def _has_fts(self) -> bool:
+        """전문 검색 테이블이 준비되어 있는지 확인합니다."""
+        row = self._execute("SELECT COUNT(*) FROM sqlite_master WHERE name IN ('posts_fts', 'comments_fts')", fetch='one')
+        return row[0] == 2
+
+    def get_existing_urls(self, urls: List[str]) -> Set[str]:
+        """주어진 URL 중 이미 posts 테이블에 저장된 URL을 반환합니다.
+
+        posts.url의 UNIQUE 인덱스를 사용하므로 테이블 크기와 무관하게 빠르게 조회됩니다.
+
+        Args:
+            urls (List[str]): 확인할 게시글 URL 리스트.
+
+        Returns:
+            Set[str]: 이미 저장되어 있는 URL 집합.
+        """
+        if not urls:
+            return set()
+        placeholders = ", ".join("?" for _ in urls)
+        query = f"SELECT url FROM posts WHERE url IN ({placeholders})"
+        rows = self._execute(query, tuple(urls), fetch='all')
+        return {row[0] for row in rows}
+
+    def record_failure(self, url: str, error: str):
+        """스크랩에 실패한 게시글 URL을 failed_posts 테이블에 기록합니다.
+
+        Args:
+            url (str): 실패한 게시글 URL.
+            error (str): 오류 내용.
+        """
+        query = """
+            INSERT INTO failed_posts (url, attempts, last_error, last_failed_at)
+            VALUES (?, 1, ?, ?)
+            ON CONFLICT(url) DO UPDATE SET
+                attempts = attempts + 1,
+                last_error = excluded.last_error,
+                last_failed_at = excluded.last_failed_at
+        """
+        self._execute(query, (url, error, datetime.now().strftime(DATETIME_FORMAT)))
+
+    def get_failed_urls(self, max_attempts: int) -> List[str]:
+        """다시 시도할 실패 게시글 URL을 오래된 실패부터 반환합니다.
+
+        Args:
+            max_attempts (int): 이 횟수 이상 실패한 URL은 제외합니다.
+
+        Returns:
+            List[str]: 다시 시도할 게시글 URL 리스트.
+        """
+        query = "SELECT url FROM failed_posts WHERE attempts < ? ORDER BY last_failed_at"
+        return [row[0] for row in self._execute(query, (max_attempts,), fetch='all')]
+
+    def reset_frontier(self):
+        """이전 실행의 URL 프런티어와 진행 상태를 지웁니다."""
+        conn = self._get_connection()
+        with conn:
+            conn.execute("DELETE FROM crawl_queue")
+            conn.execute("DELETE FROM crawl_state")
+
+    def add_to_frontier(self, urls: List[str], board_page: Optional[int]):
+        """수집한 게시글 URL을 pending 상태로 프런티어에 추가하고 마지막으로 읽은 게시판 페이지를 기록합니다.
+
+        Args:
+            urls (List[str]): 추가할 게시글 URL 리스트.
+            board_page (Optional[int]): URL을 수집한 게시판 페이지 번호.
+                None이면 게시판이 아닌 곳(예: 실패 기록)에서 온 URL로 보고 마지막 페이지를 갱신하지 않습니다.
+        """
+        now = datetime.now().strftime(DATETIME_FORMAT)
+        conn = self._get_connection()
+        with conn:
+            conn.executemany(
+                "INSERT INTO crawl_queue (url, status, board_page, updated_at) VALUES (?, ?, ?, ?) ON CONFLICT(url) DO NOTHING",
+                [(url, FRONTIER_PENDING, board_page, now) for url in urls],
+            )
+            if board_page is not None:
+                conn.execute("INSERT OR REPLACE INTO crawl_state (key, value) VALUES ('last_board_page', ?)", (str(board_page),))
+
+    def set_frontier_status(self, url: str, status: str):
+        """프런티어에 있는 URL의 상태를 변경합니다.
+
+        Args:
+            url (str): 게시글 URL.
+            status (str): FRONTIER_PENDING, FRONTIER_IN_FLIGHT, FRONTIER_DONE, FRONTIER_FAILED 중 하나.
+        """
+        query = "UPDATE crawl_queue SET status = ?, updated_at = ? WHERE url = ?"
+        self._execute(query, (status, datetime.now().strftime(DATETIME_FORMAT), url))
+
+    def load_frontier(self) -> Tuple[List[str], List[str], int]:
+        """중단된 크롤링을 재개하기 위해 프런티어를 불러옵니다.
+
+        처리 중(in_flight)이던 URL은 완료되지 않았으므로 pending으로 되돌립니다.
+
+        Returns:
+            Tuple[List[str], List[str], int]: (프런티어의 모든 URL, 다시 처리할 pending URL, 마지막으로 읽은 게시판 페이지).
+        """
+        conn = self._get_connection()
+        with conn:
+            conn.execute("UPDATE crawl_queue SET status = ? WHERE status = ?", (FRONTIER_PENDING, FRONTIER_IN_FLIGHT))
+            rows = conn.execute("SELECT url, status FROM crawl_queue ORDER BY id").fetchall()
+            state = conn.execute("SELECT value FROM crawl_state WHERE key = 'last_board_page'").fetchone()
+        all_urls = [url for url, _ in rows]
+        pending_urls = [url for url, status in rows if status == FRONTIER_PENDING]
+        return all_urls, pending_urls, int(state[0]) if state else 0
+
+    def get_image_hashes(self, urls: List[str]) -> Dict[str, str]:
+        """이미지 URL 중 이미 저장된 것의 URL→해시 매핑을 반환합니다.
+
+        Args:
+            urls (List[str]): 확인할 이미지 URL 리스트.
+
+        Returns:
+            Dict[str, str]: 저장된 이미지의 URL과 내용 해시.
+        """
+        hashes = {}
+        urls = list(dict.fromkeys(urls))
+        for i in range(0, len(urls), MAX_QUERY_PARAMS):
+            chunk = urls[i:i + MAX_QUERY_PARAMS]
+            placeholders = ', '.join('?' * len(chunk))
+            rows = self._execute(f"SELECT url, hash FROM image_sources WHERE url IN ({placeholders})", chunk, fetch='all')
+            hashes.update(rows)
+        return hashes
+
+    def record_image(self, url: str, image_hash: str, size: int) -> bool:
+        """다운로드한 이미지의 URL→해시 매핑과 파일 정보를 기록합니다.
+
+        Args:
+            url (str): 이미지 URL.
+            image_hash (str): 이미지 내용의 해시.
+            size (int): 이미지 파일 크기(바이트).
+
+        Returns:
+            bool: 같은 내용의 이미지가 없어 새 파일로 기록되었으면 True.
+        """
+        now = datetime.now().strftime(DATETIME_FORMAT)
+        conn = self._get_connection()
+        with conn:
+            is_new = conn.execute("SELECT 1 FROM image_files WHERE hash = ?", (image_hash,)).fetchone() is None
+            conn.execute(
+                "INSERT INTO image_files (hash, size, last_accessed) VALUES (?, ?, ?) ON CONFLICT(hash) DO UPDATE SET last_accessed = excluded.last_accessed",
+                (image_hash, size, now),
+            )
+            conn.execute("INSERT OR REPLACE INTO image_sources (url, hash) VALUES (?, ?)", (url, image_hash))
+        return is_new
+
+    def touch_images(self, hashes: List[str]):
+        """이미지를 조회했음을 기록하여 LRU 삭제 순서에서 뒤로 보냅니다."""
+        now = datetime.now().strftime(DATETIME_FORMAT)
+        conn = self._get_connection()
+        with conn:
+            conn.executemany("UPDATE image_files SET last_accessed = ? WHERE hash = ?", [(now, h) for h in set(hashes)])
+
+    def get_image_store_size(self) -> int:
+        """이미지 저장소에 기록된 파일 크기의 합계(바이트)를 반환합니다."""
+        return self._execute("SELECT COALESCE(SUM(size), 0) FROM image_files", fetch='one')[0]
+
+    def get_least_recent_images(self, count: int) -> List[Tuple[str, int]]:
+        """가장 오래 조회되지 않은 이미지의 (해시, 크기) 리스트를 반환합니다."""
+        return self._execute("SELECT hash, size FROM image_files ORDER BY last_accessed, hash LIMIT ?", (count,), fetch='all')
+
+    def delete_images(self, hashes: List[str]):
+        """이미지를 색인에서 삭제합니다. 삭제된 이미지를 가리키던 URL 매핑도 함께 지워 다음에 다시 다운로드되게 합니다."""
+        conn = self._get_connection()
+        with conn:
+            conn.executemany("DELETE FROM image_sources WHERE hash = ?", [(h,) for h in hashes])
+            conn.executemany("DELETE FROM image_files WHERE hash = ?", [(h,) for h in hashes])
 
     def insert_post(self, post: Post) -> Optional[int]:
         """게시글 데이터를 데이터베이스에 삽입합니다."""
         query = """
-            INSERT INTO posts (title, url, content, content_html, image_urls, post_created)
-            VALUES (?, ?, ?, ?, ?, ?)
+            INSERT INTO posts (title, url, content, content_html, image_urls, post_created, content_hash)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
         """
         image_urls_json = json.dumps(post.image_urls)
-        params = (post.title, post.url, post.content, post.content_html, image_urls_json, post.post_created)
+        params = (post.title, post.url, post.content, self._pack_html(post.content_html), image_urls_json, post.post_created,
+                  content_hash(post.title, post.content))
         try:
             return self._execute(query, params)
         except sqlite3.IntegrityError:
@@ -77,44 +573,351 @@ class DatabaseManager:
     def insert_comment(self, comment: Comment):
         """댓글 데이터를 데이터베이스에 삽입합니다."""
         query = """
-            INSERT INTO comments (post_id, html, text, comment_created)
-            VALUES (?, ?, ?, ?)
+            INSERT INTO comments (post_id, html, text, comment_created, fingerprint)
+            VALUES (?, ?, ?, ?, ?)
         """
-        params = (comment.post_id, comment.html, comment.text, comment.comment_created)
+        params = (comment.post_id, self._pack_html(comment.html), comment.text, comment.comment_created,
+                  comment_fingerprint(comment.text, comment.comment_created))
         self._execute(query, params)
+        self._execute("UPDATE posts SET comment_count = comment_count + 1 WHERE id = ?", (comment.post_id,))
+
+    def insert_post_with_comments(self, post: Post, comments: List[Comment]) -> Optional[int]:
+        """게시글과 그 댓글을 하나의 트랜잭션으로 삽입합니다.
+
+        Args:
+            post (Post): 삽입할 게시글.
+            comments (List[Comment]): 게시글에 속한 댓글 리스트.
+
+        Returns:
+            Optional[int]: 삽입된 게시글의 ID. 이미 저장된 URL이면 None.
+        """
+        return self.insert_posts_with_comments([(post, comments)])[0]
+
+    def insert_posts_with_comments(self, batch: List[Tuple[Post, List[Comment]]]) -> List[Optional[int]]:
+        """여러 게시글과 댓글을 하나의 트랜잭션으로 일괄 삽입합니다.
+
+        댓글은 executemany로 한 번에 삽입되며, 이미 저장된 URL의 게시글과 그 댓글은 건너뜁니다.
+
+        Args:
+            batch (List[Tuple[Post, List[Comment]]]): (게시글, 댓글 리스트) 튜플의 리스트.
+
+        Returns:
+            List[Optional[int]]: batch와 같은 순서의 게시글 ID 리스트. 건너뛴 게시글은 None.
+        """
+        post_ids = []
+        conn = self._get_connection()
+        with conn:
+            cursor = conn.cursor()
+            for post, comments in batch:
+                post_ids.append(self._insert_post(cursor, post, comments))
+            # 저장에 성공한 게시글은 실패 기록에서 제거합니다.
+            cursor.executemany("DELETE FROM failed_posts WHERE url = ?", [(post.url,) for post, _ in batch])
+            cursor.executemany("UPDATE crawl_queue SET status = ? WHERE url = ?", [(FRONTIER_DONE, post.url) for post, _ in batch])
+        return post_ids
+
+    def _row_to_post(self, row) -> Post:
+        """posts 테이블의 조회 결과 한 행을 Post 객체로 변환합니다. 압축된 HTML은 복원합니다."""
+        post_id, title, url, content, content_html, image_urls_json, post_created = row
+        image_urls = json.loads(image_urls_json) if image_urls_json else []
+        return Post(id=post_id, title=title, url=url, content=content, content_html=self.codec.decompress(content_html),
+                    image_urls=image_urls, post_created=post_created)
+
+    def _attach_comments(self, posts: List[Post]):
+        """게시글 리스트의 댓글을 한 번에 조회하여 각 게시글에 채워 넣습니다.
+
+        게시글마다 쿼리를 실행하지 않고, ID를 SQLite 변수 개수 제한 이내의 묶음으로 나누어 조회합니다.
+        """
+        posts_by_id = {post.id: post for post in posts}
+        post_ids = list(posts_by_id)
+        for start in range(0, len(post_ids), MAX_QUERY_PARAMS):
+            chunk = post_ids[start:start + MAX_QUERY_PARAMS]
+            placeholders = ", ".join("?" for _ in chunk)
+            query = f"SELECT html, text, comment_created, post_id FROM comments WHERE post_id IN ({placeholders}) ORDER BY post_id, id"
+            for row in self._execute(query, tuple(chunk), fetch='all'):
+                posts_by_id[row[3]].comments.append(Comment(html=self.codec.decompress(row[0]), text=row[1], comment_created=row[2], post_id=row[3]))
+
+    def _insert_post(self, cursor: sqlite3.Cursor, post: Post, comments: List[Comment]) -> Optional[int]:
+        """현재 트랜잭션에서 게시글과 댓글을 삽입합니다. 이미 저장된 URL이면 None을 반환합니다."""
+        query = """
+            INSERT INTO posts (title, url, content, content_html, image_urls, post_created, content_hash, comment_count)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(url) DO NOTHING
+        """
+        params = (post.title, post.url, post.content, self._pack_html(post.content_html), json.dumps(post.image_urls), post.post_created,
+                  content_hash(post.title, post.content), len(comments))
+        cursor.execute(query, params)
+        if cursor.rowcount == 0:
+            return None
+        post_id = cursor.lastrowid
+        self._insert_comments(cursor, post_id, comments)
+        return post_id
+
+    def _insert_comments(self, cursor: sqlite3.Cursor, post_id: int, comments: List[Comment]):
+        """현재 트랜잭션에서 게시글의 댓글을 executemany로 삽입합니다."""
+        for comment in comments:
+            comment.post_id = post_id
+        cursor.executemany(
+            "INSERT INTO comments (post_id, html, text, comment_created, fingerprint) VALUES (?, ?, ?, ?, ?)",
+            [(post_id, self._pack_html(c.html), c.text, c.comment_created, comment_fingerprint(c.text, c.comment_created)) for c in comments],
+        )
+
+    def get_posts_for_refresh(self, since: str, limit: int) -> List[str]:
+        """새로 고침할 최근 게시글의 URL을 최신순으로 반환합니다.
+
+        Args:
+            since (str): 이 시각(YYYY-MM-DD HH:MM:SS) 이후에 작성된 게시글만 대상으로 합니다.
+            limit (int): 최대 게시글 수.
+
+        Returns:
+            List[str]: 게시글 URL 리스트.
+        """
+        query = "SELECT url FROM posts WHERE post_created >= ? ORDER BY post_created DESC LIMIT ?"
+        return [row[0] for row in self._execute(query, (since, limit), fetch='all')]
+
+    def refresh_posts(self, batch: List[Tuple[Post, List[Comment]]]) -> List[List[Comment]]:
+        """다시 스크랩한 게시글을 기존 행에 반영합니다.
+
+        본문 해시가 바뀐 경우에만 게시글을 갱신하고, 댓글은 지문(fingerprint)별 개수로 비교하여
+        아직 저장되지 않은 댓글만 삽입합니다. 같은 지문의 댓글이 저장된 개수보다 많으면 그만큼을 새 댓글로 봅니다
+        (같은 분에 작성된 "ㅋㅋㅋ" 같은 댓글). 저장되어 있지 않은 게시글은 새로 삽입합니다.
+
+        Args:
+            batch (List[Tuple[Post, List[Comment]]]): (게시글, 댓글 리스트) 튜플의 리스트.
+
+        Returns:
+            List[List[Comment]]: batch와 같은 순서의, 게시글마다 새로 추가된 댓글 리스트.
+        """
+        update_query = """
+            UPDATE posts SET title = ?, content = ?, content_html = ?, image_urls = ?, content_hash = ?
+            WHERE id = ?
+        """
+        added = []
+        now = datetime.now().strftime(DATETIME_FORMAT)
+        conn = self._get_connection()
+        with conn:
+            cursor = conn.cursor()
+            for post, comments in batch:
+                row = cursor.execute("SELECT id, content_hash FROM posts WHERE url = ?", (post.url,)).fetchone()
+                if row is None:
+                    post.id = self._insert_post(cursor, post, comments)
+                    added.append(comments)
+                    continue
+                post_id, stored_hash = row
+                post.id = post_id
+                new_hash = content_hash(post.title, post.content)
+                if new_hash != stored_hash:
+                    cursor.execute(update_query, (post.title, post.content, self._pack_html(post.content_html), json.dumps(post.image_urls), new_hash, post_id))
+
+                known = Counter(r[0] for r in cursor.execute("SELECT fingerprint FROM comments WHERE post_id = ?", (post_id,)))
+                new_comments = []
+                for comment in comments:
+                    fingerprint = comment_fingerprint(comment.text, comment.comment_created)
+                    if known[fingerprint] > 0:
+                        known[fingerprint] -= 1 # 저장된 댓글 하나와 짝지음
+                    else:
+                        new_comments.append(comment)
+                self._insert_comments(cursor, post_id, new_comments)
+                cursor.execute(
+                    "UPDATE posts SET comment_count = comment_count + ?, refreshed_at = ? WHERE id = ?",
+                    (len(new_comments), now, post_id),
+                )
+                added.append(new_comments)
+        return added
+
+    def iter_post_html(self, chunk_size: int = COMPACT_CHUNK_SIZE, after_id: int = 0):
+        """게시글을 ID 순서로 chunk_size개씩 읽어 (id, title, content, content_html, image_urls) 행 리스트를 생성합니다.
+
+        content_html은 압축된 저장 형식 그대로 반환하므로 복원은 호출하는 쪽(작업자 프로세스 등)에서 합니다.
+        """
+        yield from self._iter_chunks("SELECT id, title, content, content_html, image_urls FROM posts", chunk_size, after_id)
+
+    def iter_comment_html(self, chunk_size: int = COMPACT_CHUNK_SIZE, after_id: int = 0):
+        """댓글을 ID 순서로 chunk_size개씩 읽어 (id, html, text, comment_created) 행 리스트를 생성합니다."""
+        yield from self._iter_chunks("SELECT id, html, text, comment_created FROM comments", chunk_size, after_id)
+
+    def _iter_chunks(self, select: str, chunk_size: int, after_id: int):
+        """id 키셋으로 테이블 전체를 나누어 읽습니다. 읽는 도중 같은 연결로 갱신해도 안전합니다."""
+        conn = self._get_connection()
+        while True:
+            rows = conn.execute(f"{select} WHERE id > ? ORDER BY id LIMIT ?", (after_id, chunk_size)).fetchall()
+            if not rows:
+                return
+            yield rows
+            after_id = rows[-1][0]
+
+    def update_extracted_posts(self, rows: List[Tuple[int, str, str, List[str]]]):
+        """다시 추출한 게시글의 본문 텍스트와 이미지 URL을 한 트랜잭션으로 갱신합니다.
+
+        Args:
+            rows (List[Tuple[int, str, str, List[str]]]): (게시글 ID, 제목, 본문 텍스트, 이미지 URL 리스트) 튜플의 리스트.
+                제목은 본문 해시를 다시 계산하는 데 사용합니다.
+        """
+        conn = self._get_connection()
+        with conn:
+            conn.executemany(
+                "UPDATE posts SET content = ?, image_urls = ?, content_hash = ? WHERE id = ?",
+                [(content, json.dumps(image_urls), content_hash(title, content), post_id)
+                 for post_id, title, content, image_urls in rows],
+            )
+
+    def update_extracted_comments(self, rows: List[Tuple[int, str, Optional[str]]]):
+        """다시 추출한 댓글의 텍스트와 작성일을 한 트랜잭션으로 갱신합니다.
+
+        Args:
+            rows (List[Tuple[int, str, Optional[str]]]): (댓글 ID, 텍스트, 작성일) 튜플의 리스트.
+        """
+        conn = self._get_connection()
+        with conn:
+            conn.executemany(
+                "UPDATE comments SET text = ?, comment_created = ?, fingerprint = ? WHERE id = ?",
+                [(text, created, comment_fingerprint(text, created), comment_id) for comment_id, text, created in rows],
+            )
 
-    def get_all_posts(self) -> List[Post]:
-        """데이터베이스에서 모든 게시글을 조회합니다."""
+    def get_all_posts(self, with_comments: bool = True) -> List[Post]:
+        """데이터베이스에서 모든 게시글을 조회합니다.
+
+        Args:
+            with_comments (bool): 댓글까지 함께 조회할지 여부. False이면 필요할 때
+                get_comments_for_post로 따로 조회합니다.
+
+        Returns:
+            List[Post]: 게시글 리스트.
+        """
         query = "SELECT id, title, url, content, content_html, image_urls, post_created FROM posts"
-        rows = self._execute(query, fetch='all')
-        posts = []
-        for row in rows:
-            post_id, title, url, content, content_html, image_urls_json, post_created = row
-            image_urls = json.loads(image_urls_json) if image_urls_json else []
-            comments = self.get_comments_for_post(post_id)
-            posts.append(Post(id=post_id, title=title, url=url, content=content, content_html=content_html, image_urls=image_urls, post_created=post_created, comments=comments))
+        posts = [self._row_to_post(row) for row in self._execute(query, fetch='all')]
+        if with_comments:
+            self._attach_comments(posts)
         return posts
 
     def get_comments_for_post(self, post_id: int) -> List[Comment]:
         """특정 게시글의 댓글을 조회합니다."""
-        query = "SELECT html, text, comment_created, post_id FROM comments WHERE post_id = ?"
+        query = "SELECT html, text, comment_created, post_id FROM comments WHERE post_id = ? ORDER BY id"
         rows = self._execute(query, (post_id,), fetch='all')
-        return [Comment(html=row[0], text=row[1], comment_created=row[2], post_id=row[3]) for row in rows]
+        return [Comment(html=self.codec.decompress(row[0]), text=row[1], comment_created=row[2], post_id=row[3]) for row in rows]
 
-    def search_posts(self, start_date: str, end_date: str, keyword: Optional[str] = None) -> List[Post]:
-        """지정된 기간과 키워드로 게시글을 검색합니다."""
-        query = "SELECT id, title, url, content, content_html, image_urls, post_created FROM posts WHERE post_created BETWEEN ? AND ?"
-        params = [start_date, end_date]
+    def _build_search_query(self, columns: str, start_date: str, end_date: str, keyword: Optional[str],
+                            search_comments: bool, select_order_key: bool = False) -> Tuple[str, List, str]:
+        """search_posts와 search_post_summaries가 공유하는 검색 쿼리를 만듭니다.
 
+        select_order_key가 True이면 columns 뒤에 정렬 키 컬럼을 추가로 조회합니다.
+
+        Returns:
+            Tuple[str, List, str]: (ORDER BY 없는 쿼리, 바인딩 값, 정렬 키 표현식).
+                정렬 키는 키셋 페이지네이션에 쓸 수 있도록 항상 p.id로 끝납니다.
+        """
+        if keyword and len(keyword) >= FTS_MIN_KEYWORD_LENGTH and self._has_fts():
+            order_key = "h.score, p.id"
+            if select_order_key:
+                columns += f", {order_key}"
+            # 키워드를 하나의 구문으로 취급하여 LIKE '%kw%'와 같은 부분 문자열 검색이 되도록 합니다.
+            match = '"' + keyword.replace('"', '""') + '"'
+            hits = "SELECT rowid AS post_id, bm25(posts_fts, 10.0, 1.0) AS score FROM posts_fts WHERE posts_fts MATCH ?"
+            params = [match]
+            if search_comments:
+                hits += """
+                    UNION ALL
+                    SELECT c.post_id, bm25(comments_fts) FROM comments_fts
+                    JOIN comments c ON c.id = comments_fts.rowid
+                    WHERE comments_fts MATCH ?
+                """
+                params.append(match)
+            # LIMIT -1은 서브쿼리가 GROUP BY로 평탄화되어 bm25()를 쓸 수 없게 되는 것을 막습니다.
+            query = f"""
+                SELECT {columns} FROM posts p
+                JOIN (SELECT post_id, MIN(score) AS score FROM ({hits} LIMIT -1) GROUP BY post_id) h ON h.post_id = p.id
+                WHERE p.post_created >= ? AND p.post_created < ?
+            """
+            params.extend([start_date, end_date])
+            return query, params, order_key
+
+        order_key = "p.post_created, p.id"
+        if select_order_key:
+            columns += f", {order_key}"
+        query = f"SELECT {columns} FROM posts p WHERE p.post_created >= ? AND p.post_created < ?"
+        params = [start_date, end_date]
         if keyword:
-            query += " AND (title LIKE ? OR content LIKE ?)"
-            params.extend([f'%{keyword}%', f'%{keyword}%'])
+            like = f'%{keyword}%'
+            if search_comments:
+                query += " AND (p.title LIKE ? OR p.content LIKE ? OR p.id IN (SELECT post_id FROM comments WHERE text LIKE ?))"
+                params.extend([like, like, like])
+            else:
+                query += " AND (p.title LIKE ? OR p.content LIKE ?)"
+                params.extend([like, like])
+        return query, params, order_key
+
+    def search_post_summaries(self, start_date: str, end_date: str, keyword: Optional[str] = None,
+                              search_comments: bool = False, after: Optional[Tuple] = None,
+                              page_size: int = PAGE_SIZE) -> Tuple[List[PostSummary], Optional[Tuple]]:
+        """search_posts와 같은 조건으로 게시글 목록을 한 페이지씩 조회합니다.
+
+        목록 표시에 필요한 ID, 제목, 작성일만 읽으며, OFFSET 대신 마지막 행의 정렬 키 이후부터 읽는
+        키셋 페이지네이션을 사용하므로 뒤쪽 페이지도 첫 페이지와 같은 비용으로 조회됩니다.
+
+        Args:
+            start_date (str): 검색 시작 날짜 (포함, YYYY-MM-DD).
+            end_date (str): 검색 종료 날짜 (미포함, YYYY-MM-DD).
+            keyword (Optional[str]): 제목 또는 내용에서 검색할 키워드.
+            search_comments (bool): 댓글 내용에서도 키워드를 검색할지 여부.
+            after (Optional[Tuple]): 이전 호출이 반환한 다음 페이지 커서. None이면 첫 페이지를 조회합니다.
+            page_size (int): 한 페이지의 최대 게시글 수.
+
+        Returns:
+            Tuple[List[PostSummary], Optional[Tuple]]: (게시글 목록, 다음 페이지 커서). 마지막 페이지면 커서는 None.
+        """
+        # 정렬 키를 함께 읽어 다음 페이지 커서로 사용합니다.
+        query, params, order_key = self._build_search_query("p.id, p.title, p.post_created", start_date, end_date,
+                                                            keyword, search_comments, select_order_key=True)
+        if after is not None:
+            query += f" AND ({order_key}) > ({', '.join('?' * len(after))})"
+            params.extend(after)
+        query += f" ORDER BY {order_key} LIMIT ?"
+        params.append(page_size + 1) # 다음 페이지가 있는지 알기 위해 한 행 더 읽습니다.
 
         rows = self._execute(query, tuple(params), fetch='all')
-        posts = []
-        for row in rows:
-            post_id, title, url, content, content_html, image_urls_json, post_created = row
-            image_urls = json.loads(image_urls_json) if image_urls_json else []
-            comments = self.get_comments_for_post(post_id)
-            posts.append(Post(title=title, url=url, content=content, content_html=content_html, image_urls=image_urls, post_created=post_created, comments=comments))
+        next_cursor = tuple(rows[page_size - 1][3:]) if len(rows) > page_size else None
+        summaries = [PostSummary(id=row[0], title=row[1], post_created=row[2]) for row in rows[:page_size]]
+        return summaries, next_cursor
+
+    def get_post(self, post_id: int, with_comments: bool = True) -> Optional[Post]:
+        """ID로 게시글 하나를 본문(과 댓글)까지 조회합니다.
+
+        Args:
+            post_id (int): 게시글 ID.
+            with_comments (bool): 댓글까지 함께 조회할지 여부.
+
+        Returns:
+            Optional[Post]: 게시글. 없으면 None.
+        """
+        query = "SELECT id, title, url, content, content_html, image_urls, post_created FROM posts WHERE id = ?"
+        row = self._execute(query, (post_id,), fetch='one')
+        if row is None:
+            return None
+        post = self._row_to_post(row)
+        if with_comments:
+            post.comments = self.get_comments_for_post(post_id)
+        return post
+
+    def search_posts(self, start_date: str, end_date: str, keyword: Optional[str] = None, with_comments: bool = True,
+                     search_comments: bool = False) -> List[Post]:
+        """지정된 기간과 키워드로 게시글을 검색합니다.
+
+        키워드가 있으면 FTS5 전문 검색 색인을 사용하여 관련도(bm25) 순으로 정렬합니다.
+        trigram 색인으로 찾을 수 없는 짧은 키워드(2글자 이하)는 LIKE 검색을 사용합니다.
+
+        Args:
+            start_date (str): 검색 시작 날짜 (포함, YYYY-MM-DD).
+            end_date (str): 검색 종료 날짜 (미포함, YYYY-MM-DD).
+            keyword (Optional[str]): 제목 또는 내용에서 검색할 키워드.
+            with_comments (bool): 댓글까지 함께 조회할지 여부.
+            search_comments (bool): 댓글 내용에서도 키워드를 검색할지 여부.
+
+        Returns:
+            List[Post]: 검색된 게시글 리스트.
+        """
+        columns = "p.id, p.title, p.url, p.content, p.content_html, p.image_urls, p.post_created"
+        query, params, order_key = self._build_search_query(columns, start_date, end_date, keyword, search_comments)
+        query += f" ORDER BY {order_key}"
+        posts = [self._row_to_post(row) for row in self._execute(query, tuple(params), fetch='all')]
+        if with_comments:
+            self._attach_comments(posts)
         return posts
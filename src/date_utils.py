@@ -0,0 +1,48 @@
+import re
+from datetime import datetime
+from typing import Optional
+
+# 데이터베이스에 저장하는 날짜 형식 (ISO-8601, 문자열 순서 = 시간 순서)
+DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# "25.07.23 (14:30:21)", "2025-07-23 14:30", "14:30" 등 루리웹에서 쓰이는 날짜 표기
+_DATETIME_PATTERN = re.compile(
+    r"^(?:(?P<year>\d{4}|\d{2})[.\-/](?P<month>\d{1,2})[.\-/](?P<day>\d{1,2}))?"
+    r"\s*\(?\s*(?:(?P<hour>\d{1,2}):(?P<minute>\d{2})(?::(?P<second>\d{2}))?)?\s*\)?$"
+)
+
+
+def normalize_datetime(date_string: Optional[str], reference: Optional[datetime] = None) -> Optional[str]:
+    """루리웹의 다양한 날짜 표기를 "YYYY-MM-DD HH:MM:SS" 형식으로 변환합니다.
+
+    시간만 있는 표기(예: 오늘 작성된 댓글의 "14:30")는 reference의 날짜를 사용합니다.
+
+    Args:
+        date_string (Optional[str]): 변환할 날짜 문자열.
+        reference (Optional[datetime]): 날짜가 생략된 경우 사용할 기준 시각 (기본값: 현재 시각).
+
+    Returns:
+        Optional[str]: 변환된 날짜 문자열. 해석할 수 없으면 None.
+    """
+    if not date_string:
+        return None
+    match = _DATETIME_PATTERN.match(date_string.strip())
+    if not match or not (match.group("year") or match.group("hour")):
+        return None
+
+    if match.group("year"):
+        year = int(match.group("year"))
+        if year < 100:
+            year += 2000 # 2자리 연도는 20xx 년대로 가정
+        month, day = int(match.group("month")), int(match.group("day"))
+    else:
+        reference = reference or datetime.now()
+        year, month, day = reference.year, reference.month, reference.day
+
+    hour = int(match.group("hour") or 0)
+    minute = int(match.group("minute") or 0)
+    second = int(match.group("second") or 0)
+    try:
+        return datetime(year, month, day, hour, minute, second).strftime(DATETIME_FORMAT)
+    except ValueError:
+        return None
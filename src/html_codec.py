@@ -0,0 +1,146 @@
+import re
+import struct
+import threading
+import zlib
+from typing import Callable, Dict, List, Optional, Union
+
+try:
+    import zstandard
+except ImportError: # zstandard가 없으면 zlib으로 압축합니다.
+    zstandard = None
+
+ZSTD_LEVEL = 9 # zstd 압축 수준
+ZLIB_LEVEL = 9 # zlib 압축 수준
+DICTIONARY_SIZE = 112 * 1024 # 학습할 zstd 사전의 크기(바이트)
+
+# 저장 형식: 첫 바이트로 압축 방식을 구분합니다. 문자열(str)로 저장된 값은 압축되지 않은 이전 형식입니다.
+_ZSTD_MARKER = b'Z' # b'Z' + 사전 ID(4바이트, 0이면 사전 없음) + zstd 프레임
+_ZLIB_MARKER = b'z' # b'z' + zlib 데이터
+_DICT_ID = struct.Struct('>I')
+
+# 화면 표시에 쓰이지 않는 마크업
+_BOILERPLATE_PATTERNS = [
+    re.compile(r'<!--.*?-->', re.DOTALL),
+    re.compile(r'<(script|style|noscript)\b[^>]*>.*?</\1\s*>', re.IGNORECASE | re.DOTALL),
+    # 이벤트 핸들러와 data-* 속성
+    re.compile(r'\s(?:on[a-z]+|data-[\w-]+)\s*=\s*(?:"[^"]*"|\'[^\']*\'|[^\s>]+)', re.IGNORECASE),
+]
+_TAG_GAP_PATTERN = re.compile(r'>\s{2,}<')
+
+
+def strip_boilerplate(html: Optional[str]) -> Optional[str]:
+    """HTML에서 화면 표시에 영향을 주지 않는 주석, 스크립트, 스타일 태그와 이벤트/data-* 속성을 제거합니다."""
+    if not html:
+        return html
+    for pattern in _BOILERPLATE_PATTERNS:
+        html = pattern.sub('', html)
+    return _TAG_GAP_PATTERN.sub('> <', html).strip()
+
+
+def train_dictionary(samples: List[str], size: int = DICTIONARY_SIZE) -> Optional[bytes]:
+    """HTML 샘플로 zstd 압축 사전을 학습합니다.
+
+    Args:
+        samples (List[str]): 학습에 사용할 HTML 문자열 리스트.
+        size (int): 사전 크기(바이트).
+
+    Returns:
+        Optional[bytes]: 학습된 사전. zstandard가 없거나 샘플이 부족해 학습할 수 없으면 None.
+    """
+    if zstandard is None:
+        return None
+    try:
+        return zstandard.train_dictionary(size, [s.encode('utf-8') for s in samples if s]).as_bytes()
+    except zstandard.ZstdError:
+        return None
+
+
+class HtmlCodec:
+    """HTML 컬럼 값을 압축하고 복원하는 클래스
+
+    zstandard가 있으면 가장 최근에 학습된 공유 사전으로 zstd 압축하고, 없으면 zlib으로 압축합니다.
+    이전 사전으로 압축된 값도 복원할 수 있도록 사전은 ID별로 보관합니다.
+    """
+    def __init__(self, dictionaries: Optional[Dict[int, bytes]] = None,
+                 loader: Optional[Callable[[], Dict[int, bytes]]] = None):
+        """HtmlCodec을 초기화합니다.
+
+        Args:
+            dictionaries (Optional[Dict[int, bytes]]): 사전 ID와 zstd 사전 데이터.
+            loader (Optional[Callable[[], Dict[int, bytes]]]): 저장된 사전을 다시 읽는 함수. 있으면 모르는 사전 ID로
+                압축된 값을 만났을 때(다른 프로세스가 새 사전을 학습한 경우) 사전을 다시 읽은 뒤 복원합니다.
+        """
+        self._dictionaries: Dict[int, 'zstandard.ZstdCompressionDict'] = {}
+        self.dictionary_id = 0
+        self._loader = loader
+        # zstd 압축기/복원기는 스레드 간에 공유할 수 없으므로 스레드마다 만듭니다.
+        self._local = threading.local()
+        for dictionary_id, data in (dictionaries or {}).items():
+            self.add_dictionary(dictionary_id, data)
+
+    def add_dictionary(self, dictionary_id: int, data: bytes):
+        """사전을 등록하고, 가장 큰 ID의 사전을 이후 압축에 사용합니다."""
+        if zstandard is None:
+            return
+        self._dictionaries[dictionary_id] = zstandard.ZstdCompressionDict(data)
+        self.dictionary_id = max(self.dictionary_id, dictionary_id)
+        self._local = threading.local()
+
+    @property
+    def supports_dictionaries(self) -> bool:
+        """zstd 사전을 사용할 수 있는지 여부 (zstandard가 없으면 zlib만 사용하므로 사전 학습이 의미 없습니다)."""
+        return zstandard is not None
+
+    def reload_dictionaries(self) -> bool:
+        """loader로 사전을 다시 읽어 아직 등록되지 않은 사전을 추가합니다. 추가한 사전이 있으면 True."""
+        if self._loader is None or zstandard is None:
+            return False
+        added = False
+        for dictionary_id, data in self._loader().items():
+            if dictionary_id not in self._dictionaries:
+                self.add_dictionary(dictionary_id, data)
+                added = True
+        return added
+
+    def _compressor(self):
+        compressor = getattr(self._local, 'compressor', None)
+        if compressor is None:
+            dictionary = self._dictionaries.get(self.dictionary_id)
+            compressor = self._local.compressor = zstandard.ZstdCompressor(level=ZSTD_LEVEL, dict_data=dictionary)
+        return compressor
+
+    def _decompressor(self, dictionary_id: int):
+        decompressors = getattr(self._local, 'decompressors', None)
+        if decompressors is None:
+            decompressors = self._local.decompressors = {}
+        decompressor = decompressors.get(dictionary_id)
+        if decompressor is None:
+            if dictionary_id and dictionary_id not in self._dictionaries:
+                if self.reload_dictionaries() and dictionary_id in self._dictionaries:
+                    return self._decompressor(dictionary_id) # 사전을 추가하면 스레드별 복원기가 초기화됩니다.
+                raise ValueError(f"압축 사전 {dictionary_id}을(를) 찾을 수 없습니다.")
+            decompressor = decompressors[dictionary_id] = zstandard.ZstdDecompressor(dict_data=self._dictionaries.get(dictionary_id))
+        return decompressor
+
+    def compress(self, html: Optional[str]) -> Optional[bytes]:
+        """HTML 문자열을 저장 형식으로 압축합니다."""
+        if html is None:
+            return None
+        data = html.encode('utf-8')
+        if zstandard is None:
+            return _ZLIB_MARKER + zlib.compress(data, ZLIB_LEVEL)
+        return _ZSTD_MARKER + _DICT_ID.pack(self.dictionary_id) + self._compressor().compress(data)
+
+    def decompress(self, value: Union[str, bytes, None]) -> Optional[str]:
+        """저장된 값을 HTML 문자열로 복원합니다. 압축되지 않은 이전 형식의 문자열은 그대로 반환합니다."""
+        if value is None or isinstance(value, str):
+            return value
+        marker = value[:1]
+        if marker == _ZLIB_MARKER:
+            return zlib.decompress(value[1:]).decode('utf-8')
+        if marker == _ZSTD_MARKER:
+            if zstandard is None:
+                raise RuntimeError("zstd로 압축된 HTML을 읽으려면 zstandard 패키지가 필요합니다.")
+            dictionary_id = _DICT_ID.unpack_from(value, 1)[0]
+            return self._decompressor(dictionary_id).decompress(value[1 + _DICT_ID.size:]).decode('utf-8')
+        raise ValueError("알 수 없는 HTML 저장 형식입니다.")
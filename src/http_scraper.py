@@ -0,0 +1,314 @@
+import asyncio
+import re
+from datetime import datetime
+from typing import Callable, List, Optional, Tuple
+
+import httpx
+from selectolax.lexbor import LexborHTMLParser
+
+from .constants import MOBILE_USER_AGENT
+from .date_utils import normalize_datetime
+from .metrics import NULL_METRICS, Metrics
+from .models import Post, Comment
+from .page_cache import PageCache, PageCacheMissError
+from .scraper import BASE_URL, RuliwebScraper, ScraperHTTPError
+
+# 게시글의 전체 댓글 수를 표시하는 요소. 정적 HTML의 댓글이 이보다 적으면 나머지는 스크롤할 때 스크립트로 로드됩니다.
+COMMENT_COUNT_SELECTOR = ".comment_count"
+_DIGITS_PATTERN = re.compile(r"\d+")
+
+
+class JavaScriptRequiredError(Exception):
+    """정적 HTML만으로는 필요한 요소를 찾을 수 없어 브라우저 렌더링이 필요한 경우 발생하는 예외"""
+
+
+def _inner_text(node) -> str:
+    """브라우저의 innerText와 비슷하게 줄바꿈을 살려 노드의 텍스트를 추출합니다.
+
+    노드를 직접 수정하므로 inner_html이 필요하다면 먼저 읽어 두어야 합니다.
+    """
+    for br in node.css("br"):
+        br.replace_with("\n")
+    for block in node.css("p, div, li"):
+        block.insert_after("\n")
+    return node.text(deep=True)
+
+
+def parse_post_urls(html: str, base_url: str = RuliwebScraper.BASE_URL) -> List[str]:
+    """게시판 HTML에서 게시글 URL 목록을 추출합니다.
+
+    Args:
+        html (str): 게시판 페이지의 HTML.
+        base_url (str): 상대 경로 링크에 붙일 기본 URL.
+
+    Returns:
+        List[str]: 추출된 게시글 URL 리스트.
+    """
+    tree = LexborHTMLParser(html)
+    urls = []
+    for row in tree.css("tr.table_body.blocktarget"):
+        title_element = row.css_first("a.subject_link")
+        if title_element:
+            url = title_element.attributes.get("href")
+            if url and not url.startswith('http'):
+                url = base_url + url
+            urls.append(url)
+    return urls
+
+
+def _image_urls(node) -> List[str]:
+    """노드 안의 img src를 절대 URL로 바꾸어 순서대로 반환합니다."""
+    image_urls = []
+    for img in node.css("img"):
+        img_url = img.attributes.get("src")
+        if img_url and not img_url.startswith('http'):
+            img_url = "https://" + img_url.lstrip('/')
+        image_urls.append(img_url)
+    return image_urls
+
+
+def parse_content_html(content_html: str) -> Tuple[str, List[str]]:
+    """게시글 본문(`.view_content` 요소)의 inner HTML에서 본문 텍스트와 이미지 URL을 추출합니다.
+
+    Args:
+        content_html (str): 본문 요소의 inner HTML.
+
+    Returns:
+        Tuple[str, List[str]]: (본문 텍스트, 이미지 URL 리스트).
+    """
+    body = LexborHTMLParser(content_html).body
+    if body is None:
+        return "", []
+    image_urls = _image_urls(body)
+    return _inner_text(body).strip(), image_urls
+
+
+def parse_comment_html(comment_html: str, reference: Optional[datetime] = None) -> Comment:
+    """댓글 요소의 inner HTML에서 Comment 객체를 만듭니다.
+
+    Args:
+        comment_html (str): `.comment_element.normal` 요소의 inner HTML.
+        reference (Optional[datetime]): 작성일에 날짜가 생략된 경우(예: "14:30") 사용할 기준 시각 (기본값: 현재 시각).
+
+    Returns:
+        Comment: 텍스트와 작성일이 채워진 Comment 객체.
+    """
+    tree = LexborHTMLParser(comment_html)
+    comment_created_element = tree.css_first(".comment_info .date")
+    comment_created = normalize_datetime(comment_created_element.text(deep=True), reference) if comment_created_element else None
+    text_element = tree.css_first("p.text")
+    comment_text = _inner_text(text_element) if text_element else ""
+    return Comment(html=comment_html, text=comment_text, comment_created=comment_created)
+
+
+def _comment_count(tree: LexborHTMLParser) -> Optional[int]:
+    """페이지에 표시된 전체 댓글 수를 반환합니다. 표시 요소가 없거나 숫자가 아니면 None."""
+    element = tree.css_first(COMMENT_COUNT_SELECTOR)
+    if element is None:
+        return None
+    match = _DIGITS_PATTERN.search(element.text(deep=True).replace(",", ""))
+    return int(match.group()) if match else None
+
+
+def parse_post_details(html: str, url: str, metrics: Metrics = NULL_METRICS) -> Tuple[Post, List[Comment]]:
+    """게시글 HTML에서 게시글 상세 내용과 댓글을 추출합니다.
+
+    Args:
+        html (str): 게시글 페이지의 HTML.
+        url (str): 게시글 URL.
+        metrics (Metrics): 이미지/댓글 추출 시간과 건수를 기록할 Metrics.
+
+    Returns:
+        Tuple[Post, List[Comment]]: 추출된 Post 객체와 Comment 객체 리스트.
+
+    Raises:
+        JavaScriptRequiredError: 제목이나 본문 요소가 정적 HTML에 없거나,
+            정적 HTML의 댓글 수가 페이지에 표시된 전체 댓글 수보다 적은 경우 (스크롤 시 로드되는 댓글).
+    """
+    tree = LexborHTMLParser(html)
+    title_element = tree.css_first(".subject_inner_text")
+    content_element = tree.css_first(".view_content")
+    if title_element is None or content_element is None:
+        raise JavaScriptRequiredError(url)
+
+    title = title_element.text(deep=True)
+    post_created_element = tree.css_first(".regdate")
+    post_created = post_created_element.text(deep=True).strip() if post_created_element else None
+    if post_created:
+        post_created = RuliwebScraper.convert_date_format(post_created)
+
+    # 이미지 URL을 추출합니다.
+    with metrics.time("scrape_stage_seconds", backend="http", stage="images"):
+        image_urls = _image_urls(content_element)
+
+    # 댓글을 추출합니다.
+    comments = []
+    with metrics.time("scrape_stage_seconds", backend="http", stage="comments"):
+        for comment in tree.css(".comment_view.normal .comment_element.normal"):
+            comment_html = comment.inner_html.replace('\n', '').replace('\t', '').strip()
+            comments.append(parse_comment_html(comment_html))
+    expected = _comment_count(tree)
+    if expected is not None and len(comments) < expected:
+        # 나머지 댓글은 브라우저에서 스크롤해야 로드되므로 일부만 저장하지 않고 대체 스크래퍼로 넘깁니다.
+        metrics.inc("incomplete_comment_threads_total", backend="http")
+        raise JavaScriptRequiredError(url)
+    metrics.inc("images_extracted_total", len(image_urls), backend="http")
+    metrics.inc("comments_extracted_total", len(comments), backend="http")
+
+    content_html = content_element.inner_html
+    content = _inner_text(content_element)
+    post = Post(title=title.strip(), url=url, content=content.strip(), content_html=content_html, image_urls=image_urls, post_created=post_created)
+    return post, comments
+
+
+class RuliwebHttpScraper:
+    """브라우저 없이 HTTP 요청과 HTML 파서만으로 Ruliweb 게시글을 스크랩하는 클래스
+
+    RuliwebScraper와 같은 인터페이스(get_post_urls, get_post_details)를 제공합니다.
+    """
+    BASE_URL = RuliwebScraper.BASE_URL
+
+    def __init__(self, max_connections: int = 10, timeout: float = 30.0, base_url: str = BASE_URL,
+                 metrics: Metrics = NULL_METRICS, cache: Optional[PageCache] = None, replay: bool = False):
+        """RuliwebHttpScraper를 초기화합니다.
+
+        Args:
+            max_connections (int): 커넥션 풀의 최대 연결 수.
+            timeout (float): 요청 타임아웃(초).
+            base_url (str): 상대 경로 링크에 붙일 기본 URL.
+            metrics (Metrics): 단계별 처리 시간(scrape_stage_seconds)과 추출 건수를 기록할 Metrics.
+            cache (Optional[PageCache]): 게시글 페이지 캐시. 있으면 ttl 안에 가져온 페이지는 네트워크 대신 캐시에서 읽고,
+                새로 가져온 페이지는 캐시에 저장합니다.
+            replay (bool): 재생 모드 여부. True이면 네트워크를 사용하지 않고 캐시된 페이지만 ttl과 관계없이 읽으며,
+                캐시에 없는 게시글은 PageCacheMissError를 발생시킵니다.
+        """
+        if replay and cache is None:
+            raise ValueError("재생 모드에는 페이지 캐시가 필요합니다.")
+        self.max_connections = max_connections
+        self.timeout = timeout
+        self.base_url = base_url
+        self.metrics = metrics
+        self.cache = cache
+        self.replay = replay
+        self.client: Optional[httpx.AsyncClient] = None
+
+    async def __aenter__(self):
+        """비동기 컨텍스트 매니저 진입 시 커넥션 풀을 가진 HTTP 클라이언트를 생성합니다."""
+        limits = httpx.Limits(max_connections=self.max_connections, max_keepalive_connections=self.max_connections)
+        self.client = httpx.AsyncClient(
+            headers={"User-Agent": MOBILE_USER_AGENT},
+            limits=limits,
+            timeout=self.timeout,
+            follow_redirects=True,
+        )
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """비동기 컨텍스트 매니저 종료 시 HTTP 클라이언트를 닫습니다."""
+        if self.client:
+            await self.client.aclose()
+
+    async def _fetch(self, url: str) -> str:
+        """URL의 HTML을 가져옵니다."""
+        response = await self.client.get(url)
+        if response.status_code >= 400:
+            raise ScraperHTTPError(url, response.status_code)
+        return response.text
+
+    async def get_post_urls(self, board_url: str) -> List[str]:
+        """주어진 게시판 URL에서 게시글 URL 목록을 스크랩합니다.
+
+        Args:
+            board_url (str): 게시글 URL을 수집할 게시판의 URL.
+
+        Returns:
+            List[str]: 수집된 게시글 URL 문자열 리스트.
+        """
+        try:
+            with self.metrics.time("scrape_stage_seconds", backend="http", stage="board"):
+                html = await self._fetch(board_url)
+        except (httpx.HTTPError, ScraperHTTPError):
+            return []
+        return parse_post_urls(html, self.base_url)
+
+    async def get_post_details(self, url: str) -> Tuple[Post, List[Comment]]:
+        """주어진 게시글 URL에서 게시글의 상세 내용과 댓글을 스크랩합니다.
+
+        Args:
+            url (str): 상세 내용을 스크랩할 게시글의 URL.
+
+        Returns:
+            Tuple[Post, List[Comment]]: 스크랩된 Post 객체와 Comment 객체 리스트.
+
+        Raises:
+            JavaScriptRequiredError: 정적 HTML로는 내용을 추출할 수 없는 경우.
+            ScraperHTTPError: 게시글 페이지가 오류 상태 코드로 응답한 경우.
+            PageCacheMissError: 재생 모드에서 게시글이 캐시에 없는 경우.
+        """
+        html = None
+        if self.cache is not None:
+            html = self.cache.get(url, ignore_ttl=self.replay)
+            self.metrics.inc("page_cache_requests_total", result="miss" if html is None else "hit")
+        if html is None:
+            if self.replay:
+                raise PageCacheMissError(url)
+            with self.metrics.time("scrape_stage_seconds", backend="http", stage="fetch"):
+                html = await self._fetch(url)
+            if self.cache is not None:
+                self.cache.put(url, html)
+        with self.metrics.time("scrape_stage_seconds", backend="http", stage="parse"):
+            return parse_post_details(html, url, self.metrics)
+
+
+class FallbackScraper:
+    """HTTP 스크래퍼를 우선 사용하고, JavaScript가 필요한 페이지만 Playwright 스크래퍼로 처리하는 클래스
+
+    Playwright 브라우저는 처음으로 필요해지는 시점에만 실행됩니다.
+    """
+    def __init__(self, primary: RuliwebHttpScraper, fallback_factory: Callable[[], RuliwebScraper]):
+        """FallbackScraper를 초기화합니다.
+
+        Args:
+            primary (RuliwebHttpScraper): 우선 사용할 HTTP 스크래퍼.
+            fallback_factory (Callable[[], RuliwebScraper]): 대체 스크래퍼를 생성하는 함수.
+        """
+        self.primary = primary
+        self.fallback_factory = fallback_factory
+        self.fallback: Optional[RuliwebScraper] = None
+        self._fallback_lock = None
+
+    async def __aenter__(self):
+        """비동기 컨텍스트 매니저 진입 시 HTTP 스크래퍼만 시작합니다."""
+        self._fallback_lock = asyncio.Lock()
+        await self.primary.__aenter__()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """비동기 컨텍스트 매니저 종료 시 사용된 스크래퍼를 모두 종료합니다."""
+        try:
+            if self.fallback:
+                await self.fallback.__aexit__(exc_type, exc_val, exc_tb)
+        finally:
+            await self.primary.__aexit__(exc_type, exc_val, exc_tb)
+
+    async def _get_fallback(self) -> RuliwebScraper:
+        """대체 스크래퍼를 필요할 때 한 번만 시작합니다."""
+        async with self._fallback_lock:
+            if self.fallback is None:
+                fallback = self.fallback_factory()
+                await fallback.__aenter__()
+                self.fallback = fallback
+        return self.fallback
+
+    async def get_post_urls(self, board_url: str) -> List[str]:
+        """게시판 URL에서 게시글 URL 목록을 스크랩합니다. 게시판 목록은 정적 HTML이므로 HTTP 스크래퍼만 사용합니다."""
+        return await self.primary.get_post_urls(board_url)
+
+    async def get_post_details(self, url: str) -> Tuple[Post, List[Comment]]:
+        """게시글의 상세 내용을 스크랩합니다. JavaScript가 필요한 페이지는 브라우저로 처리합니다."""
+        try:
+            return await self.primary.get_post_details(url)
+        except JavaScriptRequiredError:
+            self.primary.metrics.inc("browser_fallbacks_total")
+            fallback = await self._get_fallback()
+            return await fallback.get_post_details(url)
@@ -0,0 +1,171 @@
+import hashlib
+import os
+import re
+import threading
+from typing import Dict, List, Optional
+
+from .constants import MOBILE_USER_AGENT
+from .database import DatabaseManager
+from .scraper import ScraperHTTPError
+
+DEFAULT_MAX_BYTES = 1024 * 1024 * 1024 # 이미지 저장소의 기본 최대 크기 (1GB)
+EVICT_BATCH_SIZE = 64 # 한 번에 색인에서 꺼내 삭제할 이미지 수
+
+# content_html의 <img src="..."> 속성
+_IMG_SRC_PATTERN = re.compile(r'(<img\b[^>]*?\bsrc\s*=\s*)(["\'])(.*?)\2', re.IGNORECASE | re.DOTALL)
+
+
+def normalize_image_url(src: str) -> str:
+    """img의 src 속성을 스크래퍼가 image_urls에 저장하는 형식의 절대 URL로 변환합니다."""
+    if src and not src.startswith('http'):
+        return "https://" + src.lstrip('/')
+    return src
+
+
+class ImageStore:
+    """이미지를 내용 해시(SHA-256)를 이름으로 디스크에 저장하는 저장소
+
+    같은 이미지가 여러 게시글(또는 여러 URL)에 올라와도 파일은 하나만 저장되며,
+    URL→해시 매핑과 파일 정보는 데이터베이스의 image_sources/image_files 테이블에 기록됩니다.
+    전체 크기가 max_bytes를 넘으면 가장 오래 조회되지 않은 이미지부터 삭제합니다 (LRU).
+    """
+    def __init__(self, root_dir: str, db_manager: DatabaseManager, max_bytes: int = DEFAULT_MAX_BYTES):
+        """ImageStore를 초기화합니다.
+
+        Args:
+            root_dir (str): 이미지 파일을 저장할 디렉토리.
+            db_manager (DatabaseManager): URL→해시 매핑을 기록할 데이터베이스.
+            max_bytes (int): 저장소의 최대 크기(바이트).
+        """
+        self.root_dir = root_dir
+        self.db_manager = db_manager
+        self.max_bytes = max_bytes
+        self._total_bytes: Optional[int] = None
+        self._lock = threading.Lock()
+
+    def path_for(self, image_hash: str) -> str:
+        """해시에 해당하는 이미지 파일 경로를 반환합니다. 디렉토리 하나에 파일이 몰리지 않도록 앞 두 글자로 나눕니다."""
+        return os.path.join(self.root_dir, image_hash[:2], image_hash)
+
+    def missing(self, urls: List[str]) -> List[str]:
+        """아직 저장되지 않은 이미지 URL만 순서를 유지하여 반환합니다."""
+        known = self.db_manager.get_image_hashes(urls)
+        return [url for url in dict.fromkeys(urls) if url and url not in known]
+
+    def put(self, url: str, data: bytes) -> str:
+        """다운로드한 이미지를 저장하고 해시를 반환합니다. 같은 내용의 파일이 있으면 매핑만 기록합니다.
+
+        Args:
+            url (str): 이미지 URL.
+            data (bytes): 이미지 내용.
+
+        Returns:
+            str: 이미지 내용의 해시.
+        """
+        image_hash = hashlib.sha256(data).hexdigest()
+        path = self.path_for(image_hash)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            # 중단되더라도 완성되지 않은 파일이 남지 않도록 임시 파일에 쓴 뒤 이름을 바꿉니다.
+            temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(temp_path, 'wb') as f:
+                f.write(data)
+            os.replace(temp_path, path)
+
+        if self.db_manager.record_image(url, image_hash, len(data)):
+            with self._lock:
+                if self._total_bytes is None:
+                    self._total_bytes = self.db_manager.get_image_store_size() # 방금 기록한 이미지 포함
+                else:
+                    self._total_bytes += len(data)
+                self._evict()
+        return image_hash
+
+    def _evict(self):
+        """저장소 크기가 max_bytes 이하가 될 때까지 가장 오래 조회되지 않은 이미지를 삭제합니다."""
+        while self._total_bytes > self.max_bytes:
+            candidates = self.db_manager.get_least_recent_images(EVICT_BATCH_SIZE)
+            if not candidates:
+                break
+            evicted = []
+            for image_hash, size in candidates:
+                if self._total_bytes <= self.max_bytes:
+                    break
+                evicted.append(image_hash)
+                self._total_bytes -= size
+            # 색인에서 먼저 지워, 파일 삭제 도중 중단되더라도 색인이 없는 파일을 가리키지 않게 합니다.
+            self.db_manager.delete_images(evicted)
+            for image_hash in evicted:
+                try:
+                    os.remove(self.path_for(image_hash))
+                except FileNotFoundError:
+                    pass
+
+    def local_paths(self, urls: List[str]) -> Dict[str, str]:
+        """저장된 이미지의 URL→로컬 파일 경로 매핑을 반환하고, 조회 시각을 갱신합니다."""
+        hashes = self.db_manager.get_image_hashes(urls)
+        paths = {url: self.path_for(image_hash) for url, image_hash in hashes.items()
+                 if os.path.exists(self.path_for(image_hash))}
+        if paths:
+            self.db_manager.touch_images([hashes[url] for url in paths])
+        return paths
+
+    def localize_html(self, html: Optional[str]) -> Optional[str]:
+        """HTML의 img src를 저장된 로컬 파일 경로로 바꿉니다. 저장되지 않은 이미지는 그대로 둡니다."""
+        if not html:
+            return html
+        sources = [normalize_image_url(match.group(3)) for match in _IMG_SRC_PATTERN.finditer(html)]
+        if not sources:
+            return html
+        paths = self.local_paths(sources)
+
+        def replace(match):
+            path = paths.get(normalize_image_url(match.group(3)))
+            if path is None:
+                return match.group(0)
+            return f"{match.group(1)}{match.group(2)}{path}{match.group(2)}"
+
+        return _IMG_SRC_PATTERN.sub(replace, html)
+
+
+class ImageDownloader:
+    """HTTP 커넥션 풀로 이미지를 다운로드하는 클래스"""
+    def __init__(self, max_connections: int = 4, timeout: float = 30.0):
+        """ImageDownloader를 초기화합니다.
+
+        Args:
+            max_connections (int): 커넥션 풀의 최대 연결 수.
+            timeout (float): 요청 타임아웃(초).
+        """
+        self.max_connections = max_connections
+        self.timeout = timeout
+        self.client = None
+
+    async def __aenter__(self):
+        """비동기 컨텍스트 매니저 진입 시 HTTP 클라이언트를 생성합니다."""
+        # httpx는 이미지 다운로드를 사용할 때만 필요하므로 여기서 임포트합니다.
+        import httpx
+        limits = httpx.Limits(max_connections=self.max_connections, max_keepalive_connections=self.max_connections)
+        self.client = httpx.AsyncClient(
+            headers={"User-Agent": MOBILE_USER_AGENT, "Referer": "https://m.ruliweb.com/"},
+            limits=limits,
+            timeout=self.timeout,
+            follow_redirects=True,
+        )
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """비동기 컨텍스트 매니저 종료 시 HTTP 클라이언트를 닫습니다."""
+        if self.client:
+            await self.client.aclose()
+
+    async def fetch(self, url: str) -> bytes:
+        """이미지를 다운로드합니다.
+
+        Raises:
+            ScraperHTTPError: 오류 상태 코드로 응답한 경우.
+        """
+        response = await self.client.get(url)
+        if response.status_code >= 400:
+            raise ScraperHTTPError(url, response.status_code)
+        return response.content
@@ -0,0 +1,227 @@
+import json
+import threading
+import time
+from bisect import bisect_left
+from typing import Callable, Dict, Optional, Tuple
+
+# 처리 시간 히스토그램의 기본 구간 상한(초)
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+METRIC_PREFIX = "ruli_crawler_" # Prometheus 형식으로 내보낼 때 지표 이름 앞에 붙는 접두사
+
+_LabelKey = Tuple[Tuple[str, str], ...]
+
+
+def _label_key(labels: Dict[str, object]) -> _LabelKey:
+    return tuple(sorted((name, str(value)) for name, value in labels.items()))
+
+
+def _format_labels(key: _LabelKey, extra: Optional[Tuple[str, str]] = None) -> str:
+    pairs = list(key) + ([extra] if extra else [])
+    if not pairs:
+        return ""
+    escaped = (value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") for _, value in pairs)
+    return "{" + ",".join(f'{name}="{value}"' for (name, _), value in zip(pairs, escaped)) + "}"
+
+
+class Histogram:
+    """값의 분포를 고정된 구간별 개수로 기록하는 히스토그램 (Prometheus histogram과 같은 형식)"""
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1) # 마지막 칸은 +Inf 구간
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def quantile(self, fraction: float) -> Optional[float]:
+        """값이 속한 구간의 상한으로 백분위수를 추정합니다. 마지막 구간이면 가장 큰 상한을 반환합니다."""
+        if not self.count:
+            return None
+        rank = fraction * self.count
+        cumulative = 0
+        for bound, count in zip(self.buckets, self.counts):
+            cumulative += count
+            if cumulative >= rank:
+                return bound
+        return self.buckets[-1]
+
+
+class _Timer:
+    """with 블록의 실행 시간을 히스토그램에 기록합니다."""
+    __slots__ = ("metrics", "name", "labels", "started")
+
+    def __init__(self, metrics: "Metrics", name: str, labels: Dict[str, object]):
+        self.metrics = metrics
+        self.name = name
+        self.labels = labels
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.metrics.observe(self.name, time.perf_counter() - self.started, **self.labels)
+        return False
+
+
+class _NullTimer:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        return False
+
+
+_NULL_TIMER = _NullTimer()
+
+
+class Metrics:
+    """카운터, 게이지, 처리 시간 히스토그램을 모아 두는 클래스
+
+    크롤링 단계별 처리 시간과 처리량, 동시 실행 수, 큐 길이를 기록하며,
+    to_prometheus()로 Prometheus 텍스트 형식, snapshot()/to_json()으로 JSON 형식으로 내보냅니다.
+    여러 스레드(UI, 내보내기 서버)에서 읽을 수 있도록 잠금으로 보호합니다.
+    """
+    enabled = True
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        """Metrics를 초기화합니다.
+
+        Args:
+            buckets (Tuple[float, ...]): 히스토그램 구간 상한(초).
+        """
+        self.buckets = buckets
+        self._counters: Dict[str, Dict[_LabelKey, float]] = {}
+        self._gauges: Dict[str, Dict[_LabelKey, float]] = {}
+        self._gauge_callbacks: Dict[str, Dict[_LabelKey, Callable[[], float]]] = {}
+        self._histograms: Dict[str, Dict[_LabelKey, Histogram]] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, name: str, value: float = 1, **labels):
+        """카운터를 value만큼 늘립니다."""
+        key = _label_key(labels)
+        with self._lock:
+            series = self._counters.setdefault(name, {})
+            series[key] = series.get(key, 0) + value
+
+    def set_gauge(self, name: str, value: float, **labels):
+        """게이지 값을 설정합니다."""
+        with self._lock:
+            self._gauges.setdefault(name, {})[_label_key(labels)] = value
+
+    def add_gauge(self, name: str, delta: float, **labels):
+        """게이지 값을 delta만큼 바꿉니다 (진행 중인 작업 수 등)."""
+        key = _label_key(labels)
+        with self._lock:
+            series = self._gauges.setdefault(name, {})
+            series[key] = series.get(key, 0) + delta
+
+    def gauge_callback(self, name: str, callback: Callable[[], float], **labels):
+        """내보낼 때마다 callback을 호출하여 값을 읽는 게이지를 등록합니다 (큐 길이 등)."""
+        with self._lock:
+            self._gauge_callbacks.setdefault(name, {})[_label_key(labels)] = callback
+
+    def observe(self, name: str, value: float, **labels):
+        """히스토그램에 값을 기록합니다."""
+        key = _label_key(labels)
+        with self._lock:
+            series = self._histograms.setdefault(name, {})
+            histogram = series.get(key)
+            if histogram is None:
+                histogram = series[key] = Histogram(self.buckets)
+            histogram.observe(value)
+
+    def time(self, name: str, **labels):
+        """with 블록의 실행 시간(초)을 name 히스토그램에 기록하는 컨텍스트 매니저를 반환합니다.
+
+        async 함수 안에서도 await를 감싸 사용할 수 있습니다.
+        """
+        return _Timer(self, name, labels)
+
+    def _gauge_values(self) -> Dict[str, Dict[_LabelKey, float]]:
+        gauges = {name: dict(series) for name, series in self._gauges.items()}
+        for name, callbacks in self._gauge_callbacks.items():
+            for key, callback in callbacks.items():
+                gauges.setdefault(name, {})[key] = callback()
+        return gauges
+
+    def snapshot(self) -> dict:
+        """현재 값을 JSON으로 변환할 수 있는 dict로 반환합니다. 레이블은 "이름{키=값,...}" 형식의 키로 표시합니다."""
+        def series_name(name, key):
+            return name + (("{" + ",".join(f"{k}={v}" for k, v in key) + "}") if key else "")
+
+        with self._lock:
+            gauges = self._gauge_values()
+            return {
+                "counters": {series_name(name, key): value
+                             for name, series in self._counters.items() for key, value in series.items()},
+                "gauges": {series_name(name, key): value
+                           for name, series in gauges.items() for key, value in series.items()},
+                "histograms": {
+                    series_name(name, key): {
+                        "count": histogram.count,
+                        "sum": round(histogram.sum, 6),
+                        "mean": round(histogram.sum / histogram.count, 6) if histogram.count else None,
+                        "p50": histogram.quantile(0.5),
+                        "p99": histogram.quantile(0.99),
+                    }
+                    for name, series in self._histograms.items() for key, histogram in series.items()
+                },
+            }
+
+    def to_json(self) -> str:
+        """snapshot()을 JSON 문자열로 반환합니다."""
+        return json.dumps(self.snapshot(), ensure_ascii=False, indent=2)
+
+    def to_prometheus(self) -> str:
+        """Prometheus 텍스트 형식(0.0.4)으로 반환합니다."""
+        lines = []
+        with self._lock:
+            for name, series in sorted(self._counters.items()):
+                lines.append(f"# TYPE {METRIC_PREFIX}{name} counter")
+                lines.extend(f"{METRIC_PREFIX}{name}{_format_labels(key)} {value:g}" for key, value in series.items())
+            for name, series in sorted(self._gauge_values().items()):
+                lines.append(f"# TYPE {METRIC_PREFIX}{name} gauge")
+                lines.extend(f"{METRIC_PREFIX}{name}{_format_labels(key)} {value:g}" for key, value in series.items())
+            for name, series in sorted(self._histograms.items()):
+                lines.append(f"# TYPE {METRIC_PREFIX}{name} histogram")
+                for key, histogram in series.items():
+                    cumulative = 0
+                    for bound, count in zip(histogram.buckets + (float("inf"),), histogram.counts):
+                        cumulative += count
+                        le = "+Inf" if bound == float("inf") else f"{bound:g}"
+                        lines.append(f"{METRIC_PREFIX}{name}_bucket{_format_labels(key, ('le', le))} {cumulative}")
+                    lines.append(f"{METRIC_PREFIX}{name}_sum{_format_labels(key)} {histogram.sum:g}")
+                    lines.append(f"{METRIC_PREFIX}{name}_count{_format_labels(key)} {histogram.count}")
+        return "\n".join(lines) + "\n"
+
+
+class NullMetrics(Metrics):
+    """지표를 기록하지 않는 Metrics. 지표 수집을 끈 경우 사용하며, 모든 기록 메서드는 아무것도 하지 않습니다."""
+    enabled = False
+
+    def inc(self, name: str, value: float = 1, **labels):
+        pass
+
+    def set_gauge(self, name: str, value: float, **labels):
+        pass
+
+    def add_gauge(self, name: str, delta: float, **labels):
+        pass
+
+    def gauge_callback(self, name: str, callback: Callable[[], float], **labels):
+        pass
+
+    def observe(self, name: str, value: float, **labels):
+        pass
+
+    def time(self, name: str, **labels):
+        return _NULL_TIMER
+
+
+NULL_METRICS = NullMetrics() # 지표 수집을 끈 경우 공유해서 사용하는 인스턴스
@@ -8,7 +8,7 @@ class Comment:
     html: str  # 댓글 내용 (HTML 포함)
     text: str  # 댓글 내용
     post_id: Optional[int] = None  # 댓글이 속한 게시글의 ID (외래 키)
-    comment_created: Optional[str] = None # 댓글 생성일
+    comment_created: Optional[str] = None # 댓글 생성일 (YYYY-MM-DD HH:MM:SS)
 
 @dataclass
 class Post:
@@ -18,5 +18,21 @@ class Post:
     content: Optional[str] = None  # 게시글 내용 (텍스트만)
     content_html: Optional[str] = None # 게시글 내용 (HTML 포함)
     image_urls: List[str] = field(default_factory=list)  # 게시글 내 이미지 URL 리스트
-    post_created: Optional[str] = None  # 게시글 생성일
+    post_created: Optional[str] = None  # 게시글 생성일 (YYYY-MM-DD HH:MM:SS)
     comments: List['Comment'] = field(default_factory=list) # 해당 게시글의 댓글 리스트
+    id: Optional[int] = None  # 게시글 ID (데이터베이스 기본 키)
+
+@dataclass
+class PostSummary:
+    """게시글 목록에 표시할 최소한의 정보만 담은 데이터 클래스"""
+    id: int  # 게시글 ID (데이터베이스 기본 키)
+    title: str  # 게시글 제목
+    post_created: Optional[str] = None  # 게시글 생성일 (YYYY-MM-DD HH:MM:SS)
+
+@dataclass
+class CrawlProgress:
+    """크롤링 진행 상황을 나타내는 카운터"""
+    target: int  # 수집할 최대 게시글 수
+    discovered: int = 0  # 수집 대상으로 찾은 게시글 URL 수
+    saved: int = 0  # 스크랩하여 저장한 게시글 수
+    failed: int = 0  # 재시도 후에도 스크랩에 실패한 게시글 수
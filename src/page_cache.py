@@ -0,0 +1,136 @@
+import sqlite3
+import threading
+import time
+from typing import List, Optional
+
+from .html_codec import HtmlCodec
+
+DEFAULT_TTL = 7 * 24 * 3600.0 # 캐시된 페이지를 네트워크 대신 사용할 기본 기간(초)
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024 # 페이지 캐시의 기본 최대 크기 (압축 후 512MB)
+PURGE_INTERVAL = 200 # 이 횟수만큼 저장할 때마다 만료된 페이지를 삭제합니다.
+
+
+class PageCacheMissError(Exception):
+    """재생 모드에서 요청한 페이지가 캐시에 없는 경우 발생하는 예외"""
+    def __init__(self, url: str):
+        super().__init__(f"{url} 페이지가 캐시에 없습니다.")
+        self.url = url
+
+
+class PageCache:
+    """URL별로 가져온 게시글 페이지의 원본 HTML을 압축하여 보관하는 디스크 캐시
+
+    크롤링 데이터베이스와 별도의 SQLite 파일에 URL, 가져온 시각, 압축된 HTML을 저장합니다.
+    ttl보다 오래된 페이지는 읽을 때 없는 것으로 취급하고 주기적으로 삭제하며,
+    전체 크기가 max_bytes를 넘으면 가장 오래전에 가져온 페이지부터 삭제합니다.
+    재생 모드에서는 ttl과 관계없이 저장된 모든 페이지를 읽을 수 있습니다.
+    """
+    def __init__(self, path: str, ttl: float = DEFAULT_TTL, max_bytes: int = DEFAULT_MAX_BYTES):
+        """PageCache를 초기화합니다.
+
+        Args:
+            path (str): 캐시 SQLite 파일 경로.
+            ttl (float): 캐시된 페이지를 네트워크 대신 사용할 기간(초).
+            max_bytes (int): 캐시의 최대 크기(압축 후 바이트).
+        """
+        self.path = path
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.codec = HtmlCodec()
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._total_bytes: Optional[int] = None
+        self._puts = 0
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """현재 스레드의 영속 연결을 반환합니다. 없으면 WAL 모드로 새로 열고 테이블을 만듭니다."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            with conn:
+                conn.execute('''
+                    CREATE TABLE IF NOT EXISTS pages (
+                        url TEXT PRIMARY KEY,
+                        fetched_at REAL NOT NULL,
+                        size INTEGER NOT NULL,
+                        html BLOB NOT NULL
+                    )
+                ''')
+                conn.execute("CREATE INDEX IF NOT EXISTS idx_pages_fetched_at ON pages (fetched_at)")
+            self._local.conn = conn
+        return conn
+
+    def close(self):
+        """현재 스레드의 캐시 연결을 닫습니다."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    def get(self, url: str, ignore_ttl: bool = False) -> Optional[str]:
+        """캐시된 HTML을 반환합니다. 없거나 ttl이 지났으면 None.
+
+        Args:
+            url (str): 페이지 URL.
+            ignore_ttl (bool): True이면 ttl이 지난 페이지도 반환합니다 (재생 모드).
+        """
+        row = self._get_connection().execute("SELECT fetched_at, html FROM pages WHERE url = ?", (url,)).fetchone()
+        if row is None or (not ignore_ttl and row[0] < time.time() - self.ttl):
+            return None
+        return self.codec.decompress(row[1])
+
+    def put(self, url: str, html: str):
+        """HTML을 압축하여 현재 시각과 함께 저장하고, 필요하면 오래된 페이지를 삭제합니다."""
+        data = self.codec.compress(html)
+        conn = self._get_connection()
+        with conn:
+            previous = conn.execute("SELECT size FROM pages WHERE url = ?", (url,)).fetchone()
+            conn.execute("INSERT OR REPLACE INTO pages (url, fetched_at, size, html) VALUES (?, ?, ?, ?)",
+                         (url, time.time(), len(data), data))
+        with self._lock:
+            if self._total_bytes is None:
+                self._total_bytes = self.size()
+            else:
+                self._total_bytes += len(data) - (previous[0] if previous else 0)
+            self._puts += 1
+            if self._puts % PURGE_INTERVAL == 0:
+                self._purge_expired(conn)
+            self._evict(conn)
+
+    def _purge_expired(self, conn: sqlite3.Connection):
+        """ttl이 지난 페이지를 삭제합니다."""
+        with conn:
+            deleted = conn.execute("SELECT COALESCE(SUM(size), 0) FROM pages WHERE fetched_at < ?",
+                                   (time.time() - self.ttl,)).fetchone()[0]
+            conn.execute("DELETE FROM pages WHERE fetched_at < ?", (time.time() - self.ttl,))
+        self._total_bytes -= deleted
+
+    def _evict(self, conn: sqlite3.Connection):
+        """캐시 크기가 max_bytes 이하가 될 때까지 가장 오래전에 가져온 페이지를 삭제합니다."""
+        while self._total_bytes > self.max_bytes:
+            rows = conn.execute("SELECT url, size FROM pages ORDER BY fetched_at LIMIT 64").fetchall()
+            if not rows:
+                break
+            evicted = []
+            for url, size in rows:
+                if self._total_bytes <= self.max_bytes:
+                    break
+                evicted.append((url,))
+                self._total_bytes -= size
+            with conn:
+                conn.executemany("DELETE FROM pages WHERE url = ?", evicted)
+
+    def urls(self, limit: Optional[int] = None) -> List[str]:
+        """캐시된 페이지 URL을 최근에 가져온 순서로 반환합니다."""
+        query = "SELECT url FROM pages ORDER BY fetched_at DESC"
+        params = ()
+        if limit is not None:
+            query += " LIMIT ?"
+            params = (limit,)
+        return [row[0] for row in self._get_connection().execute(query, params)]
+
+    def size(self) -> int:
+        """캐시에 저장된 HTML의 전체 크기(압축 후 바이트)를 반환합니다."""
+        return self._get_connection().execute("SELECT COALESCE(SUM(size), 0) FROM pages").fetchone()[0]
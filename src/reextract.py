@@ -0,0 +1,255 @@
+"""저장된 HTML에서 파생 컬럼(게시글 본문/이미지 URL, 댓글 텍스트/작성일)을 다시 추출하는 일괄 작업
+
+    python -m src.reextract --db ruliweb_posts.db --dry-run
+
+Playwright 백엔드로 수집한 행의 텍스트는 브라우저의 innerText로 만들어졌으므로, selectolax로 다시 추출하면
+대부분의 행에서 공백과 줄바꿈이 달라집니다. 이런 차이는 변경으로 보지 않도록 공백을 정규화한 값끼리 비교하며,
+정규화한 값이 다른 행만 미리 보기에 표시하고 갱신합니다. 그래도 Playwright로 수집한 행은 블록 요소 사이에
+공백이 없어 단어가 붙는 경우 등 일부가 바뀐 것으로 표시될 수 있습니다.
+"""
+import argparse
+import difflib
+import json
+import os
+import re
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from .database import DatabaseManager
+from .date_utils import DATETIME_FORMAT, normalize_datetime
+from .html_codec import HtmlCodec
+from .http_scraper import parse_comment_html, parse_content_html
+from .view import ConsoleView
+
+REEXTRACT_CHUNK_SIZE = 1000 # 작업자 프로세스에 한 번에 보내고 한 트랜잭션으로 갱신할 행 수
+DIFF_LIMIT = 20 # 미리 보기(dry run)에서 출력할 최대 변경 행 수
+DIFF_CONTEXT_CHARS = 200 # 미리 보기에서 변경된 텍스트를 출력할 최대 길이
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+
+# 작업자 프로세스마다 한 번 만드는 HtmlCodec (압축 사전은 프로세스 시작 시 전달받습니다)
+_codec: Optional[HtmlCodec] = None
+
+
+def _init_worker(dictionaries: Dict[int, bytes]):
+    """작업자 프로세스의 초기화 함수입니다."""
+    global _codec
+    _codec = HtmlCodec(dictionaries)
+
+
+def _same_text(old: Optional[str], new: Optional[str]) -> bool:
+    """공백과 줄바꿈의 차이를 무시하고 두 텍스트가 같은지 비교합니다 (innerText와 selectolax 추출 결과의 차이)."""
+    return _WHITESPACE_PATTERN.sub(" ", old or "").strip() == _WHITESPACE_PATTERN.sub(" ", new or "").strip()
+
+
+def extract_post_changes(rows: List[tuple]) -> Tuple[int, List[tuple]]:
+    """저장된 게시글 HTML에서 본문 텍스트와 이미지 URL을 다시 추출하고, 값이 바뀐 게시글만 반환합니다.
+
+    Args:
+        rows (List[tuple]): DatabaseManager.iter_post_html이 생성한 (id, title, content, content_html, image_urls) 행.
+
+    Returns:
+        Tuple[int, List[tuple]]: (처리한 행 수, (id, title, 이전 본문, 새 본문, 이전 이미지 URL, 새 이미지 URL) 리스트).
+    """
+    changes = []
+    for post_id, title, content, content_html, image_urls_json in rows:
+        html = _codec.decompress(content_html)
+        if not html:
+            continue
+        new_content, new_image_urls = parse_content_html(html)
+        image_urls = json.loads(image_urls_json) if image_urls_json else []
+        if _same_text(content, new_content):
+            new_content = content # 공백만 다르면 저장된 본문을 유지합니다.
+        if new_content != content or new_image_urls != image_urls:
+            changes.append((post_id, title, content, new_content, image_urls, new_image_urls))
+    return len(rows), changes
+
+
+def extract_comment_changes(rows: List[tuple]) -> Tuple[int, List[tuple]]:
+    """저장된 댓글 HTML에서 텍스트와 작성일을 다시 추출하고, 값이 바뀐 댓글만 반환합니다.
+
+    Args:
+        rows (List[tuple]): DatabaseManager.iter_comment_html이 생성한 (id, html, text, comment_created) 행.
+
+    Returns:
+        Tuple[int, List[tuple]]: (처리한 행 수, (id, 이전 텍스트, 새 텍스트, 이전 작성일, 새 작성일) 리스트).
+    """
+    changes = []
+    for comment_id, comment_html, text, comment_created in rows:
+        html = _codec.decompress(comment_html)
+        if not html:
+            continue
+        # 시간만 표시된 작성일(오늘 작성된 댓글)은 크롤링한 날짜가 기준이므로 저장된 작성일의 날짜를 사용합니다.
+        # 저장된 작성일이 정규화되지 않은 이전 형식일 수 있으므로 정규화한 뒤 해석하고, 해석할 수 없으면 현재 시각을 기준으로 합니다.
+        stored_created = normalize_datetime(comment_created)
+        reference = datetime.strptime(stored_created, DATETIME_FORMAT) if stored_created else None
+        comment = parse_comment_html(html, reference)
+        # HTML에서 작성일을 찾지 못하면 저장된 작성일을 그대로 둡니다.
+        new_created = comment.comment_created or comment_created
+        new_text = text if _same_text(text, comment.text) else comment.text
+        if new_text != text or new_created != comment_created:
+            changes.append((comment_id, text, new_text, comment_created, new_created))
+    return len(rows), changes
+
+
+@dataclass
+class ReextractStats:
+    """다시 추출 작업의 결과 통계"""
+    posts: int = 0 # 처리한 게시글 수
+    comments: int = 0 # 처리한 댓글 수
+    changed_posts: int = 0 # 값이 바뀐 게시글 수
+    changed_comments: int = 0 # 값이 바뀐 댓글 수
+    changed_fields: Dict[str, int] = field(default_factory=dict) # 컬럼별 변경 행 수
+    elapsed: float = 0.0 # 걸린 시간(초)
+
+
+class Reextractor:
+    """저장된 HTML에서 파생 컬럼을 다시 추출하여 갱신하는 일괄 작업
+
+    사이트를 다시 크롤링하지 않고 추출 로직의 수정 사항을 기존 데이터에 반영합니다.
+    게시글의 content/image_urls(와 content_hash), 댓글의 text/comment_created(와 fingerprint)를
+    HTTP 백엔드와 같은 파서(parse_content_html, parse_comment_html)로 다시 계산합니다.
+    행은 id 순서로 나누어 읽어 작업자 프로세스에서 파싱하고, 바뀐 행만 묶음마다 한 트랜잭션으로 갱신하므로
+    메모리 사용량은 데이터베이스 크기와 무관합니다. 제목과 게시글 작성일은 저장된 HTML에 없으므로 다시 추출하지 않습니다.
+    """
+    def __init__(self, db_path: str, workers: Optional[int] = None, chunk_size: int = REEXTRACT_CHUNK_SIZE,
+                 dry_run: bool = False, view: Any = None, diff_limit: int = DIFF_LIMIT):
+        """Reextractor를 초기화합니다.
+
+        Args:
+            db_path (str): SQLite 데이터베이스 파일 경로.
+            workers (Optional[int]): 파싱할 작업자 프로세스 수. 없으면 CPU 수, 1이면 현재 프로세스에서 처리합니다.
+            chunk_size (int): 작업자 프로세스에 한 번에 보내고 한 트랜잭션으로 갱신할 행 수.
+            dry_run (bool): True이면 데이터베이스를 바꾸지 않고 바뀔 값의 차이만 출력합니다.
+            view (Any): 진행 상황을 표시할 View 객체. 없으면 ConsoleView를 사용합니다.
+            diff_limit (int): 미리 보기에서 차이를 출력할 최대 행 수.
+        """
+        self.db_manager = DatabaseManager(db_path)
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self.dry_run = dry_run
+        self.view = view if view else ConsoleView()
+        self.diff_limit = diff_limit
+        self._diffs_shown = 0
+
+    def run(self, posts: bool = True, comments: bool = True) -> ReextractStats:
+        """다시 추출 작업을 실행합니다.
+
+        Args:
+            posts (bool): 게시글 본문 텍스트와 이미지 URL을 다시 추출할지 여부.
+            comments (bool): 댓글 텍스트와 작성일을 다시 추출할지 여부.
+
+        Returns:
+            ReextractStats: 처리 결과 통계.
+        """
+        stats = ReextractStats()
+        started = time.perf_counter()
+        dictionaries = self.db_manager.get_html_dictionaries()
+        executor = None
+        if self.workers > 1:
+            executor = ProcessPoolExecutor(self.workers, initializer=_init_worker, initargs=(dictionaries,))
+        else:
+            _init_worker(dictionaries)
+        try:
+            if posts:
+                for count, changes in self._map_chunks(executor, extract_post_changes, self.db_manager.iter_post_html(self.chunk_size)):
+                    stats.posts += count
+                    stats.changed_posts += len(changes)
+                    self._record_post_changes(changes, stats)
+                self.view.show_message(f"게시글 {stats.posts}개 중 {stats.changed_posts}개가 바뀌었습니다.")
+            if comments:
+                for count, changes in self._map_chunks(executor, extract_comment_changes, self.db_manager.iter_comment_html(self.chunk_size)):
+                    stats.comments += count
+                    stats.changed_comments += len(changes)
+                    self._record_comment_changes(changes, stats)
+                self.view.show_message(f"댓글 {stats.comments}개 중 {stats.changed_comments}개가 바뀌었습니다.")
+        finally:
+            if executor is not None:
+                executor.shutdown(cancel_futures=True)
+            self.db_manager.close()
+        stats.elapsed = time.perf_counter() - started
+        return stats
+
+    def _map_chunks(self, executor: Optional[ProcessPoolExecutor], func: Callable, chunks: Iterable[List[tuple]]):
+        """행 묶음을 작업자 프로세스에서 처리하고 결과를 읽은 순서대로 생성합니다.
+
+        다음 묶음을 읽기 전에 결과를 기다리도록 처리 중인 묶음 수를 작업자 수의 두 배로 제한합니다.
+        """
+        if executor is None:
+            for chunk in chunks:
+                yield func(chunk)
+            return
+        pending = deque()
+        for chunk in chunks:
+            pending.append(executor.submit(func, chunk))
+            if len(pending) >= self.workers * 2:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+    @staticmethod
+    def _count(stats: ReextractStats, name: str):
+        stats.changed_fields[name] = stats.changed_fields.get(name, 0) + 1
+
+    def _record_post_changes(self, changes: List[tuple], stats: ReextractStats):
+        """바뀐 게시글을 갱신하거나, 미리 보기면 차이를 출력합니다."""
+        for post_id, _, content, new_content, image_urls, new_image_urls in changes:
+            if content != new_content:
+                self._count(stats, "posts.content")
+                self._show_diff(f"게시글 {post_id} content", content, new_content)
+            if image_urls != new_image_urls:
+                self._count(stats, "posts.image_urls")
+                self._show_diff(f"게시글 {post_id} image_urls", "\n".join(image_urls), "\n".join(new_image_urls))
+        if changes and not self.dry_run:
+            self.db_manager.update_extracted_posts(
+                [(post_id, title, new_content, new_image_urls) for post_id, title, _, new_content, _, new_image_urls in changes])
+
+    def _record_comment_changes(self, changes: List[tuple], stats: ReextractStats):
+        """바뀐 댓글을 갱신하거나, 미리 보기면 차이를 출력합니다."""
+        for comment_id, text, new_text, created, new_created in changes:
+            if text != new_text:
+                self._count(stats, "comments.text")
+                self._show_diff(f"댓글 {comment_id} text", text, new_text)
+            if created != new_created:
+                self._count(stats, "comments.comment_created")
+                self._show_diff(f"댓글 {comment_id} comment_created", created, new_created)
+        if changes and not self.dry_run:
+            self.db_manager.update_extracted_comments(
+                [(comment_id, new_text, new_created) for comment_id, _, new_text, _, new_created in changes])
+
+    def _show_diff(self, label: str, old: Optional[str], new: Optional[str]):
+        """미리 보기에서 이전 값과 새 값의 차이를 줄 단위 diff로 출력합니다. diff_limit개까지만 출력합니다."""
+        if not self.dry_run or self._diffs_shown >= self.diff_limit:
+            return
+        self._diffs_shown += 1
+        lines = difflib.unified_diff((old or "").splitlines(), (new or "").splitlines(),
+                                     fromfile=f"{label} (저장된 값)", tofile=f"{label} (다시 추출한 값)", lineterm="", n=1)
+        self.view.show_message("\n".join(line[:DIFF_CONTEXT_CHARS] for line in lines) or f"{label}: 공백만 다릅니다.")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="저장된 HTML에서 게시글 본문/이미지 URL과 댓글 텍스트/작성일을 다시 추출합니다.")
+    parser.add_argument("--db", required=True, help="SQLite 데이터베이스 파일 경로")
+    parser.add_argument("--workers", type=int, default=None, help="작업자 프로세스 수 (기본값: CPU 수)")
+    parser.add_argument("--chunk-size", type=int, default=REEXTRACT_CHUNK_SIZE, help="한 트랜잭션으로 갱신할 행 수")
+    parser.add_argument("--dry-run", action="store_true", help="데이터베이스를 바꾸지 않고 차이만 출력")
+    parser.add_argument("--diff-limit", type=int, default=DIFF_LIMIT, help="미리 보기에서 출력할 최대 변경 행 수")
+    target = parser.add_mutually_exclusive_group()
+    target.add_argument("--posts-only", action="store_true", help="게시글만 다시 추출")
+    target.add_argument("--comments-only", action="store_true", help="댓글만 다시 추출")
+    args = parser.parse_args(argv)
+
+    reextractor = Reextractor(args.db, workers=args.workers, chunk_size=args.chunk_size, dry_run=args.dry_run,
+                              diff_limit=args.diff_limit)
+    stats = reextractor.run(posts=not args.comments_only, comments=not args.posts_only)
+    rate = (stats.posts + stats.comments) / stats.elapsed if stats.elapsed else 0.0
+    print(f"게시글 {stats.posts}개, 댓글 {stats.comments}개를 {stats.elapsed:.1f}초 동안 처리했습니다 ({rate:,.0f}행/초).")
+    for name, count in sorted(stats.changed_fields.items()):
+        print(f"- {name}: {count}행 {'변경 예정' if args.dry_run else '갱신'}")
+
+
+if __name__ == "__main__":
+    main()
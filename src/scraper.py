@@ -1,39 +1,201 @@
 import asyncio
 import re
-from typing import List, Tuple
+from contextlib import asynccontextmanager
+from typing import Iterable, List, Optional, Tuple
+from urllib.parse import urlparse
 
 from playwright.async_api import async_playwright
 
+from .date_utils import normalize_datetime
+from .metrics import NULL_METRICS, Metrics
 from .models import Post, Comment
+from .page_cache import PageCache
+
+
+class ScraperHTTPError(Exception):
+    """페이지가 오류 상태 코드(4xx/5xx)로 응답한 경우 발생하는 예외"""
+    def __init__(self, url: str, status: int):
+        super().__init__(f"{url} 응답 오류: HTTP {status}")
+        self.url = url
+        self.status = status
+
+
+# 게시글 상세 페이지에서 필요한 모든 값을 한 번에 추출하는 스크립트
+# (요소마다 Playwright 호출을 반복하지 않도록 브라우저 안에서 JSON으로 모아 반환합니다)
+EXTRACT_POST_SCRIPT = """
+() => {
+    const title = document.querySelector('.subject_inner_text');
+    const content = document.querySelector('.view_content');
+    const regdate = document.querySelector('.regdate');
+    const comments = Array.from(
+        document.querySelectorAll('.comment_view.normal .comment_element.normal'),
+        (element) => {
+            const text = element.querySelector('p.text');
+            const date = element.querySelector('.comment_info .date');
+            return {
+                html: element.innerHTML,
+                text: text ? text.innerText : '',
+                created: date ? date.innerText : null,
+            };
+        },
+    );
+    const images = content ? Array.from(content.querySelectorAll('img'), (img) => img.getAttribute('src')) : [];
+    return {
+        title: title ? title.innerText : '',
+        content: content ? content.innerText : '',
+        content_html: content ? content.innerHTML : '',
+        post_created: regdate ? regdate.innerText : null,
+        comments: comments,
+        images: images,
+    };
+}
+"""
+
+# 페이지 끝으로 스크롤한 뒤 댓글 목록(.comment_view.normal)의 DOM 변경(지연 로드된 댓글 추가)을 MutationObserver로 기다립니다.
+# quietMs 동안 변경이 없고 문서 높이도 그대로면 모든 댓글이 로드된 것으로 보고 즉시 끝내며,
+# 변경이 계속되더라도(광고, 타이머 등) 한 번의 스크롤에서 maxWaitMs를 넘겨 기다리지 않습니다.
+# 스크롤 횟수는 maxRounds로 제한합니다. 실행한 스크롤 횟수를 반환합니다.
+LOAD_COMMENTS_SCRIPT = """
+async ({maxRounds, quietMs, maxWaitMs}) => {
+    const target = document.querySelector('.comment_view.normal') || document.body;
+    let rounds = 0;
+    while (rounds < maxRounds) {
+        rounds += 1;
+        const lastHeight = document.body.scrollHeight;
+        const mutated = await new Promise((resolve) => {
+            let changed = false;
+            let done = false;
+            let timer = null;
+            const observer = new MutationObserver(() => {
+                // 변경이 이어지는 동안에는 quietMs만큼 더 기다립니다.
+                changed = true;
+                clearTimeout(timer);
+                timer = setTimeout(finish, quietMs);
+            });
+            function finish() {
+                if (done) {
+                    return;
+                }
+                done = true;
+                clearTimeout(timer);
+                clearTimeout(deadline);
+                observer.disconnect();
+                resolve(changed);
+            }
+            // 변경이 끊이지 않아도 maxWaitMs가 지나면 끝냅니다. 이 타이머는 변경이 있어도 다시 설정하지 않습니다.
+            const deadline = setTimeout(finish, maxWaitMs);
+            observer.observe(target, {childList: true, subtree: true});
+            timer = setTimeout(finish, quietMs);
+            window.scrollTo(0, document.body.scrollHeight);
+        });
+        if (!mutated && document.body.scrollHeight === lastHeight) {
+            break;
+        }
+    }
+    return rounds;
+}
+"""
+
+BASE_URL = "https://m.ruliweb.com" # 루리웹 모바일 사이트 주소
+
+# 게시글 스크랩에 필요 없는 리소스 유형 (DOM과 img의 src 속성만 있으면 충분합니다)
+DEFAULT_BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font"})
 
 
 class RuliwebScraper:
     """Playwright를 사용하여 Ruliweb 게시글을 스크랩하는 클래스"""
-    BASE_URL = "https://m.ruliweb.com"
+    BASE_URL = BASE_URL
+    FIRST_PARTY_DOMAIN = "ruliweb.com"
 
-    def __init__(self, headless: bool = False):
+    def __init__(self, headless: bool = False, pool_size: int = 1,
+                 blocked_resource_types: Iterable[str] = DEFAULT_BLOCKED_RESOURCE_TYPES,
+                 block_third_party_scripts: bool = True, comment_wait_ms: int = 400, max_scroll_rounds: int = 20,
+                 comment_max_wait_ms: int = 3000, base_url: str = BASE_URL, metrics: Metrics = NULL_METRICS, cache: Optional[PageCache] = None):
         """RuliwebScraper를 초기화합니다.
 
         Args:
             headless (bool): 브라우저를 헤드리스 모드로 실행할지 여부 (기본값: True).
+            pool_size (int): 재사용할 BrowserContext/Page 수. 동시에 처리할 페이지 수와 맞춥니다.
+            blocked_resource_types (Iterable[str]): 요청을 차단할 Playwright 리소스 유형
+                (예: "image", "media", "font", "stylesheet").
+            block_third_party_scripts (bool): ruliweb.com 이외 도메인의 스크립트(광고 등)를 차단할지 여부.
+            comment_wait_ms (int): 스크롤 후 댓글이 더 로드되는지 기다리는 시간(밀리초).
+                이 시간 동안 DOM 변경이 없으면 댓글 로드가 끝난 것으로 판단합니다.
+            max_scroll_rounds (int): 댓글 로드를 위해 스크롤할 최대 횟수.
+            comment_max_wait_ms (int): 스크롤 한 번에 댓글 로드를 기다리는 최대 시간(밀리초).
+                DOM 변경이 계속되더라도 이 시간이 지나면 다음 스크롤로 넘어갑니다.
+            base_url (str): 상대 경로 링크에 붙일 기본 URL. 벤치마크용 로컬 서버 등 다른 주소를 쓸 때 변경합니다.
+                ruliweb.com이 아닌 주소면 그 호스트의 스크립트를 자사 스크립트로 취급합니다.
+            metrics (Metrics): 단계별 처리 시간(scrape_stage_seconds)과 추출 건수를 기록할 Metrics.
+            cache (Optional[PageCache]): 게시글 페이지 캐시. 있으면 댓글까지 로드된 페이지의 HTML을 저장하여
+                HTTP 백엔드나 재생 모드에서 브라우저 없이 다시 추출할 수 있게 합니다.
         """
         self.headless = headless
+        self.pool_size = pool_size
+        self.blocked_resource_types = frozenset(blocked_resource_types)
+        self.block_third_party_scripts = block_third_party_scripts
+        self.comment_wait_ms = comment_wait_ms
+        self.max_scroll_rounds = max_scroll_rounds
+        self.comment_max_wait_ms = comment_max_wait_ms
+        self.base_url = base_url
+        self.metrics = metrics
+        self.cache = cache
+        host = urlparse(base_url).hostname or ""
+        if host == self.FIRST_PARTY_DOMAIN or host.endswith("." + self.FIRST_PARTY_DOMAIN):
+            self.first_party_domain = self.FIRST_PARTY_DOMAIN
+        else:
+            self.first_party_domain = host
         self.playwright = None
         self.browser = None
+        self._contexts = []
+        self._pages: Optional[asyncio.Queue] = None
 
     async def __aenter__(self):
-        """비동기 컨텍스트 매니저 진입 시 Playwright를 시작하고 브라우저를 실행합니다."""
+        """비동기 컨텍스트 매니저 진입 시 Playwright를 시작하고 브라우저와 페이지 풀을 준비합니다."""
         self.playwright = await async_playwright().start()
         self.browser = await self.playwright.chromium.launch(headless=self.headless)
+        self._pages = asyncio.Queue()
+        for _ in range(self.pool_size):
+            context = await self.browser.new_context()
+            await context.route("**/*", self._handle_route)
+            self._contexts.append(context)
+            self._pages.put_nowait(await context.new_page())
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """비동기 컨텍스트 매니저 종료 시 브라우저와 Playwright를 종료합니다."""
+        for context in self._contexts:
+            await context.close()
+        self._contexts = []
         if self.browser:
             await self.browser.close()
         if self.playwright:
             await self.playwright.stop()
 
+    async def _handle_route(self, route):
+        """설정에 따라 불필요한 리소스 요청을 차단합니다."""
+        request = route.request
+        if request.resource_type in self.blocked_resource_types:
+            await route.abort()
+            return
+        if self.block_third_party_scripts and request.resource_type == "script":
+            host = urlparse(request.url).hostname or ""
+            if host != self.first_party_domain and not host.endswith("." + self.first_party_domain):
+                await route.abort()
+                return
+        await route.continue_()
+
+    @asynccontextmanager
+    async def _page(self):
+        """풀에서 페이지를 빌려 쓰고 돌려놓습니다. 닫힌 페이지는 같은 컨텍스트에서 새로 만듭니다."""
+        page = await self._pages.get()
+        try:
+            if page.is_closed():
+                page = await page.context.new_page()
+            yield page
+        finally:
+            self._pages.put_nowait(page)
+
     async def get_post_urls(self, board_url: str) -> List[str]:
         """주어진 게시판 URL에서 게시글 URL 목록을 스크랩합니다.
 
@@ -43,24 +205,23 @@ class RuliwebScraper:
         Returns:
             List[str]: 수집된 게시글 URL 문자열 리스트.
         """
-        page = await self.browser.new_page()
-        try:
-            await page.goto(board_url)
-            await page.wait_for_selector("tr.table_body.blocktarget", timeout=5000) # 5초 타임아웃
-        except Exception:
-            await page.close()
-            return [] # 선택자를 찾지 못하면 빈 리스트 반환
-
-        posts = await page.query_selector_all("tr.table_body.blocktarget")
-        urls = []
-        for post in posts:
-            title_element = await post.query_selector("a.subject_link")
-            if title_element:
-                url = await title_element.get_attribute("href")
-                if url and not url.startswith('http'):
-                    url = self.BASE_URL + url
-                urls.append(url)
-        await page.close()
+        async with self._page() as page:
+            try:
+                with self.metrics.time("scrape_stage_seconds", backend="playwright", stage="board"):
+                    await page.goto(board_url)
+                    await page.wait_for_selector("tr.table_body.blocktarget", timeout=5000) # 5초 타임아웃
+            except Exception:
+                return [] # 선택자를 찾지 못하면 빈 리스트 반환
+
+            posts = await page.query_selector_all("tr.table_body.blocktarget")
+            urls = []
+            for post in posts:
+                title_element = await post.query_selector("a.subject_link")
+                if title_element:
+                    url = await title_element.get_attribute("href")
+                    if url and not url.startswith('http'):
+                        url = self.base_url + url
+                    urls.append(url)
         return urls
 
     async def get_post_details(self, url: str) -> Tuple[Post, List[Comment]]:
@@ -71,102 +232,88 @@ class RuliwebScraper:
 
         Returns:
             Tuple[Post, List[Comment]]: 스크랩된 Post 객체와 Comment 객체 리스트.
+
+        Raises:
+            ScraperHTTPError: 게시글 페이지가 오류 상태 코드로 응답한 경우.
         """
-        page = await self.browser.new_page()
+        metrics = self.metrics
+        async with self._page() as page:
+            with metrics.time("scrape_stage_seconds", backend="playwright", stage="navigate"):
+                response = await page.goto(url, timeout=60000)  # 페이지 로드 타임아웃을 60초로 늘림
+            if response and response.status >= 400:
+                raise ScraperHTTPError(url, response.status)
+            with metrics.time("scrape_stage_seconds", backend="playwright", stage="wait_selector"):
+                await page.wait_for_selector(".subject_inner_text", timeout=30000)  # 특정 요소가 나타날 때까지 대기
 
-        try:
-            await page.goto(url, timeout=60000)  # 페이지 로드 타임아웃을 60초로 늘림
-            await page.wait_for_selector(".subject_inner_text", timeout=30000)  # 특정 요소가 나타날 때까지 대기
-
-            # 게시글 제목과 내용을 추출합니다.
-            title = await page.locator(".subject_inner_text").inner_text()
-            content_element = page.locator(".view_content")
-            content = await content_element.inner_text()
-            content_html = await content_element.inner_html()
-
-            # 게시글 생성일 추출 (가정: .regdate 클래스를 가진 요소에 날짜 정보가 있음)
-            post_created_element = await page.query_selector(".regdate") # 실제 웹사이트의 선택자에 따라 변경 필요
-            post_created = await post_created_element.inner_text() if post_created_element else None
-            if post_created:
-                print(post_created.strip())
-                post_created = self.convert_date_format(post_created.strip())
-
-            # 댓글을 추출합니다.
-            comments = []
             try:
                 # 페이지 끝까지 스크롤하여 모든 댓글 로드
-                last_height = await page.evaluate("document.body.scrollHeight")
-                while True:
-                    await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-                    await asyncio.sleep(1) # 스크롤 후 로드를 기다림
-                    new_height = await page.evaluate("document.body.scrollHeight")
-                    if new_height == last_height:
-                        break
-                    last_height = new_height
-
-                comments_elements = await page.query_selector_all(".comment_view.normal .comment_element.normal")
-
-                for comment in comments_elements:
-                    # HTML 정제: 모든 공백(탭, 줄바꿈 등)을 하나의 공백으로 변경
-                    raw_html = await comment.inner_html()
-                    # comment_html = re.sub(r'\s+', ' ', raw_html).strip()
-                    comment_html = raw_html.replace('\n', '').replace('\t', '').strip()
-
-                    comment_p_text = await comment.query_selector("p.text")
-                    comment_text = await comment_p_text.inner_text()
-
-                    comment_created_element = await comment.query_selector(".comment_info .date") # 실제 웹사이트의 선택자에 따라 변경 필요
-                    comment_created = await comment_created_element.inner_text() if comment_created_element else None
-                    if comment_created:
-                        comment_created = comment_created.strip()
-
-                    print(Comment(html=comment_html, text=comment_text, comment_created=comment_created))
-
-                    comments.append(Comment(html=comment_html, text=comment_text, comment_created=comment_created))
-
-            except Exception as e:
-                print(f'댓글을 분석중에 오류가 발생하였습니다. {e}')
-                # 댓글이 없거나 로드에 실패하면 무시하고 계속 진행
-                pass
-
-            # 이미지 URL을 추출합니다.
-            images = await page.query_selector_all(".view_content img")
-            image_urls = []
-            if images:
-                for img in images:
-                    img_url = await img.get_attribute("src")
-                    if img_url and not img_url.startswith('http'):
-                        img_url = "https://" + img_url.lstrip('/')
-                    image_urls.append(img_url)
-
-            # Post 객체를 생성하여 반환합니다.
-            post = Post(title=title.strip(), url=url, content=content.strip(), content_html=content_html, image_urls=image_urls, post_created=post_created)
-        finally:
-            await page.close()
+                with metrics.time("scrape_stage_seconds", backend="playwright", stage="scroll"):
+                    rounds = await page.evaluate(LOAD_COMMENTS_SCRIPT, {
+                        "maxRounds": self.max_scroll_rounds,
+                        "quietMs": self.comment_wait_ms,
+                        "maxWaitMs": self.comment_max_wait_ms,
+                    })
+                metrics.inc("scroll_rounds_total", rounds)
+            except Exception:
+                # 댓글 로드에 실패하면 이미 로드된 댓글만 추출합니다. 실패 횟수는 comment_load_errors_total로 집계합니다.
+                metrics.inc("comment_load_errors_total")
+
+            if self.cache is not None:
+                self.cache.put(url, await page.content())
+
+            # 제목, 본문, 날짜, 댓글, 이미지 URL을 한 번의 evaluate 호출로 추출합니다.
+            with metrics.time("scrape_stage_seconds", backend="playwright", stage="extract"):
+                data = await page.evaluate(EXTRACT_POST_SCRIPT)
+
+        with metrics.time("scrape_stage_seconds", backend="playwright", stage="build"):
+            post, comments = self.build_post(url, data)
+        metrics.inc("comments_extracted_total", len(comments), backend="playwright")
+        metrics.inc("images_extracted_total", len(post.image_urls), backend="playwright")
+        return post, comments
 
+    @staticmethod
+    def build_post(url: str, data: dict) -> Tuple[Post, List[Comment]]:
+        """EXTRACT_POST_SCRIPT가 반환한 데이터로 Post와 Comment 객체를 만듭니다.
+
+        Args:
+            url (str): 게시글 URL.
+            data (dict): EXTRACT_POST_SCRIPT의 반환값.
+
+        Returns:
+            Tuple[Post, List[Comment]]: Post 객체와 Comment 객체 리스트.
+        """
+        comments = []
+        for comment in data["comments"]:
+            # HTML 정제: 줄바꿈과 탭 제거
+            comment_html = comment["html"].replace('\n', '').replace('\t', '').strip()
+            comments.append(Comment(html=comment_html, text=comment["text"], comment_created=normalize_datetime(comment["created"])))
+
+        image_urls = []
+        for img_url in data["images"]:
+            if img_url and not img_url.startswith('http'):
+                img_url = "https://" + img_url.lstrip('/')
+            image_urls.append(img_url)
+
+        post_created = data["post_created"]
+        if post_created:
+            post_created = RuliwebScraper.convert_date_format(post_created.strip())
+
+        post = Post(title=data["title"].strip(), url=url, content=data["content"].strip(), content_html=data["content_html"],
+                    image_urls=image_urls, post_created=post_created)
         return post, comments
 
-    # 25.07.23 (14:30:21) 문자열을 2025-07-23 (14:30:21) 으로 변경해주는 함수
+    # 25.07.23 (14:30:21) 문자열을 2025-07-23 14:30:21 으로 변경해주는 함수
     @staticmethod
-    def convert_date_format(date_string: str) -> str:
+    def convert_date_format(date_string: str) -> Optional[str]:
         """날짜 문자열의 형식을 변환합니다.
     
         Args:
-            date_string (str): "DD.MM.YY (HH:MM:SS)" 형식의 날짜 문자열
+            date_string (str): "YY.MM.DD (HH:MM:SS)" 형식의 날짜 문자열
     
         Returns:
-            str: "YYYY-MM-DD (HH:MM:SS)" 형식으로 변환된 날짜 문자열
+            Optional[str]: "YYYY-MM-DD HH:MM:SS" 형식으로 변환된 날짜 문자열. 해석할 수 없으면 None.
         """
-        if not date_string:
-            return None
-
-        date_part, time_part = date_string.split(' ', 1)
-        year, month, day = date_part.split('.')
-
-        # 2자리 연도를 4자리로 변환 (20xx 년대로 가정)
-        full_year = '20' + year
-
-        return f"{full_year}-{month}-{day} {time_part}"
+        return normalize_datetime(date_string)
 
 
 async def main():
@@ -0,0 +1,154 @@
+import asyncio
+import multiprocessing
+import time
+from typing import Any, Dict
+
+from .controller import CrawlerController
+from .database import DatabaseManager
+from .view import ConsoleView
+
+WRITER_QUEUE_SIZE = 64 # 작업자 프로세스에서 저장 프로세스로 보낼 대기 중인 결과 묶음의 최대 개수
+WATCH_INTERVAL = 1.0 # 작업자를 기다리는 동안 저장 프로세스가 살아 있는지 확인하는 간격(초)
+
+
+class ShardView(ConsoleView):
+    """작업자 프로세스의 메시지 앞에 작업자 번호를 붙여 출력하는 View
+
+    게시글/댓글 출력은 저장 프로세스가 진행 상황으로 대신 보여주므로 생략합니다.
+    """
+    def __init__(self, shard: int):
+        self.prefix = f"[작업자 {shard + 1}] "
+
+    def show_message(self, message: str):
+        super().show_message(self.prefix + message)
+
+    def display_post(self, post):
+        pass
+
+    def display_comments(self, comments):
+        pass
+
+
+class ShardWorkerController(CrawlerController):
+    """게시판 페이지 일부를 맡아 크롤링하고 결과를 저장 프로세스로 보내는 Controller
+
+    테이블 준비는 주 프로세스가, 게시글 저장은 저장 프로세스가 담당합니다.
+    """
+    def __init__(self, result_queue: multiprocessing.Queue, **kwargs):
+        super().__init__(**kwargs)
+        self.result_queue = result_queue
+
+    def _prepare_database(self):
+        """주 프로세스가 이미 테이블과 프런티어를 준비했으므로 아무것도 하지 않습니다."""
+
+    async def _persist_batch(self, batch):
+        """결과 묶음을 저장 프로세스로 보냅니다. 큐가 가득 차면 이벤트 루프를 막지 않고 기다립니다."""
+        await asyncio.to_thread(self.result_queue.put, batch)
+
+    def _train_dictionary(self):
+        """압축 사전은 저장 프로세스만 학습하므로 아무것도 하지 않습니다."""
+
+
+def _worker_main(shard: int, result_queue: multiprocessing.Queue, controller_kwargs: Dict[str, Any]):
+    """작업자 프로세스의 시작점입니다. 자신의 스크래퍼로 맡은 게시판 페이지를 크롤링합니다."""
+    # 이전에 실패한 게시글은 첫 번째 작업자만 다시 시도하여 중복 스크랩을 피합니다.
+    controller = ShardWorkerController(result_queue, view=ShardView(shard), retry_failed=shard == 0, **controller_kwargs)
+    asyncio.run(controller.run())
+
+
+def _writer_main(db_path: str, result_queue: multiprocessing.Queue):
+    """저장 프로세스의 시작점입니다. 종료 신호(None)를 받을 때까지 모든 작업자의 결과를 저장합니다.
+
+    한 묶음의 저장에 실패해도 오류를 출력하고 다음 묶음을 계속 받습니다. 저장 프로세스가 멈추면
+    작업자들이 가득 찬 큐에 결과를 넣으려고 끝없이 기다리게 되기 때문입니다.
+    """
+    db_manager = DatabaseManager(db_path)
+    view = ConsoleView()
+    saved = 0
+    started = time.monotonic()
+    while True:
+        batch = result_queue.get()
+        if batch is None:
+            break
+        try:
+            db_manager.insert_posts_with_comments(batch)
+        except Exception as e:
+            view.show_message(f"[저장] 게시글 {len(batch)}개 저장 실패: {type(e).__name__}: {e}")
+            continue
+        saved += len(batch)
+        elapsed = time.monotonic() - started
+        view.show_message(f"[저장] 게시글 {saved}개 저장 ({saved / elapsed:.1f}개/초)")
+    db_manager.train_dictionary_if_needed()
+    db_manager.close()
+    view.show_message(f"[저장] 총 {saved}개의 게시글을 저장했습니다.")
+
+
+def _shard_limits(limit: int, workers: int):
+    """전체 limit을 작업자 수로 나눕니다. 앞의 limit % workers개 작업자가 하나씩 더 맡습니다."""
+    base, extra = divmod(limit, workers)
+    return [base + (1 if shard < extra else 0) for shard in range(workers)]
+
+
+def _wait_for_workers(processes, writer: multiprocessing.Process) -> bool:
+    """작업자 프로세스가 모두 끝날 때까지 기다립니다.
+
+    기다리는 동안 저장 프로세스가 비정상 종료되면 남은 작업자를 종료하고 False를 반환합니다.
+    """
+    for process in processes:
+        while process.is_alive():
+            process.join(WATCH_INTERVAL)
+            if not writer.is_alive():
+                for other in processes:
+                    other.terminate()
+                for other in processes:
+                    other.join()
+                return False
+    return True
+
+
+def run_sharded(workers: int, limit: int, db_path: str, **controller_kwargs):
+    """게시판 페이지를 여러 작업자 프로세스에 나누어 크롤링하고, 하나의 저장 프로세스가 결과를 저장합니다.
+
+    작업자 i(0부터)는 i+1, i+1+workers, i+1+2*workers... 번째 게시판 페이지를 맡으며,
+    각자 자신의 스크래퍼(브라우저 또는 HTTP 클라이언트)와 이벤트 루프를 사용합니다.
+    중단된 크롤링 이어서 하기(resume)는 지원하지 않습니다.
+
+    게시글과 댓글은 저장 프로세스만 저장하지만, 작업자도 자신의 연결로 데이터베이스를 엽니다.
+    프런티어(crawl_queue)와 실패 기록(failed_posts)은 작업자가 직접 쓰고, 증분 크롤링의 저장 여부 확인도 직접 읽습니다.
+    이 쓰기는 작고 드물기 때문에 WAL 모드와 잠금 대기 시간으로 충분합니다.
+
+    Args:
+        workers (int): 작업자 프로세스 수.
+        limit (int): 전체 작업자가 수집할 최대 게시글 수. 작업자마다 limit // workers개(앞의 limit % workers개 작업자는
+            하나 더)를 맡습니다.
+        db_path (str): SQLite 데이터베이스 파일 경로.
+        **controller_kwargs: 각 작업자의 CrawlerController에 전달할 나머지 인자
+            (headless, incremental, backend, concurrency 등).
+    """
+    # 테이블 준비는 작업자를 시작하기 전에 한 번만 합니다.
+    db_manager = DatabaseManager(db_path)
+    # CrawlerController._prepare_database와 같은 기준으로, 이어서 하는 실행이면 기존 데이터를 유지합니다.
+    keep_existing = any(controller_kwargs.get(name, False) for name in ("incremental", "resume", "refresh"))
+    db_manager.create_tables(drop_existing=not keep_existing)
+    if not (controller_kwargs.get("resume", False) or controller_kwargs.get("refresh", False)):
+        db_manager.reset_frontier()
+    db_manager.close()
+
+    result_queue = multiprocessing.Queue(maxsize=WRITER_QUEUE_SIZE)
+    writer = multiprocessing.Process(target=_writer_main, args=(db_path, result_queue), name="ruli-writer")
+    writer.start()
+
+    processes = []
+    for shard, shard_limit in enumerate(_shard_limits(limit, workers)):
+        if shard_limit == 0:
+            continue # 작업자보다 limit이 작으면 남는 작업자는 시작하지 않습니다.
+        kwargs = dict(controller_kwargs, limit=shard_limit, db_path=db_path, page_start=shard + 1, page_step=workers)
+        process = multiprocessing.Process(target=_worker_main, args=(shard, result_queue, kwargs), name=f"ruli-worker-{shard + 1}")
+        process.start()
+        processes.append(process)
+
+    if not _wait_for_workers(processes, writer):
+        raise RuntimeError(f"저장 프로세스가 비정상 종료되었습니다 (종료 코드 {writer.exitcode}). 작업자를 모두 종료했습니다.")
+    # 작업자가 비정상 종료되더라도 저장 프로세스가 끝날 수 있도록 주 프로세스가 종료 신호를 보냅니다.
+    result_queue.put(None)
+    writer.join()
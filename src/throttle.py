@@ -0,0 +1,146 @@
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from typing import Dict
+from urllib.parse import urlparse
+
+
+class TokenBucket:
+    """초당 요청 수를 제한하는 토큰 버킷
+
+    사이트가 429 응답 등으로 과부하를 알리면 slow_down()으로 속도를 절반으로 줄이고,
+    정상 응답이 이어지면 speed_up()으로 최대 속도의 일정 비율씩 회복합니다.
+    동시에 보낸 요청들이 한꺼번에 실패해도 속도는 cooldown 동안 한 번만 줄입니다.
+    """
+    def __init__(self, rate: float, burst: float = 1.0, min_rate: float = 0.2, recovery: float = 0.05,
+                 cooldown: float = 1.0):
+        """TokenBucket을 초기화합니다.
+
+        Args:
+            rate (float): 초당 허용 요청 수의 최대값.
+            burst (float): 한 번에 몰아서 보낼 수 있는 최대 요청 수.
+            min_rate (float): slow_down()으로 줄일 수 있는 최소 초당 요청 수.
+            recovery (float): speed_up() 한 번에 회복할 속도 (최대 속도에 대한 비율).
+                기본값이면 최소 속도에서 20번의 성공으로 최대 속도에 도달합니다.
+            cooldown (float): slow_down()으로 속도를 줄인 뒤 다시 줄이지 않는 기간(초).
+        """
+        self.max_rate = rate
+        self.rate = rate
+        self.min_rate = min(min_rate, rate)
+        self.burst = burst
+        self.recovery = recovery
+        self.cooldown = cooldown
+        self._tokens = burst
+        self._updated_at = time.monotonic()
+        self._slowed_at = None
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        """토큰을 하나 얻을 때까지 기다립니다."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated_at) * self.rate)
+                self._updated_at = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+    def slow_down(self) -> bool:
+        """요청 속도를 절반으로 줄입니다. cooldown 안에 이미 줄였으면 아무것도 하지 않고 False를 반환합니다."""
+        now = time.monotonic()
+        if self._slowed_at is not None and now - self._slowed_at < self.cooldown:
+            return False
+        self._slowed_at = now
+        self.rate = max(self.min_rate, self.rate / 2)
+        return True
+
+    def speed_up(self):
+        """요청 속도를 최대 속도의 recovery 비율만큼 회복합니다."""
+        self.rate = min(self.max_rate, self.rate + self.max_rate * self.recovery)
+
+
+class HostRateLimiter:
+    """호스트마다 별도의 TokenBucket을 두어 요청 속도를 제한하는 클래스"""
+    def __init__(self, requests_per_second: float, burst: float = 1.0):
+        """HostRateLimiter를 초기화합니다.
+
+        Args:
+            requests_per_second (float): 호스트당 초당 최대 요청 수.
+            burst (float): 호스트당 한 번에 몰아서 보낼 수 있는 최대 요청 수.
+        """
+        self.requests_per_second = requests_per_second
+        self.burst = burst
+        self._buckets: Dict[str, TokenBucket] = {}
+
+    def bucket_for(self, url: str) -> TokenBucket:
+        """URL의 호스트에 해당하는 TokenBucket을 반환합니다."""
+        host = urlparse(url).hostname or ""
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            bucket = self._buckets[host] = TokenBucket(self.requests_per_second, self.burst)
+        return bucket
+
+    async def acquire(self, url: str):
+        """URL의 호스트에 요청을 보낼 수 있을 때까지 기다립니다."""
+        await self.bucket_for(url).acquire()
+
+
+class AdaptiveLimiter:
+    """응답 지연과 오류에 따라 동시 실행 수를 조절하는 제한기 (AIMD 방식)
+
+    지연 시간이 latency_target 이하인 성공이 현재 제한 수만큼 쌓이면 제한을 1 늘리고,
+    오류나 타임아웃, 목표의 두 배를 넘는 지연이 발생하면 제한을 절반으로 줄입니다.
+    """
+    def __init__(self, initial: int, min_limit: int = 1, max_limit: int = 20, latency_target: float = 5.0):
+        """AdaptiveLimiter를 초기화합니다.
+
+        Args:
+            initial (int): 처음 허용할 동시 실행 수.
+            min_limit (int): 동시 실행 수의 최소값.
+            max_limit (int): 동시 실행 수의 최대값.
+            latency_target (float): 정상으로 간주하는 작업 한 건의 소요 시간(초).
+        """
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.limit = max(min_limit, min(initial, max_limit))
+        self.latency_target = latency_target
+        self.in_flight = 0
+        self._successes = 0
+        self._condition = asyncio.Condition()
+
+    @asynccontextmanager
+    async def slot(self):
+        """동시 실행 슬롯을 하나 점유합니다."""
+        async with self._condition:
+            await self._condition.wait_for(lambda: self.in_flight < self.limit)
+            self.in_flight += 1
+        try:
+            yield
+        finally:
+            async with self._condition:
+                self.in_flight -= 1
+                self._condition.notify_all()
+
+    async def record_success(self, latency: float):
+        """성공한 작업의 소요 시간을 반영합니다."""
+        if latency > self.latency_target * 2:
+            self._decrease()
+            return
+        if latency <= self.latency_target:
+            self._successes += 1
+            if self._successes >= self.limit:
+                self._successes = 0
+                self.limit = min(self.limit + 1, self.max_limit)
+                # 제한이 늘어났으므로 대기 중인 작업을 깨웁니다.
+                async with self._condition:
+                    self._condition.notify_all()
+
+    def record_failure(self):
+        """오류나 타임아웃을 반영합니다."""
+        self._decrease()
+
+    def _decrease(self):
+        self._successes = 0
+        self.limit = max(self.min_limit, self.limit // 2)
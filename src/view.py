@@ -1,7 +1,7 @@
 
 
 from typing import List, Optional
-from .models import Post, Comment
+from .models import CrawlProgress, Post, Comment
 
 class ConsoleView:
     """콘솔 출력을 담당하는 클래스 (View 역할)"""
@@ -13,6 +13,13 @@ class ConsoleView:
         """
         print(message)
 
+    def update_progress(self, progress: CrawlProgress):
+        """진행 상황 카운터가 바뀌었을 때 호출됩니다. 콘솔에서는 메시지로 진행 상황을 보여주므로 아무것도 하지 않습니다.
+
+        Args:
+            progress (CrawlProgress): 현재 진행 상황의 복사본.
+        """
+
     def display_post(self, post: Post):
         """게시글 정보를 콘솔에 출력합니다.
 